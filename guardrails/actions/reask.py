@@ -225,6 +225,120 @@ def update_response_by_path(output: dict, path: List[Any], value: Any) -> None:
     output[path[-1]] = value
 
 
+def get_response_by_path(output: Any, path: List[Any]) -> Any:
+    """Get an element of the output by path.
+
+    Args:
+        output: The output.
+        path: The path to the element.
+
+    Raises:
+        KeyError, IndexError or TypeError if the path does not exist in the output.
+    """
+    for key in path:
+        output = output[key]
+    return output
+
+
+def get_json_path(path: List[Any]) -> str:
+    """Convert a list of keys into an absolute JSONPath, e.g. `$.fees.1.name`."""
+    return ".".join(["$", *[str(key) for key in path]])
+
+
+def get_reference_path(path: List[Any]) -> str:
+    """Convert a list of keys into the JSONPath validators are registered
+    under, e.g. `$.fees.name` for `["fees", 1, "name"]`.
+
+    This mirrors how the validator services derive reference paths
+    while traversing the output.
+    """
+    reference_path = "$"
+    for key in path:
+        reference_path = reference_path.replace(".*", "")
+        if isinstance(key, int):
+            reference_path = f"{reference_path}.*"
+        else:
+            reference_path = f"{reference_path}.{key}"
+    return reference_path
+
+
+def get_reask_paths(
+    reasks: Sequence[ReAsk],
+) -> Optional[List[List[Union[str, int]]]]:
+    """Get the paths of the fields that were reasked for.
+
+    Returns None if the next response cannot be validated incrementally,
+    i.e. if any of the reasks is not a FieldReAsk with a known path.
+    """
+    if not reasks:
+        return None
+    reask_paths = []
+    for reask in reasks:
+        if not isinstance(reask, FieldReAsk) or not reask.path:
+            return None
+        reask_paths.append(list(reask.path))
+    return reask_paths
+
+
+def get_pruned_path(obj: Any, path: List[Union[str, int]]) -> List[Union[str, int]]:
+    """Get the path of a reasked field of `obj` in the pruned object the
+    LLM is reasked with.
+
+    Pruning drops the list items that contain no reasks (see
+    `prune_obj_for_reasking`), so list indices shift down by the number
+    of items dropped before them.
+    """
+    pruned_path = []
+    for part in path:
+        if isinstance(obj, list) and isinstance(part, int):
+            pruned_path.append(
+                sum(
+                    1 for item in obj[:part] if prune_obj_for_reasking(item) is not None
+                )
+            )
+        else:
+            pruned_path.append(part)
+        obj = obj[part]
+    return pruned_path
+
+
+def get_reask_response_path(
+    previous_output: Any, reask_response: Any, path: List[Union[str, int]]
+) -> List[Union[str, int]]:
+    """Get the path of a reasked field in the response to a field level
+    reask.
+
+    The LLM is reasked with the pruned output, but may still answer with
+    the whole output, so the pruned path is only used if the lists along
+    the path were pruned in the response too.
+    """
+    obj, response = previous_output, reask_response
+    for part in path:
+        if (
+            isinstance(obj, list)
+            and isinstance(response, list)
+            and len(obj) != len(response)
+        ):
+            return get_pruned_path(previous_output, path)
+        obj, response = obj[part], response[part]
+    return path
+
+
+def get_ancestor_paths(
+    paths: List[List[Union[str, int]]],
+) -> List[List[Union[str, int]]]:
+    """Get the unique ancestors of the given paths, deepest first.
+
+    The root of the output is represented by an empty path.
+    """
+    ancestors = {}
+    for path in paths:
+        for depth in range(len(path)):
+            ancestor = path[:depth]
+            ancestors[tuple(ancestor)] = ancestor
+    return sorted(ancestors.values(), key=len, reverse=True)
+
+
 ### Guard Execution Methods ###
 def introspect(
     data: Optional[Union[ReAsk, str, Dict, List]],
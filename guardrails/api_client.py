@@ -1,24 +1,112 @@
+import asyncio
 import json
 import os
-from typing import Any, Iterator, Optional
+import threading
+import time
+import weakref
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
+import httpx
 import requests
 from guardrails_api_client.configuration import Configuration
 from guardrails_api_client.api_client import ApiClient
 from guardrails_api_client.api.guard_api import GuardApi
 from guardrails_api_client.api.validate_api import ValidateApi
 from guardrails_api_client.models import (
+    Call as ICall,
     Guard,
     ValidatePayload,
     ValidationOutcome as IValidationOutcome,
 )
 
-from guardrails_api_client.exceptions import BadRequestException
+from guardrails_api_client.exceptions import ApiException, BadRequestException
 from guardrails.errors import ValidationError
 
 from guardrails.logger import logger
 
 
+def _openai_api_key_or_env(openai_api_key: Optional[str] = None) -> Optional[str]:
+    return (
+        openai_api_key
+        if openai_api_key is not None
+        else os.environ.get("OPENAI_API_KEY")
+    )
+
+
+def parse_stream_line(line: Any) -> Optional[IValidationOutcome]:
+    """Parses one line of a streamed validation response.
+
+    Lines are either bare JSON or server-sent events with a `data:`
+    field. Returns None for lines that carry no outcome.
+    """
+    if isinstance(line, bytes):
+        line = line.decode("utf-8")
+    line = line.strip() if line else ""
+    if line.startswith("data:"):
+        line = line[len("data:") :].strip()
+    elif line.startswith(":") or line.startswith("event:") or line.startswith("id:"):
+        return None
+    if not line or line == "[DONE]":
+        return None
+    json_output = json.loads(line)
+    if json_output.get("error"):
+        raise Exception(json_output.get("error").get("message"))
+    return IValidationOutcome.from_dict(json_output)
+
+
+class CachedGuard:
+    def __init__(self, guard: Guard, etag: Optional[str] = None):
+        self.guard = guard
+        self.etag = etag
+        self.fetched_at = time.monotonic()
+
+
+class GuardDefinitionCache:
+    """A process-wide cache of the guard definitions fetched from the
+    server.
+
+    Definitions are served from memory for `ttl` seconds. After that the
+    next fetch revalidates them with their ETag, if the server sent one,
+    so unchanged guards aren't downloaded again. The TTL defaults to the
+    GUARDRAILS_GUARD_CACHE_TTL environment variable, or 60 seconds; 0
+    turns the cache off.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = (
+            ttl
+            if ttl is not None
+            else float(os.environ.get("GUARDRAILS_GUARD_CACHE_TTL", 60))
+        )
+        self._guards: Dict[Tuple[str, str, str], CachedGuard] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[CachedGuard]:
+        if self.ttl <= 0:
+            return None
+        return self._guards.get(key)
+
+    def is_fresh(self, cached_guard: CachedGuard) -> bool:
+        return time.monotonic() - cached_guard.fetched_at < self.ttl
+
+    def set(self, key: Tuple[str, str, str], guard: Guard, etag: Optional[str] = None):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._guards[key] = CachedGuard(guard, etag)
+
+    def invalidate(self, key: Optional[Tuple[str, str, str]] = None):
+        """Drops a cached definition, or every one if no key is given."""
+        with self._lock:
+            if key is None:
+                self._guards.clear()
+            else:
+                self._guards.pop(key, None)
+
+
+guard_definition_cache = GuardDefinitionCache()
+
+
 class GuardrailsApiClient:
     _api_client: ApiClient
     _guard_api: GuardApi
@@ -43,18 +131,46 @@ class GuardrailsApiClient:
         self._guard_api = GuardApi(self._api_client)
         self._validate_api = ValidateApi(self._api_client)
 
+    def _cache_key(self, guard_name: str) -> Tuple[str, str, str]:
+        return (self.base_url, self.api_key, guard_name)
+
     def upsert_guard(self, guard: Guard):
         self._guard_api.update_guard(
             guard_name=guard.name, body=guard, _request_timeout=self.timeout
         )
+        guard_definition_cache.invalidate(self._cache_key(guard.name))
 
     def fetch_guard(self, guard_name: str) -> Optional[Guard]:
+        key = self._cache_key(guard_name)
+        cached_guard = guard_definition_cache.get(key)
+        if cached_guard is not None and guard_definition_cache.is_fresh(cached_guard):
+            return cached_guard.guard
+
+        headers = (
+            {"If-None-Match": cached_guard.etag}
+            if cached_guard is not None and cached_guard.etag
+            else None
+        )
         try:
-            return self._guard_api.get_guard(guard_name=guard_name)
+            response = self._guard_api.get_guard_with_http_info(
+                guard_name=guard_name, _headers=headers
+            )
+        except ApiException as e:
+            if cached_guard is not None and e.status == 304:
+                guard_definition_cache.set(key, cached_guard.guard, cached_guard.etag)
+                return cached_guard.guard
+            logger.error(f"Error fetching guard {guard_name}: {e}")
+            return None
         except Exception as e:
             logger.error(f"Error fetching guard {guard_name}: {e}")
             return None
 
+        guard = response.data
+        if guard is not None:
+            etag = (response.headers or {}).get("ETag")
+            guard_definition_cache.set(key, guard, etag)
+        return guard
+
     def validate(
         self,
         guard: Guard,
@@ -62,11 +178,7 @@ class GuardrailsApiClient:
         openai_api_key: Optional[str] = None,
     ):
         try:
-            _openai_api_key = (
-                openai_api_key
-                if openai_api_key is not None
-                else os.environ.get("OPENAI_API_KEY")
-            )
+            _openai_api_key = _openai_api_key_or_env(openai_api_key)
             return self._validate_api.validate(
                 guard_name=guard.name,
                 validate_payload=payload,
@@ -81,11 +193,7 @@ class GuardrailsApiClient:
         payload: ValidatePayload,
         openai_api_key: Optional[str] = None,
     ) -> Iterator[Any]:
-        _openai_api_key = (
-            openai_api_key
-            if openai_api_key is not None
-            else os.environ.get("OPENAI_API_KEY")
-        )
+        _openai_api_key = _openai_api_key_or_env(openai_api_key)
 
         url = f"{self.base_url}/guards/{guard.name}/validate"
         headers = {
@@ -102,11 +210,123 @@ class GuardrailsApiClient:
                         f"status_code: {resp.status_code}"
                         " reason: {resp.reason} text: {resp.text}"
                     )
-                if line:
-                    json_output = json.loads(line)
-                    if json_output.get("error"):
-                        raise Exception(json_output.get("error").get("message"))
-                    yield IValidationOutcome.from_dict(json_output)
+                validation_outcome = parse_stream_line(line)
+                if validation_outcome is not None:
+                    yield validation_outcome
 
     def get_history(self, guard_name: str, call_id: str):
         return self._guard_api.get_guard_history(guard_name, call_id)
+
+
+class AsyncGuardrailsApiClient:
+    """The async counterpart of GuardrailsApiClient.
+
+    Requests go through a pooled, keep-alive httpx.AsyncClient, so
+    concurrent calls from one event loop share connections instead of
+    blocking the loop. A client is kept per event loop since connections
+    can't be shared across loops.
+    """
+
+    timeout: float
+    base_url: str
+    api_key: str
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        *,
+        max_connections: int = 100,
+    ):
+        self.base_url = (
+            base_url
+            if base_url is not None
+            else os.environ.get("GUARDRAILS_BASE_URL", "http://localhost:8000")
+        )
+        self.api_key = (
+            api_key if api_key is not None else os.environ.get("GUARDRAILS_API_KEY", "")
+        )
+        self.timeout = 300
+        self.max_connections = max_connections
+        # Dropped along with their loop, so clients of finished loops
+        #   don't pile up.
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+            self._clients[loop] = client
+        return client
+
+    def _headers(self, openai_api_key: Optional[str] = None) -> Dict[str, str]:
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["authorization"] = self.api_key
+        _openai_api_key = _openai_api_key_or_env(openai_api_key)
+        if _openai_api_key:
+            headers["x-openai-api-key"] = _openai_api_key
+        return headers
+
+    async def validate(
+        self,
+        guard: Guard,
+        payload: ValidatePayload,
+        openai_api_key: Optional[str] = None,
+    ) -> IValidationOutcome:
+        resp = await self._get_client().post(
+            f"/guards/{guard.name}/validate",
+            json=payload.to_dict(),
+            headers=self._headers(openai_api_key),
+        )
+        if resp.status_code == 400:
+            raise ValidationError(resp.text)
+        resp.raise_for_status()
+        return IValidationOutcome.from_dict(resp.json())  # type: ignore
+
+    async def stream_validate(
+        self,
+        guard: Guard,
+        payload: ValidatePayload,
+        openai_api_key: Optional[str] = None,
+    ) -> AsyncIterator[IValidationOutcome]:
+        async with self._get_client().stream(
+            "POST",
+            f"/guards/{guard.name}/validate",
+            json=payload.to_dict(),
+            headers=self._headers(openai_api_key),
+        ) as resp:
+            if resp.is_error:
+                text = (await resp.aread()).decode("utf-8", errors="replace")
+                raise ValueError(
+                    f"status_code: {resp.status_code}"
+                    f" reason: {resp.reason_phrase} text: {text}"
+                )
+            async for line in resp.aiter_lines():
+                validation_outcome = parse_stream_line(line)
+                if validation_outcome is not None:
+                    yield validation_outcome
+
+    async def get_history(self, guard_name: str, call_id: str) -> List[ICall]:
+        resp = await self._get_client().get(
+            f"/guards/{guard_name}/history/{call_id}",
+            headers=self._headers(),
+        )
+        resp.raise_for_status()
+        return [ICall.from_dict(call) for call in resp.json()]  # type: ignore
+
+    async def aclose(self):
+        """Closes the running event loop's client."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
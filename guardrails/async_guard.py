@@ -17,11 +17,13 @@ from typing import (
 )
 
 from guardrails_api_client.models import (
+    Call as ICall,
     ValidatePayload,
     ValidationOutcome as IValidationOutcome,
 )
 
 from guardrails import Guard
+from guardrails.api_client import AsyncGuardrailsApiClient
 from guardrails.classes import OT, ValidationOutcome
 from guardrails.classes.history import Call
 from guardrails.classes.history.call_inputs import CallInputs
@@ -36,6 +38,7 @@ from guardrails.stores.context import (
     set_call_kwargs,
     set_tracer,
     set_tracer_context,
+    set_validator_executor,
 )
 from guardrails.hub_telemetry.hub_tracing import async_trace
 from guardrails.types.pydantic import ModelOrListOfModels
@@ -62,6 +65,10 @@ class AsyncGuard(Guard, Generic[OT]):
     the LLM and the validated output stream.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._async_api_client: Optional[AsyncGuardrailsApiClient] = None
+
     @classmethod
     def _for_rail_schema(
         cls,
@@ -144,6 +151,25 @@ class AsyncGuard(Guard, Generic[OT]):
         guard = super().from_dict(obj)
         return cast(AsyncGuard, guard)
 
+    @classmethod
+    def _from_guard(cls, guard: Guard) -> "AsyncGuard":
+        """Create an AsyncGuard that shares its configuration, validators
+        and history with an existing Guard.
+
+        The attributes are shared by reference rather than copied, so
+        configuring either guard later configures both.
+        """
+        if isinstance(guard, AsyncGuard):
+            return guard
+        async_guard = cls.model_construct()
+        object.__setattr__(async_guard, "__dict__", guard.__dict__)
+        object.__setattr__(
+            async_guard, "__pydantic_fields_set__", guard.__pydantic_fields_set__
+        )
+        # Every AsyncGuard made from the guard shares one API client
+        async_guard.__dict__.setdefault("_async_api_client", None)
+        return async_guard
+
     def use(
         self,
         validator: UseValidatorSpec,
@@ -172,16 +198,21 @@ class AsyncGuard(Guard, Generic[OT]):
         messages: Optional[List[Dict]] = None,
         metadata: Optional[Dict],
         full_schema_reask: Optional[bool] = None,
+        num_candidates: Optional[int] = None,
         **kwargs,
     ) -> Union[
         ValidationOutcome[OT],
         Awaitable[ValidationOutcome[OT]],
         AsyncIterator[ValidationOutcome[OT]],
     ]:
-        self._fill_validator_map()
-        self._fill_validators()
+        self._reconcile_validators()
         metadata = metadata or {}
-        if not llm_output and llm_api and not (messages):
+        if (
+            not llm_output
+            and llm_api
+            and not messages
+            and getattr(llm_api, "requires_messages", True)
+        ):
             raise RuntimeError("'messages' must be provided in order to call an LLM!")
         # check if validator requirements are fulfilled
         missing_keys = verify_metadata_requirements(metadata, self._validators)
@@ -200,6 +231,7 @@ class AsyncGuard(Guard, Generic[OT]):
             messages: Optional[List[Dict]] = None,
             metadata: Optional[Dict] = None,
             full_schema_reask: Optional[bool] = None,
+            num_candidates: Optional[int] = None,
             **kwargs,
         ) -> Union[
             ValidationOutcome[OT],
@@ -214,6 +246,7 @@ class AsyncGuard(Guard, Generic[OT]):
             set_call_kwargs(kwargs)
             set_tracer(self._tracer)
             set_tracer_context(self._tracer_context)
+            set_validator_executor(self._validator_executor)
 
             self._set_num_reasks(num_reasks=num_reasks)
             if self._num_reasks is None:
@@ -262,6 +295,7 @@ class AsyncGuard(Guard, Generic[OT]):
                     messages=messages,
                     metadata=metadata,
                     full_schema_reask=full_schema_reask,
+                    num_candidates=num_candidates,
                     call_log=call_log,
                     *args,
                     **kwargs,
@@ -288,6 +322,7 @@ class AsyncGuard(Guard, Generic[OT]):
             messages=messages,
             metadata=metadata,
             full_schema_reask=full_schema_reask,
+            num_candidates=num_candidates,
             *args,
             **kwargs,
         )
@@ -302,6 +337,7 @@ class AsyncGuard(Guard, Generic[OT]):
         num_reasks: int = 0,  # Should be defined at this point
         metadata: Dict,  # Should be defined at this point
         full_schema_reask: bool = False,  # Should be defined at this point
+        num_candidates: Optional[int] = None,
         messages: Optional[List[Dict]],
         **kwargs,
     ) -> Union[
@@ -326,6 +362,9 @@ class AsyncGuard(Guard, Generic[OT]):
             The raw text output from the LLM and the validated output.
         """
         api = get_async_llm_ask(llm_api, *args, **kwargs)  # type: ignore
+        if kwargs.get("stream", False) and (num_candidates or 1) > 1:
+            raise ValueError("Multiple candidates are not supported when streaming.")
+
         if kwargs.get("stream", False):
             runner = AsyncStreamRunner(
                 output_type=self._output_type,
@@ -368,6 +407,7 @@ class AsyncGuard(Guard, Generic[OT]):
                     else None
                 ),
                 exec_options=self._exec_opts,
+                num_candidates=num_candidates or 1,
             )
             # Why are we using a different method here instead of just overriding?
             call = await runner.async_run(
@@ -385,6 +425,7 @@ class AsyncGuard(Guard, Generic[OT]):
         messages: Optional[List[Dict]] = None,
         metadata: Optional[Dict] = None,
         full_schema_reask: Optional[bool] = None,
+        num_candidates: Optional[int] = None,
         **kwargs,
     ) -> Union[
         ValidationOutcome[OT],
@@ -405,6 +446,10 @@ class AsyncGuard(Guard, Generic[OT]):
                                or just the incorrect values.
                                Defaults to `True` if a base model is provided,
                                `False` otherwise.
+            num_candidates: The number of completions to request on each step.
+                            They are validated concurrently and the first that
+                            passes is returned; the LLM is only reasked if
+                            every candidate fails. Defaults to 1.
 
         Returns:
             The raw text output from the LLM and the validated output.
@@ -417,7 +462,7 @@ class AsyncGuard(Guard, Generic[OT]):
         # Determine the final value for messages
         messages = messages or messages_from_kwargs or messages_from_exec_opts or []
 
-        if messages is not None and not len(messages):
+        if not messages and getattr(llm_api, "requires_messages", True):
             raise RuntimeError(
                 "You must provide a prompt if messages is empty. "
                 "Alternatively, you can provide a prompt in the Schema constructor."
@@ -435,6 +480,7 @@ class AsyncGuard(Guard, Generic[OT]):
             messages=messages,
             metadata=metadata,
             full_schema_reask=full_schema_reask,
+            num_candidates=num_candidates,
             **kwargs,
         )
 
@@ -495,19 +541,77 @@ class AsyncGuard(Guard, Generic[OT]):
             **kwargs,
         )
 
+    def _get_async_api_client(self) -> AsyncGuardrailsApiClient:
+        if self._async_api_client is None:
+            self._async_api_client = AsyncGuardrailsApiClient(
+                api_key=self._api_key, base_url=self._base_url
+            )
+        return self._async_api_client
+
+    def _defer_server_history(
+        self,
+        call_id: Optional[str],
+        afetch: Optional[Callable[[], Awaitable[List[ICall]]]] = None,
+    ):
+        """Defers the fetch with the async API client too, so `await
+        guard.history.aload()` reads the history without blocking the event
+        loop."""
+        if afetch is None and call_id and self._api_client:
+            async_api_client = self._get_async_api_client()
+            guard_name = self.name
+
+            def afetch() -> Awaitable[List[ICall]]:
+                return async_api_client.get_history(guard_name, call_id)
+
+        super()._defer_server_history(call_id, afetch)
+
+    async def _single_server_call(  # type: ignore
+        self, *, payload: Dict[str, Any]
+    ) -> ValidationOutcome[OT]:
+        if self._api_client:
+            async_api_client = self._get_async_api_client()
+            validation_output: IValidationOutcome = await async_api_client.validate(
+                guard=self,  # type: ignore
+                payload=ValidatePayload.from_dict(payload),  # type: ignore
+                openai_api_key=get_call_kwarg("api_key"),
+            )
+            if not validation_output:
+                return ValidationOutcome[OT](
+                    call_id="0",  # type: ignore
+                    raw_llm_output=None,
+                    validated_output=None,
+                    validation_passed=False,
+                    error="The response from the server was empty!",
+                )
+            self._defer_server_history(validation_output.call_id)
+            validation_summaries = self._server_validation_summaries(validation_output)
+
+            validated_output = (
+                cast(OT, validation_output.validated_output.actual_instance)
+                if validation_output.validated_output
+                else None
+            )
+            return ValidationOutcome[OT](
+                call_id=validation_output.call_id,  # type: ignore
+                raw_llm_output=validation_output.raw_llm_output,
+                validated_output=validated_output,
+                validation_passed=(validation_output.validation_passed is True),
+                validation_summaries=validation_summaries,
+            )
+        else:
+            raise ValueError("AsyncGuard does not have an api client!")
+
     async def _stream_server_call(
         self, *, payload: Dict[str, Any]
     ) -> AsyncIterator[ValidationOutcome[OT]]:
-        # TODO: Once server side supports async streaming, this function will need to
-        # yield async generators, not generators
         if self._api_client:
             validation_output: Optional[IValidationOutcome] = None
-            response = self._api_client.stream_validate(
+            response = self._get_async_api_client().stream_validate(
                 guard=self,  # type: ignore
                 payload=ValidatePayload.from_dict(payload),  # type: ignore
                 openai_api_key=get_call_kwarg("api_key"),
             )
-            for fragment in response:
+            async for fragment in response:
                 validation_output = fragment
                 if validation_output is None:
                     yield ValidationOutcome[OT](
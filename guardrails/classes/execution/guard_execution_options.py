@@ -7,3 +7,5 @@ class GuardExecutionOptions:
     messages: Optional[List[Dict]] = None
     reask_messages: Optional[List[Dict]] = None
     num_reasks: Optional[int] = None
+    speculative_input_validation: bool = False
+    validation_timeout: Optional[float] = None
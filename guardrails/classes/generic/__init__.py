@@ -1,5 +1,6 @@
 from guardrails.classes.generic.arbitrary_model import ArbitraryModel
 from guardrails.classes.generic.serializeable import Serializeable
 from guardrails.classes.generic.stack import Stack
+from guardrails.classes.generic.stream_buffer import StreamBuffer
 
-__all__ = ["ArbitraryModel", "Stack", "Serializeable"]
+__all__ = ["ArbitraryModel", "Stack", "Serializeable", "StreamBuffer"]
@@ -0,0 +1,57 @@
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+
+class StreamBuffer:
+    """Accumulates the text chunks of a stream.
+
+    Chunks are appended to a list instead of being concatenated onto a
+    string, so appending a chunk never copies the text accumulated so
+    far. Only the chunks are kept; reading `text` joins them into a new
+    string every time. That is linear in the length of the buffer, so
+    read it once the stream is done rather than after every append.
+
+    Args:
+        chunks: Chunks to start the buffer with.
+    """
+
+    def __init__(self, chunks: Optional[Iterable[str]] = None):
+        self._chunks: List[str] = []
+        self._length = 0
+        for chunk in chunks or []:
+            self.append(chunk)
+
+    def append(self, chunk: Optional[str]) -> None:
+        """Adds a chunk to the end of the buffer.
+
+        Empty chunks are ignored.
+        """
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+
+    @property
+    def chunks(self) -> Sequence[str]:
+        """The chunks appended so far, without copying them."""
+        return self._chunks
+
+    @property
+    def text(self) -> str:
+        """The chunks appended so far, joined into one string.
+
+        The joined string isn't kept, so the buffer never holds the text
+        twice.
+        """
+        return "".join(self._chunks)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._chunks)
@@ -84,7 +84,8 @@ class Iteration(IIteration, ArbitraryModel):
         iteration."""
         response = self.outputs.llm_response_info
         if response is not None:
-            return response.prompt_token_count
+            # Responses served from the LLM cache did not consume any tokens.
+            return 0 if response.cache_hit else response.prompt_token_count
 
     @property
     def completion_tokens_consumed(self) -> Optional[int]:
@@ -92,7 +93,8 @@ class Iteration(IIteration, ArbitraryModel):
         iteration."""
         response = self.outputs.llm_response_info
         if response is not None:
-            return response.response_token_count
+            # Responses served from the LLM cache did not consume any tokens.
+            return 0 if response.cache_hit else response.response_token_count
 
     @property
     def raw_output(self) -> Optional[str]:
@@ -145,12 +147,7 @@ class Iteration(IIteration, ArbitraryModel):
         """The results of each individual validation performed on the LLM
         response during this iteration."""
         if self.inputs.stream:
-            filtered_logs = [
-                log
-                for log in self.outputs.validator_logs
-                if log.validation_result and log.validation_result.validated_chunk
-            ]
-            return filtered_logs
+            return self.outputs.validator_logs_with_chunks
         return self.outputs.validator_logs
 
     @property
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from guardrails_api_client import (
     Outputs as IOutputs,
@@ -19,6 +19,94 @@ from guardrails.classes.validation.validation_result import (
 )
 
 
+def _failed(log: ValidatorLogs) -> bool:
+    return (
+        log.validation_result is not None
+        and isinstance(log.validation_result, ValidationResult)
+        and log.validation_result.outcome == "fail"
+    )
+
+
+def _collect_error_spans(
+    log: ValidatorLogs,
+    error_spans: List[ErrorSpan],
+    total_len_by_validator: Dict[str, int],
+):
+    validator_name = log.validator_name
+    if total_len_by_validator.get(validator_name) is None:
+        total_len_by_validator[validator_name] = 0
+    result = log.validation_result
+    if isinstance(result, FailResult):
+        if result.error_spans is not None:
+            for error_span in result.error_spans:
+                error_spans.append(
+                    ErrorSpan(
+                        start=error_span.start + total_len_by_validator[validator_name],
+                        end=error_span.end + total_len_by_validator[validator_name],
+                        reason=error_span.reason,
+                    )
+                )
+    if isinstance(result, ValidationResult):
+        if result and result.validated_chunk is not None:
+            total_len_by_validator[validator_name] += len(result.validated_chunk)
+
+
+class _LogViews:
+    """Views derived from a list of validator logs.
+
+    Logs are appended before their validator runs and get their result
+    afterwards. Each log is folded into the views once it is seen; logs
+    without a result yet are remembered by index as pending. A streamed
+    log whose validator is still accumulating its chunk keeps a None
+    result for good, so pending logs never hold back the ones after them.
+    If a pending log gets its result after a later log was folded, the
+    views start over so they stay in log order.
+    """
+
+    def __init__(self, logs: Optional[List[ValidatorLogs]] = None):
+        self.logs_id = id(logs) if logs is not None else None
+        self.scanned = 0
+        self.last_folded = -1
+        self.pending: List[int] = []
+        self.failed: List[ValidatorLogs] = []
+        self.error_spans: List[ErrorSpan] = []
+        self.total_len_by_validator: Dict[str, int] = {}
+        self.with_chunks: List[ValidatorLogs] = []
+
+    def _fold(self, index: int, log: ValidatorLogs):
+        if _failed(log):
+            self.failed.append(log)
+        _collect_error_spans(log, self.error_spans, self.total_len_by_validator)
+        if log.validation_result and log.validation_result.validated_chunk:
+            self.with_chunks.append(log)
+        self.last_folded = index
+
+    def update(self, logs: List[ValidatorLogs]) -> "_LogViews":
+        """Folds in the logs that got their result since the last update.
+
+        Returns these views, or fresh ones if they had to start over.
+        """
+        resolved = [i for i in self.pending if logs[i].validation_result is not None]
+        if resolved:
+            if resolved[0] < self.last_folded:
+                return _LogViews(logs).update(logs)
+            resolved_set = set(resolved)
+            self.pending = [i for i in self.pending if i not in resolved_set]
+            for i in resolved:
+                self._fold(i, logs[i])
+        for i in range(self.scanned, len(logs)):
+            if logs[i].validation_result is None:
+                self.pending.append(i)
+            else:
+                self._fold(i, logs[i])
+        self.scanned = len(logs)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        # Derived state, so it never makes two Outputs differ
+        return isinstance(other, _LogViews)
+
+
 class Outputs(IOutputs, ArbitraryModel):
     """Outputs represent the data that is output from the validation loop.
 
@@ -80,6 +168,7 @@ class Outputs(IOutputs, ArbitraryModel):
     exception: Optional[Exception] = Field(
         description="The exception that interrupted the process.", default=None
     )
+    _log_views: _LogViews = PrivateAttr(default_factory=_LogViews)
 
     def _all_empty(self) -> bool:
         return (
@@ -92,18 +181,24 @@ class Outputs(IOutputs, ArbitraryModel):
             and self.error is None
         )
 
+    def _views(self) -> _LogViews:
+        """Returns the views derived from the validator logs, folding in any
+        logs that got their result since the last read.
+
+        The views start over if the logs are replaced or shrink.
+        """
+        logs = self.validator_logs
+        views = self._log_views
+        if views.logs_id != id(logs) or views.scanned > len(logs):
+            views = _LogViews(logs)
+        views = views.update(logs)
+        self._log_views = views
+        return views
+
     @property
     def failed_validations(self) -> List[ValidatorLogs]:
         """Returns the validator logs for any validation that failed."""
-        return list(
-            [
-                log
-                for log in self.validator_logs
-                if log.validation_result is not None
-                and isinstance(log.validation_result, ValidationResult)
-                and log.validation_result.outcome == "fail"
-            ]
-        )
+        return list(self._views().failed)
 
     @property
     def error_spans_in_output(self) -> List[ErrorSpan]:
@@ -111,32 +206,13 @@ class Outputs(IOutputs, ArbitraryModel):
 
         These indices are relative to the complete LLM output.
         """
-        # map of total length to validator
-        total_len_by_validator = {}
-        spans_in_output = []
-        for log in self.validator_logs:
-            validator_name = log.validator_name
-            if total_len_by_validator.get(validator_name) is None:
-                total_len_by_validator[validator_name] = 0
-            result = log.validation_result
-            if isinstance(result, FailResult):
-                if result.error_spans is not None:
-                    for error_span in result.error_spans:
-                        spans_in_output.append(
-                            ErrorSpan(
-                                start=error_span.start
-                                + total_len_by_validator[validator_name],
-                                end=error_span.end
-                                + total_len_by_validator[validator_name],
-                                reason=error_span.reason,
-                            )
-                        )
-            if isinstance(result, ValidationResult):
-                if result and result.validated_chunk is not None:
-                    total_len_by_validator[validator_name] += len(
-                        result.validated_chunk
-                    )
-        return spans_in_output
+        return list(self._views().error_spans)
+
+    @property
+    def validator_logs_with_chunks(self) -> List[ValidatorLogs]:
+        """The validator logs whose validation produced a chunk, which is what
+        streamed iterations report."""
+        return list(self._views().with_chunks)
 
     @property
     def status(self) -> str:
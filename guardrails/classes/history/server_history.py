@@ -0,0 +1,183 @@
+import asyncio
+import threading
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from guardrails_api_client.models import Call as ICall
+
+from guardrails.classes.generic.stack import Stack
+from guardrails.classes.history.call import Call
+from guardrails.logger import logger
+
+
+class ServerHistory(Stack[Call]):
+    """A Guard history whose server-side calls are fetched the first time
+    it is read.
+
+    Server-mode guards defer the history fetch of each call instead of
+    making a second round trip after every validation, so callers that
+    never read `guard.history` never pay for it.
+
+    Reading the stack fetches with the blocking client. On an event loop,
+    `await history.aload()` first so the fetches go through the async
+    client instead.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        # Deferred fetches by call index. A fetch stays pending until its
+        #   calls are stored, and calls are only appended in index order,
+        #   so loads that run at once can't reorder the history.
+        self._pending: Dict[
+            int,
+            Tuple[
+                Callable[[], Iterable[ICall]],
+                Optional[Callable[[], Awaitable[Iterable[ICall]]]],
+            ],
+        ] = {}
+        self._fetched: Dict[int, List[Call]] = {}
+        self._next_index = 0
+        self._loaded_index = 0
+        self._lock = threading.RLock()
+        # aload calls on a loop take turns, so none fetches a call that
+        #   another is already fetching.
+        self._aload_locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Lock
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def pending(self) -> int:
+        """The number of calls whose history hasn't been loaded yet."""
+        return self._next_index - self._loaded_index
+
+    def defer(
+        self,
+        fetch: Callable[[], Iterable[ICall]],
+        afetch: Optional[Callable[[], Awaitable[Iterable[ICall]]]] = None,
+    ):
+        """Queues a fetch of a call's history until the stack is next
+        read.
+
+        `afetch` is the async version of `fetch`, used by `aload`.
+        """
+        with self._lock:
+            self._pending[self._next_index] = (fetch, afetch)
+            self._next_index += 1
+
+    def load(self):
+        """Fetches the history of every deferred call, in call order.
+
+        Calls an `aload` is still fetching are fetched again, so the
+        stack is fully loaded once this returns.
+        """
+        if not self._pending:
+            return
+        if any(afetch for _, afetch in self._pending.values()) and _on_event_loop():
+            logger.warning(
+                "Reading the guard history on an event loop blocks it while "
+                "the history is fetched; await guard.history.aload() first."
+            )
+        with self._lock:
+            for index, (fetch, _) in list(self._pending.items()):
+                try:
+                    calls = fetch() or []
+                except Exception as e:
+                    logger.warning(f"Failed to fetch the guard history: {e}")
+                    calls = []
+                self._store(index, calls)
+
+    async def aload(self):
+        """Fetches the history of every deferred call, in call order,
+        without blocking the event loop.
+
+        Fetches deferred without an async version run on a worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            aload_lock = self._aload_locks.setdefault(loop, asyncio.Lock())
+        async with aload_lock:
+            with self._lock:
+                pending = list(self._pending.items())
+            for index, (fetch, afetch) in pending:
+                if index not in self._pending:
+                    # A load already fetched it.
+                    continue
+                try:
+                    if afetch is not None:
+                        calls = await afetch() or []
+                    else:
+                        calls = await loop.run_in_executor(None, fetch) or []
+                except Exception as e:
+                    logger.warning(f"Failed to fetch the guard history: {e}")
+                    calls = []
+                self._store(index, calls)
+
+    def _store(self, index: int, calls: Iterable[ICall]):
+        """Keeps the calls fetched for a deferred call, and appends every
+        call that is next in order."""
+        with self._lock:
+            if self._pending.pop(index, None) is None:
+                return
+            self._fetched[index] = [Call.from_interface(call) for call in calls]
+            while self._loaded_index in self._fetched:
+                list.extend(self, self._fetched.pop(self._loaded_index))
+                self._loaded_index += 1
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _load_first(name: str) -> Callable:
+    method = getattr(Stack, name)
+
+    def wrapper(self: ServerHistory, *args, **kwargs) -> Any:
+        self.load()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+# Every read or write goes through the deferred fetches first,
+#   so the stack behaves like a fully loaded one.
+for _name in (
+    "__add__",
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__getitem__",
+    "__iadd__",
+    "__iter__",
+    "__len__",
+    "__ne__",
+    "__repr__",
+    "__reversed__",
+    "__setitem__",
+    "append",
+    "clear",
+    "copy",
+    "count",
+    "extend",
+    "index",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(ServerHistory, _name, _load_first(_name))
@@ -1,10 +1,13 @@
 import asyncio
 from itertools import tee
-from typing import Any, Dict, Iterator, Optional, AsyncIterator
+from typing import Any, Dict, Iterator, List, Optional, AsyncIterator
 
 from guardrails_api_client import LLMResponse as ILLMResponse
+from pydantic import PrivateAttr
 from pydantic.config import ConfigDict
 
+from guardrails.classes.generic.stream_buffer import StreamBuffer
+
 
 # TODO: Move this somewhere that makes sense
 def async_to_sync(awaitable):
@@ -27,6 +30,10 @@ class LLMResponse(ILLMResponse):
             Default None.
         response_token_count (Optional[int]): The number of tokens in the response.
             Default None.
+        candidate_outputs (Optional[List[str]]): The outputs of every completion
+            when several were requested. `output` is the first.  Default None.
+        cache_hit (bool): Whether the response was served from the LLM cache
+            instead of calling the LLM.  Default False.
     """
 
     # Pydantic Config
@@ -37,22 +44,40 @@ class LLMResponse(ILLMResponse):
     output: str
     stream_output: Optional[Iterator] = None
     async_stream_output: Optional[AsyncIterator] = None
+    candidate_outputs: Optional[List[str]] = None
+    cache_hit: bool = False
+    _stream_buffer: Optional[StreamBuffer] = PrivateAttr(default=None)
+
+    def record_stream(self) -> StreamBuffer:
+        """Returns the buffer the consumer of the stream appends each chunk's
+        text to.
+
+        Once a stream is recorded, serializing this response reads the
+        buffer instead of copying the stream.
+        """
+        if self._stream_buffer is None:
+            self._stream_buffer = StreamBuffer()
+        return self._stream_buffer
 
     def to_interface(self) -> ILLMResponse:
         stream_output = None
-        if self.stream_output:
+        async_stream_output = None
+        if self._stream_buffer is not None:
+            if self.async_stream_output:
+                async_stream_output = list(self._stream_buffer.chunks)
+            else:
+                stream_output = list(self._stream_buffer.chunks)
+        elif self.stream_output:
             # Keep an eye on this, I don't trust it to not explode memory
             copy_1, copy_2 = tee(self.stream_output)
             self.stream_output = copy_1
             stream_output = [str(so) for so in copy_2]
-
-        async_stream_output = None
-        # dont do this again if already aiter-able were updating
-        # ourselves here so in memory
-        # this can cause issues
-        if self.async_stream_output and not hasattr(
+        elif self.async_stream_output and not hasattr(
             self.async_stream_output, "__aiter__"
         ):
+            # dont do this again if already aiter-able were updating
+            # ourselves here so in memory
+            # this can cause issues
             # tee doesn't work with async iterators
             # This may be destructive
             async_stream_output = []
@@ -1,4 +1,7 @@
+from typing import Any, Dict, Optional, Sequence
+
 from guardrails.classes.llm.llm_response import LLMResponse
+from guardrails.settings import settings
 
 
 CALLABLE_FAILURE_SUFFIX = """Make sure that `fn` can be called as a function
@@ -19,15 +22,27 @@ class PromptCallableBase:
     """
 
     supports_base_model = False
+    # Whether the callable needs messages to produce a response
+    requires_messages = True
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, cache_namespace: Optional[str] = None, **kwargs):
         self.init_args = args
         self.init_kwargs = kwargs
+        # Names the callable in LLM cache keys, instead of the function it wraps
+        self.cache_namespace = cache_namespace
 
     def _invoke_llm(self, *args, **kwargs) -> LLMResponse:
         raise NotImplementedError
 
     def __call__(self, *args, **kwargs) -> LLMResponse:
+        cache_key = self._cache_key(
+            (*self.init_args, *args), {**self.init_kwargs, **kwargs}
+        )
+        if cache_key is not None:
+            cached_response = settings.llm_cache.get(cache_key)  # type: ignore
+            if cached_response is not None:
+                return cached_response
+
         try:
             result = self._invoke_llm(
                 *self.init_args, *args, **self.init_kwargs, **kwargs
@@ -42,4 +57,29 @@ class PromptCallableBase:
                 "The callable `fn` passed to `Guard(fn, ...)` returned"
                 f" a non-string value: {result}. {CALLABLE_FAILURE_SUFFIX}"
             )
+
+        if cache_key is not None:
+            settings.llm_cache.set(cache_key, result)  # type: ignore
         return result
+
+    def _cache_key(self, args: Sequence[Any], kwargs: Dict[str, Any]) -> Optional[str]:
+        """The key the response to this request is cached under, or None if
+        it should not be cached."""
+        llm_cache = settings.llm_cache
+        if llm_cache is None or not llm_cache.is_cacheable(kwargs):
+            return None
+        try:
+            return llm_cache.make_key(self._cache_namespace(), args, kwargs)
+        except (TypeError, ValueError, RecursionError):
+            # Requests that can't be keyed the same way every time aren't cached
+            return None
+
+    def _cache_namespace(self) -> Any:
+        if self.cache_namespace is not None:
+            return self.cache_namespace
+        # Custom callables are told apart by the function they wrap;
+        #   it's turned into a key along with the rest of the request.
+        llm_api = getattr(self, "llm_api", None)
+        if llm_api is not None:
+            return llm_api
+        return f"{type(self).__module__}.{type(self).__qualname__}"
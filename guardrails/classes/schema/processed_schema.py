@@ -4,6 +4,7 @@ from guardrails.classes.execution.guard_execution_options import GuardExecutionO
 from guardrails.classes.output_type import OutputTypes
 from guardrails.classes.validation.validator_reference import ValidatorReference
 from guardrails.types.validator import ValidatorMap
+from guardrails.validator_base import Validator
 
 
 @dataclass
@@ -17,3 +18,6 @@ class ProcessedSchema:
     validator_map: ValidatorMap = field(default_factory=dict)
     json_schema: Dict[str, Any] = field(default_factory=dict)
     exec_opts: GuardExecutionOptions = field(default_factory=GuardExecutionOptions)
+    # Validator instances the user passed in, e.g. in a Pydantic Field,
+    #   as opposed to those created from a spec while compiling the schema.
+    user_validators: List[Validator] = field(default_factory=list)
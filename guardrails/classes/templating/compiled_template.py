@@ -0,0 +1,83 @@
+from functools import lru_cache
+from string import Template
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, Union
+
+
+class Placeholder(NamedTuple):
+    name: str
+    text: str
+
+
+class CompiledTemplate:
+    """A template that has been parsed once into literal and placeholder
+    segments.
+
+    Substituting a compiled template is a single pass over its segments
+    and follows the same rules as `Template.safe_substitute`.
+    Use `CompiledTemplate.compile` to reuse compiled templates across calls.
+    """
+
+    def __init__(self, source: str, template_class: Type[Template] = Template):
+        self.source = source
+        self.template_class = template_class
+        self.segments: Tuple[Union[str, Placeholder], ...] = tuple(
+            self._parse(source, template_class)
+        )
+        self.identifiers: List[str] = list(
+            dict.fromkeys(
+                segment.name
+                for segment in self.segments
+                if isinstance(segment, Placeholder)
+            )
+        )
+
+    @staticmethod
+    def _parse(
+        source: str, template_class: Type[Template]
+    ) -> List[Union[str, Placeholder]]:
+        segments: List[Union[str, Placeholder]] = []
+        literal = ""
+        last_index = 0
+        for match in template_class.pattern.finditer(source):  # type: ignore
+            literal += source[last_index : match.start()]
+            last_index = match.end()
+            name = match.group("named") or match.group("braced")
+            if name is not None:
+                if literal:
+                    segments.append(literal)
+                    literal = ""
+                segments.append(Placeholder(name=name, text=match.group()))
+            elif match.group("escaped") is not None:
+                literal += template_class.delimiter
+            else:
+                # Invalid placeholders are left as is.
+                literal += match.group()
+        literal += source[last_index:]
+        if literal:
+            segments.append(literal)
+        return segments
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def compile(
+        cls, source: str, template_class: Type[Template] = Template
+    ) -> "CompiledTemplate":
+        """Get the compiled template for a source string from the cache,
+        compiling it if necessary."""
+        return cls(source, template_class)
+
+    def safe_substitute(
+        self, mapping: Optional[Dict[str, Any]] = None, /, **kwargs
+    ) -> str:
+        """Substitute the placeholders present in the mapping, leaving all
+        others untouched."""
+        mapping = {**mapping, **kwargs} if mapping else kwargs
+        parts = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+            elif segment.name in mapping:
+                parts.append(str(mapping[segment.name]))
+            else:
+                parts.append(segment.text)
+        return "".join(parts)
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional
 from guardrails_api_client import ValidatorReference as IValidatorReference
 
 from guardrails.utils.serialization_utils import to_dict
@@ -43,3 +43,50 @@ class ValidatorReference(IValidatorReference):
             ref_dict["kwargs"] = {k: to_dict(v) for k, v in self.kwargs.items()}
 
         return ref_dict
+
+
+class ValidatorReferenceList(List[ValidatorReference]):
+    """A list of ValidatorReferences that counts its changes.
+
+    A Guard compares `version` against the one it last reconciled its
+    validators with, so edits made in place, like replacing an item, are
+    picked up without rescanning the references on every call.
+    """
+
+    version = 0
+
+    def __init__(self, references: Optional[Iterable[ValidatorReference]] = None):
+        super().__init__(references or [])
+
+    def _changed(self):
+        self.version += 1
+
+
+def _bump_version(name: str):
+    method = getattr(list, name)
+
+    def mutate(self: ValidatorReferenceList, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return result
+
+    mutate.__name__ = name
+    mutate.__doc__ = method.__doc__
+    return mutate
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(ValidatorReferenceList, _name, _bump_version(_name))
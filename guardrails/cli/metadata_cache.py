@@ -0,0 +1,144 @@
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from os.path import expanduser
+from typing import Any, Callable, List, Optional, Set
+
+from guardrails.cli.logger import logger
+
+
+def default_cache_dir() -> str:
+    cache_dir = os.environ.get("GUARDRAILS_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "guardrails", "metadata")
+
+
+class CachedMetadata:
+    def __init__(self, value: Any, fetched_at: float):
+        self.value = value
+        self.fetched_at = fetched_at
+
+
+class MetadataCache:
+    """An on-disk cache of the metadata the CLI fetches from PyPI and the
+    Guardrails Hub, shared by every process on the machine.
+
+    Entries stay fresh for `ttl` seconds. Stale entries are still
+    returned, so callers can fall back to them while offline. The
+    directory defaults to the GUARDRAILS_CACHE_DIR environment variable,
+    or ~/.cache/guardrails/metadata. The TTL defaults to the
+    GUARDRAILS_METADATA_CACHE_TTL environment variable, or a day; 0 turns
+    the cache off.
+    """
+
+    def __init__(self, directory: Optional[str] = None, ttl: Optional[float] = None):
+        self.directory = directory or default_cache_dir()
+        self.ttl = (
+            ttl
+            if ttl is not None
+            else float(os.environ.get("GUARDRAILS_METADATA_CACHE_TTL", 86400))
+        )
+        self._refreshing: Set[str] = set()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: str) -> Optional[CachedMetadata]:
+        if not self.enabled:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+            if entry.get("key") != key:
+                return None
+            return CachedMetadata(entry["value"], float(entry["fetched_at"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def is_fresh(self, cached: CachedMetadata) -> bool:
+        return time.time() - cached.fetched_at < self.ttl
+
+    def set(self, key: str, value: Any):
+        """Writes an entry, replacing the file atomically so concurrent
+        readers never see a partial one.
+
+        The cache is best effort, so failing to write it, e.g. on a read
+        only filesystem, is ignored.
+        """
+        if not self.enabled:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(
+                    {"key": key, "fetched_at": time.time(), "value": value}, cache_file
+                )
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write the metadata cache: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def refresh_in_background(
+        self, key: str, fetch: Callable[[], Any]
+    ) -> Optional[threading.Thread]:
+        """Fetches and caches an entry on a daemon thread, so the caller
+        doesn't wait on the network and exiting doesn't wait on the fetch.
+
+        Only one refresh per key runs at a time. Returns the thread, or
+        None if a refresh of the key is already running.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return None
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self.set(key, fetch())
+            except Exception as e:
+                logger.debug(f"Could not refresh {key}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        thread = threading.Thread(
+            target=refresh, name="guardrails-metadata-refresh", daemon=True
+        )
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            self._threads.append(thread)
+        thread.start()
+        return thread
+
+    def wait_for_refreshes(self, timeout: float):
+        """Gives running refreshes up to `timeout` seconds in total to
+        finish."""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(max(0, deadline - time.monotonic()))
+
+
+metadata_cache = MetadataCache()
+# Short lived commands would otherwise exit before a refresh can land
+atexit.register(metadata_cache.wait_for_refreshes, 1)
@@ -12,6 +12,7 @@ from jwt import ExpiredSignatureError, DecodeError
 from guardrails.settings import settings
 from guardrails.classes.rc import RC
 from guardrails.cli.logger import logger
+from guardrails.cli.metadata_cache import metadata_cache
 from guardrails.version import GUARDRAILS_VERSION
 
 FIND_NEW_TOKEN = "You can find a new token at https://hub.guardrailsai.com/keys"
@@ -30,6 +31,8 @@ VALIDATOR_HUB_SERVICE = os.getenv(
 validator_manifest_endpoint = Template(
     "validator/${namespace}/${validator_name}/manifest"
 )
+# Seconds to wait on the hub before giving up
+HUB_REQUEST_TIMEOUT = float(os.getenv("GR_VALIDATOR_HUB_TIMEOUT", 10))
 
 
 class AuthenticationError(Exception):
@@ -49,27 +52,31 @@ class HttpError(Exception):
     message: str
 
 
-def fetch(url: str, token: Optional[str], anonymousUserId: Optional[str]):
-    try:
-        # For Debugging
-        # headers = { "Authorization": f"Bearer {token}", "x-anonymous-user-id": anonymousUserId, "Cache-Control": "no-cache" }  # noqa
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "x-anonymous-user-id": anonymousUserId,
-            "x-guardrails-version": GUARDRAILS_VERSION,
-        }
-        req = requests.get(url, headers=headers)
-        body = req.json()
+def _fetch(url: str, token: Optional[str], anonymousUserId: Optional[str]):
+    # For Debugging
+    # headers = { "Authorization": f"Bearer {token}", "x-anonymous-user-id": anonymousUserId, "Cache-Control": "no-cache" }  # noqa
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "x-anonymous-user-id": anonymousUserId,
+        "x-guardrails-version": GUARDRAILS_VERSION,
+    }
+    req = requests.get(url, headers=headers, timeout=HUB_REQUEST_TIMEOUT)
+    body = req.json()
 
-        if not req.ok:
-            logger.error(req.status_code)
-            logger.error(body.get("message"))
-            http_error = HttpError()
-            http_error.status = req.status_code
-            http_error.message = body.get("message")
-            raise http_error
+    if not req.ok:
+        logger.error(req.status_code)
+        logger.error(body.get("message"))
+        http_error = HttpError()
+        http_error.status = req.status_code
+        http_error.message = body.get("message")
+        raise http_error
 
-        return body
+    return body
+
+
+def fetch(url: str, token: Optional[str], anonymousUserId: Optional[str]):
+    try:
+        return _fetch(url, token, anonymousUserId)
     except HttpError as http_e:
         raise http_e
     except Exception as e:
@@ -85,7 +92,26 @@ def fetch_module_manifest(
         namespace=namespace, validator_name=validator_name
     )
     manifest_url = f"{VALIDATOR_HUB_SERVICE}/{manifest_path}"
-    return fetch(manifest_url, token, anonymousUserId)
+
+    # Manifests are cached on disk so repeated installs don't refetch them,
+    # and a stale copy is used when the hub can't be reached
+    cached = metadata_cache.get(manifest_url)
+    if cached is not None and metadata_cache.is_fresh(cached):
+        return cached.value
+    if cached is None:
+        manifest = fetch(manifest_url, token, anonymousUserId)
+    else:
+        try:
+            manifest = _fetch(manifest_url, token, anonymousUserId)
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(
+                f"Could not reach the hub ({e}), using the cached manifest "
+                f"for {module_name}."
+            )
+            return cached.value
+    if manifest:
+        metadata_cache.set(manifest_url, manifest)
+    return manifest
 
 
 def get_jwt_token(rc: RC) -> Optional[str]:
@@ -188,7 +214,12 @@ def post_validator_submit(package_name: str, content: str):
             "Authorization": f"Bearer {token}",
         }
         request_body = {"packageName": package_name, "content": content}
-        req = requests.post(submission_url, data=request_body, headers=headers)
+        req = requests.post(
+            submission_url,
+            data=request_body,
+            headers=headers,
+            timeout=HUB_REQUEST_TIMEOUT,
+        )
 
         body = req.json()
         if not req.ok:
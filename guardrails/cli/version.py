@@ -2,24 +2,52 @@ import contextlib
 import requests
 import semver
 from importlib.metadata import version
+from typing import Optional
 from rich.console import Console
 
+from guardrails.cli.metadata_cache import metadata_cache
+
 
 GUARDRAILS_PACKAGE_NAME = "guardrails-ai"
+PYPI_URL = f"https://pypi.org/pypi/{GUARDRAILS_PACKAGE_NAME}/json"
+PYPI_TIMEOUT = 3
 
 
 def get_guardrails_version():
     return version(GUARDRAILS_PACKAGE_NAME)
 
 
+def fetch_latest_version() -> Optional[str]:
+    res = requests.get(PYPI_URL, timeout=PYPI_TIMEOUT)
+    res.raise_for_status()
+    version_info = res.json()
+    info = version_info.get("info", {})
+    return info.get("version")
+
+
+def get_latest_version() -> Optional[str]:
+    """Returns the latest version of Guardrails on PyPI, as last seen.
+
+    The version is read from the metadata cache and refreshed in the
+    background once stale, so the CLI never waits on PyPI. Until the
+    first refresh lands there is no version to compare against. With the
+    cache turned off, PyPI is asked directly.
+    """
+    if not metadata_cache.enabled:
+        return fetch_latest_version()
+    cached = metadata_cache.get(PYPI_URL)
+    if cached is None or not metadata_cache.is_fresh(cached):
+        metadata_cache.refresh_in_background(PYPI_URL, fetch_latest_version)
+    return cached.value if cached else None
+
+
 def version_warnings_if_applicable(console: Console):
     current_version = get_guardrails_version()
 
     with contextlib.suppress(Exception):
-        res = requests.get(f"https://pypi.org/pypi/{GUARDRAILS_PACKAGE_NAME}/json")
-        version_info = res.json()
-        info = version_info.get("info", {})
-        latest_version = info.get("version")
+        latest_version = get_latest_version()
+        if latest_version is None:
+            return
 
         is_update_available = semver.compare(latest_version, current_version) > 0
 
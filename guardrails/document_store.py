@@ -2,7 +2,7 @@ import hashlib
 from abc import ABC, abstractmethod
 from collections import namedtuple
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from pydantic import Field
 
@@ -130,33 +130,57 @@ try:
             self._storage = RealSQLMetadataStore(path=path)
 
         def add_document(self, document: Document):
-            # Add the document, in case the document is already there it
-            # would raise an exception and we assume the document and
-            # vectors are present.
+            self.add_documents([document])
+
+        def add_documents(self, documents: List[Document]):
+            """Adds documents to the store in a single transaction.
+
+            Documents that are already in the store are skipped, along
+            with their vectors.
+            """
+            existing_ids = self._storage.get_existing_doc_ids(
+                [document.id for document in documents]
+            )
+            new_documents: Dict[str, Document] = {}
+            for document in documents:
+                if document.id not in existing_ids:
+                    new_documents.setdefault(document.id, document)
+            if not new_documents:
+                return
+
+            # In case another writer added one of the documents in the
+            # meantime, we assume the documents and vectors are present.
             try:
                 self._storage.add_docs(
-                    [document], vdb_last_index=self._vector_db.last_index()
+                    list(new_documents.values()),
+                    vdb_last_index=self._vector_db.last_index(),
                 )
             except IntegrityError:
                 return
-            self._vector_db.add_texts(list(document.pages.values()))
+            self._vector_db.add_texts(
+                [
+                    text
+                    for document in new_documents.values()
+                    for text in document.pages.values()
+                ]
+            )
 
         def add_text(self, text: str, meta: Dict[Any, Any]) -> str:
-            hash = hashlib.md5()
-            hash.update(text.encode("utf-8"))
-            hash.update(str(meta).encode("utf-8"))
-            id = hash.hexdigest()
-
-            doc = Document(id, {0: text}, meta)
+            doc = self._text_document(text, meta)
             self.add_document(doc)
             return doc.id
 
         def add_texts(self, texts: Dict[str, Dict[Any, Any]]) -> List[str]:
-            doc_ids = []
-            for text, meta in texts.items():
-                doc_id = self.add_text(text, meta)
-                doc_ids.append(doc_id)
-            return doc_ids
+            docs = [self._text_document(text, meta) for text, meta in texts.items()]
+            self.add_documents(docs)
+            return [doc.id for doc in docs]
+
+        @staticmethod
+        def _text_document(text: str, meta: Dict[Any, Any]) -> Document:
+            hash = hashlib.md5()
+            hash.update(text.encode("utf-8"))
+            hash.update(str(meta).encode("utf-8"))
+            return Document(hash.hexdigest(), {0: text}, meta)
 
         def search(self, query: str, k: int = 4) -> List[Page]:
             vector_db_indexes = self._vector_db.similarity_search(query, k)
@@ -177,14 +201,17 @@ try:
 
     Base = declarative_base()
 
+    # Stays well under SQLite's limit on the number of query parameters.
+    MAX_QUERY_PARAMS = 500
+
     class RealSqlDocument(Base):
         __tablename__ = "documents"
 
         id: Mapped[int] = mapped_column(primary_key=True)  # type: ignore
         page_num: Mapped[int] = mapped_column(sqlalchemy.Integer, primary_key=True)  # type: ignore
         text: Mapped[str] = mapped_column(sqlalchemy.String)  # type: ignore
-        meta: Mapped[dict] = mapped_column(sqlalchemy.PickleType)  # type: ignore
-        vector_index: Mapped[int] = mapped_column(sqlalchemy.Integer)  # type: ignore
+        meta: Mapped[dict] = mapped_column(sqlalchemy.JSON)  # type: ignore
+        vector_index: Mapped[int] = mapped_column(sqlalchemy.Integer, index=True)  # type: ignore
 
     class RealSQLMetadataStore:
         def __init__(self, path: Optional[str] = None):
@@ -193,44 +220,63 @@ try:
             RealSqlDocument.metadata.create_all(self._engine, checkfirst=True)
 
         def add_docs(self, docs: List[Document], vdb_last_index: int):
+            rows = []
             vector_id = vdb_last_index
-            with Session(self._engine) as session:
-                for doc in docs:
-                    for page_num, text in doc.pages.items():
-                        session.add(
-                            RealSqlDocument(
-                                id=doc.id,
-                                page_num=page_num,
-                                text=text,
-                                meta=doc.metadata,
-                                vector_index=vector_id,
-                            )
-                        )
-                        vector_id += 1
+            for doc in docs:
+                for page_num, text in doc.pages.items():
+                    rows.append(
+                        {
+                            "id": doc.id,
+                            "page_num": page_num,
+                            "text": text,
+                            "meta": doc.metadata,
+                            "vector_index": vector_id,
+                        }
+                    )
+                    vector_id += 1
+            if not rows:
+                return
 
+            # All pages are inserted with a single executemany and commit.
+            with Session(self._engine) as session:
+                session.execute(sqlalchemy.insert(RealSqlDocument), rows)
                 session.commit()
 
-        def get_pages_for_for_indexes(self, indexes: List[int]) -> List[Page]:
-            pages: List[Page] = []
+        def get_existing_doc_ids(self, doc_ids: List[str]) -> Set[str]:
+            """Returns which of the given documents are already stored."""
+            existing_ids: Set[str] = set()
             with Session(self._engine) as session:
-                for index in indexes:
-                    query = sqlalchemy.select(RealSqlDocument).where(
-                        RealSqlDocument.vector_index == index
-                    )
-                    sql_docs = session.execute(query)
-                    sql_doc = sql_docs.first()
-                    if sql_doc is None:
-                        continue
-                    sql_doc = sql_doc[0]
-                    pages.append(
-                        Page(
-                            PageCoordinates(sql_doc.id, sql_doc.page_num),
-                            sql_doc.text,
-                            sql_doc.meta,
+                for start in range(0, len(doc_ids), MAX_QUERY_PARAMS):
+                    query = sqlalchemy.select(RealSqlDocument.id).where(
+                        RealSqlDocument.id.in_(
+                            doc_ids[start : start + MAX_QUERY_PARAMS]
                         )
                     )
+                    existing_ids.update(session.scalars(query))
+            return existing_ids
 
-            return pages
+        def get_pages_for_for_indexes(self, indexes: List[int]) -> List[Page]:
+            """Returns the pages stored at the given vector indexes, in the
+            same order."""
+            if not indexes:
+                return []
+            with Session(self._engine) as session:
+                query = sqlalchemy.select(RealSqlDocument).where(
+                    RealSqlDocument.vector_index.in_(set(indexes))
+                )
+                sql_docs = {
+                    sql_doc.vector_index: sql_doc for sql_doc in session.scalars(query)
+                }
+
+            return [
+                Page(
+                    PageCoordinates(sql_doc.id, sql_doc.page_num),
+                    sql_doc.text,
+                    sql_doc.meta,
+                )
+                for sql_doc in (sql_docs.get(index) for index in indexes)
+                if sql_doc is not None
+            ]
 
     EphemeralDocumentStore = RealEphemeralDocumentStore
     SQLDocument = RealSqlDocument
@@ -1,19 +1,127 @@
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
 from functools import cached_property
+import hashlib
 from itertools import islice
-from typing import Callable, List, Optional
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from guardrails.utils.openai_utils import OpenAIClient
 
 
+class EmbeddingCache:
+    """Caches embeddings by a hash of the model and the embedded text.
+
+    Embeddings are kept in memory, and also in a SQLite database if a
+    path is given so they are reused across runs.
+
+    Args:
+        path: The path of the database. Embeddings are only kept in
+            memory if None.
+        max_size: The maximum number of embeddings kept in memory. The
+            least recently used embedding is evicted once it is reached.
+            The database is not bounded.
+    """
+
+    CREATE_COMMAND = """
+        CREATE TABLE IF NOT EXISTS embeddings (
+            key TEXT PRIMARY KEY,
+            embedding BLOB NOT NULL
+        );
+    """
+
+    def __init__(self, path: Optional[os.PathLike] = None, max_size: int = 1024):
+        self.path = path
+        self.max_size = max_size
+        self._embeddings: OrderedDict[str, List[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(
+                path, isolation_level=None, check_same_thread=False
+            )
+            self.db.execute("PRAGMA journal_mode = wal")
+            self.db.execute(self.CREATE_COMMAND)
+
+    @staticmethod
+    def make_key(model: Optional[str], text: str) -> str:
+        return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        with self._lock:
+            found = {
+                key: self._embeddings[key] for key in keys if key in self._embeddings
+            }
+            for key in found:
+                self._embeddings.move_to_end(key)
+            missing = [key for key in keys if key not in found]
+            if self.db is None:
+                return found
+            # Stay well under SQLite's limit on the number of parameters.
+            for start in range(0, len(missing), 500):
+                batch = missing[start : start + 500]
+                placeholders = ", ".join("?" for _ in batch)
+                rows = self.db.execute(
+                    "SELECT key, embedding FROM embeddings"
+                    f" WHERE key IN ({placeholders});",
+                    batch,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("d", blob).tolist()
+                    self._remember(key, found[key])
+        return found
+
+    def set_many(self, embeddings: Dict[str, List[float]]):
+        with self._lock:
+            for key, embedding in embeddings.items():
+                self._remember(key, embedding)
+            if self.db is not None:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?);",
+                    [
+                        (key, array("d", embedding).tobytes())
+                        for key, embedding in embeddings.items()
+                    ],
+                )
+
+    def _remember(self, key: str, embedding: List[float]):
+        self._embeddings[key] = embedding
+        self._embeddings.move_to_end(key)
+        while len(self._embeddings) > self.max_size:
+            self._embeddings.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._embeddings)
+
+
 class EmbeddingBase(ABC):
-    """Base class for embedding models."""
+    """Base class for embedding models.
+
+    Args:
+        model: The name of the model.
+        encoding_name: The tiktoken encoding texts are split into chunks
+            with.
+        max_tokens: The maximum number of tokens per chunk.
+        batch_max_tokens: The maximum number of tokens sent to the model
+            in a single request. Unbounded if None.
+        batch_max_size: The maximum number of chunks sent to the model in
+            a single request.
+        cache: Where to cache embeddings so unchanged texts are not
+            embedded again. Embeddings are not cached if None.
+    """
 
     def __init__(
         self,
         model: Optional[str] = None,
         encoding_name: Optional[str] = None,
         max_tokens: Optional[int] = None,
+        *,
+        batch_max_tokens: Optional[int] = None,
+        batch_max_size: int = 2048,
+        cache: Optional[EmbeddingCache] = None,
     ):
         try:
             import numpy  # noqa: F401
@@ -26,6 +134,9 @@ class EmbeddingBase(ABC):
         self._model = model
         self._encoding_name = encoding_name
         self._max_tokens = max_tokens
+        self._batch_max_tokens = batch_max_tokens
+        self._batch_max_size = batch_max_size
+        self._cache = cache
 
     @abstractmethod
     def embed(self, texts: List[str]) -> List[List[float]]:
@@ -37,18 +148,22 @@ class EmbeddingBase(ABC):
         """Embeds a single query and returns a vector of floats."""
         ...
 
-    def _len_safe_get_embedding(
-        self, text, embedder: Callable[[str], List[float]], average=True
-    ) -> List[float]:
-        """Gets the embedding for a text, but splits it into chunks if it is
-        too long.
-
-        Args:
-            text: Text to embed.
-            embedder: Embedding function to use.
-            average: Whether to average the embeddings of the chunks.
-        Returns:
-            List[float] Embedding of the text.
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embeds a list of queries and returns a list of vectors of
+        floats."""
+        return [self.embed_query(query) for query in queries]
+
+    def _get_embedding(self, texts: List[str]) -> List[List[float]]:
+        """Embeds a batch of texts with a single request to the model."""
+        raise NotImplementedError
+
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embeds texts that may be too long for the model.
+
+        Texts are split into chunks, and the chunks of every text are
+        embedded together in as few requests as the batch limits allow.
+        The embedding of a text is the normalized average of the
+        embeddings of its chunks.
         """
         try:
             import numpy as np
@@ -58,38 +173,107 @@ class EmbeddingBase(ABC):
                 "Please install it with `poetry add numpy`."
             )
 
-        chunk_embeddings_list = []
-        chunk_lens = []
-
-        for chunk in EmbeddingBase._chunked_tokens(
-            text=text, encoding_name=self._encoding_name, chunk_length=self._max_tokens
-        ):
-            chunk_embeddings_list.append(embedder(chunk))
-            chunk_lens.append(len(chunk))
+        text_chunks = [list(self._token_chunks(text)) for text in texts]
+        chunk_tokens: Dict[str, int] = {}
+        for chunks in text_chunks:
+            for chunk, num_tokens in chunks:
+                chunk_tokens.setdefault(chunk, num_tokens)
+        chunk_embeddings = self._embed_chunks(chunk_tokens)
 
-        if average:
-            chunk_embeddings = np.average(
-                chunk_embeddings_list, axis=0, weights=chunk_lens
+        embeddings = []
+        for chunks in text_chunks:
+            text_embedding = np.average(
+                [chunk_embeddings[chunk] for chunk, _ in chunks],
+                axis=0,
+                weights=[len(chunk) or 1 for chunk, _ in chunks],
             )
-            chunk_embeddings = chunk_embeddings / np.linalg.norm(
-                chunk_embeddings
-            )  # normalizes length to 1
-        else:
-            chunk_embeddings = np.array(chunk_embeddings_list)
-        return chunk_embeddings.flatten().tolist()
+            text_embedding = text_embedding / np.linalg.norm(text_embedding)
+            embeddings.append(text_embedding.tolist())
+        return embeddings
+
+    def _embed_query(self, query: str) -> List[float]:
+        """Embeds a single query as is, without splitting it into chunks."""
+        return self._embed_queries([query])[0]
+
+    def _embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embeds queries as is, in as few requests as the batch limits
+        allow."""
+        embeddings = self._embed_chunks(
+            {query: self._estimate_tokens(query) for query in queries}
+        )
+        return [embeddings[query] for query in queries]
+
+    def _embed_chunks(self, chunk_tokens: Dict[str, int]) -> Dict[str, List[float]]:
+        """Embeds each chunk, given with its number of tokens, once.
+
+        Chunks found in the cache are not embedded again.
+        """
+        keys = {
+            chunk: EmbeddingCache.make_key(self._model, chunk) for chunk in chunk_tokens
+        }
+        cached = (
+            self._cache.get_many(list(keys.values())) if self._cache is not None else {}
+        )
+        embeddings = {
+            chunk: cached[key] for chunk, key in keys.items() if key in cached
+        }
+
+        missing = [chunk for chunk in chunk_tokens if chunk not in embeddings]
+        for batch in self._token_batches(missing, chunk_tokens):
+            batch_embeddings = dict(zip(batch, self._get_embedding(batch)))
+            embeddings.update(batch_embeddings)
+            if self._cache is not None:
+                self._cache.set_many(
+                    {keys[chunk]: e for chunk, e in batch_embeddings.items()}
+                )
+        return embeddings
+
+    def _token_batches(
+        self, chunks: List[str], chunk_tokens: Dict[str, int]
+    ) -> Iterator[List[str]]:
+        """Packs chunks into batches within the batch limits."""
+        batch: List[str] = []
+        batch_tokens = 0
+        for chunk in chunks:
+            num_tokens = chunk_tokens[chunk]
+            if batch and (
+                len(batch) >= self._batch_max_size
+                or (
+                    self._batch_max_tokens is not None
+                    and batch_tokens + num_tokens > self._batch_max_tokens
+                )
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(chunk)
+            batch_tokens += num_tokens
+        if batch:
+            yield batch
+
+    def _token_chunks(self, text: str) -> Iterator[Tuple[str, int]]:
+        """Splits a text into chunks of at most `max_tokens` tokens, and
+        yields each with its number of tokens.
+
+        Texts are not split if there is no encoding or token limit, and
+        their number of tokens is estimated at four characters per token.
+        """
+        if self._encoding_name is None or self._max_tokens is None:
+            yield text, self._estimate_tokens(text)
+            return
 
-    @staticmethod
-    def _chunked_tokens(text, encoding_name, chunk_length):
-        """Calculates the number of tokens and chunks them into chunks of
-        tokens."""
         import tiktoken
 
-        encoding = tiktoken.get_encoding(encoding_name)
+        encoding = tiktoken.get_encoding(self._encoding_name)
         tokens = encoding.encode(text)
-        chunks_iterator = EmbeddingBase._batched(iterable=tokens, n=chunk_length)
-        # Detokenize the chunks
-        for chunk in chunks_iterator:
-            yield encoding.decode(chunk)
+        if not tokens:
+            yield text, 0
+        for chunk in EmbeddingBase._batched(iterable=tokens, n=self._max_tokens):
+            yield encoding.decode(chunk), len(chunk)
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        # Roughly four characters per token.
+        return len(text) // 4 + 1
 
     @staticmethod
     def _batched(iterable, n):
@@ -118,29 +302,42 @@ class OpenAIEmbedding(EmbeddingBase):
         max_tokens: int = 8191,
         api_key: Optional[str] = None,
         api_base: Optional[str] = None,
+        *,
+        batch_max_tokens: Optional[int] = 300000,
+        batch_max_size: int = 2048,
+        cache: Optional[EmbeddingCache] = None,
     ):
-        super().__init__(model, encoding_name, max_tokens)
+        super().__init__(
+            model,
+            encoding_name,
+            max_tokens,
+            batch_max_tokens=batch_max_tokens,
+            batch_max_size=batch_max_size,
+            cache=cache,
+        )
         self._model = model
         self.api_key = api_key
         self.api_base = api_base
 
     def embed(self, texts: List[str]) -> List[List[float]]:
-        embeddings = []
-        for text in texts:
-            embeddings.append(super()._len_safe_get_embedding(text, self.embed_query))
-
-        return embeddings
+        return self._embed_texts(texts)
 
     def embed_query(self, query: str) -> List[float]:
-        resp = self._get_embedding([query])
-        return resp[0]
+        return self._embed_query(query)
 
-    def _get_embedding(self, texts: List[str]) -> List[List[float]]:
-        client = OpenAIClient(
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        return self._embed_queries(queries)
+
+    @cached_property
+    def _client(self) -> OpenAIClient:
+        # The client is reused so its connection pool is too.
+        return OpenAIClient(
             api_key=self.api_key,
             api_base=self.api_base,
         )
-        return client.create_embedding(
+
+    def _get_embedding(self, texts: List[str]) -> List[List[float]]:
+        return self._client.create_embedding(
             model=self._model,
             input=texts,
         )
@@ -173,6 +370,10 @@ class ManifestEmbedding(EmbeddingBase):
         engine: Optional[str] = "text-embedding-ada-002",
         encoding_name: Optional[str] = "cl100k_base",
         max_tokens: Optional[int] = 8191,
+        *,
+        batch_max_tokens: Optional[int] = None,
+        batch_max_size: int = 2048,
+        cache: Optional[EmbeddingCache] = None,
     ):
         try:
             from manifest import Manifest  # type: ignore
@@ -181,7 +382,14 @@ class ManifestEmbedding(EmbeddingBase):
                 "The `manifest` package is not installed. "
                 "Install with `poetry add manifest-ml`"
             )
-        super().__init__(engine, encoding_name, max_tokens)
+        super().__init__(
+            engine,
+            encoding_name,
+            max_tokens,
+            batch_max_tokens=batch_max_tokens,
+            batch_max_size=batch_max_size,
+            cache=cache,
+        )
         self._client_name = client_name
         self._client_connection = client_connection
         self._cache_name = cache_name
@@ -198,15 +406,13 @@ class ManifestEmbedding(EmbeddingBase):
         self._manifest = Manifest(**manifest_args)
 
     def embed(self, texts: List[str]) -> List[List[float]]:
-        embeddings = []
-        for text in texts:
-            embeddings.append(super()._len_safe_get_embedding(text, self.embed_query))
-
-        return embeddings
+        return self._embed_texts(texts)
 
     def embed_query(self, query: str) -> List[float]:
-        resp = self._get_embedding([query])
-        return resp[0]
+        return self._embed_query(query)
+
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        return self._embed_queries(queries)
 
     def _get_embedding(self, texts: List[str]) -> List[List[float]]:
         embeddings = self._manifest.run(texts)
@@ -216,3 +422,54 @@ class ManifestEmbedding(EmbeddingBase):
     def output_dim(self) -> int:
         embedding = self._get_embedding(["test"])
         return len(embedding[0])
+
+
+class FakeEmbedding(EmbeddingBase):
+    """A deterministic embedding model that runs locally, for tests and
+    offline benchmarks.
+
+    Each text is embedded as a pseudo-random unit vector seeded by its
+    hash, so equal texts always get equal embeddings.
+
+    Args:
+        dim: The dimension of the embeddings.
+    """
+
+    def __init__(
+        self,
+        dim: int = 64,
+        *,
+        batch_max_tokens: Optional[int] = None,
+        batch_max_size: int = 2048,
+        cache: Optional[EmbeddingCache] = None,
+    ):
+        super().__init__(
+            f"fake-{dim}",
+            batch_max_tokens=batch_max_tokens,
+            batch_max_size=batch_max_size,
+            cache=cache,
+        )
+        self._dim = dim
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        return self._embed_texts(texts)
+
+    def embed_query(self, query: str) -> List[float]:
+        return self._embed_query(query)
+
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        return self._embed_queries(queries)
+
+    def _get_embedding(self, texts: List[str]) -> List[List[float]]:
+        import numpy as np
+
+        embeddings = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+            vector = np.random.default_rng(seed).standard_normal(self._dim)
+            embeddings.append((vector / np.linalg.norm(vector)).tolist())
+        return embeddings
+
+    @property
+    def output_dim(self) -> int:
+        return self._dim
@@ -4,6 +4,7 @@ import os
 from builtins import id as object_id
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Dict,
     Generic,
@@ -11,6 +12,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -21,6 +23,7 @@ import warnings
 from langchain_core.runnables import Runnable
 
 from guardrails_api_client import (
+    Call as ICall,
     Guard as IGuard,
     ValidatePayload,
     SimpleTypes,
@@ -35,12 +38,16 @@ from guardrails.classes.output_type import OT
 from guardrails.classes.rc import RC
 from guardrails.classes.validation.validation_result import ErrorSpan
 from guardrails.classes.validation.validation_summary import ValidationSummary
-from guardrails.classes.validation.validator_reference import ValidatorReference
+from guardrails.classes.validation.validator_reference import (
+    ValidatorReference,
+    ValidatorReferenceList,
+)
 from guardrails.classes.validation_outcome import ValidationOutcome
 from guardrails.classes.execution import GuardExecutionOptions
 from guardrails.classes.generic import Stack
 from guardrails.classes.history import Call
 from guardrails.classes.history.call_inputs import CallInputs
+from guardrails.classes.history.server_history import ServerHistory
 from guardrails.classes.output_type import OutputTypes
 from guardrails.classes.schema.processed_schema import ProcessedSchema
 from guardrails.classes.schema.model_schema import ModelSchema
@@ -55,6 +62,12 @@ from guardrails.run import Runner, StreamRunner
 from guardrails.schema.primitive_schema import primitive_to_schema
 from guardrails.schema.pydantic_schema import pydantic_model_to_schema
 from guardrails.schema.rail_schema import rail_file_to_schema, rail_string_to_schema
+from guardrails.schema.schema_cache import (
+    pydantic_key,
+    rail_file_key,
+    rail_string_key,
+    schema_cache,
+)
 from guardrails.schema.validator import SchemaValidationError, validate_json_schema
 from guardrails.stores.context import (
     Tracer,
@@ -65,6 +78,7 @@ from guardrails.stores.context import (
     set_guard_name,
     set_tracer,
     set_tracer_context,
+    set_validator_executor,
 )
 from guardrails.hub_telemetry.hub_tracing import trace
 from guardrails.types.on_fail import OnFailAction
@@ -81,7 +95,7 @@ from guardrails.utils.validator_utils import (
     parse_validator_reference,
     verify_metadata_requirements,
 )
-from guardrails.validator_base import Validator
+from guardrails.validator_base import Validator, ValidatorExecutor
 from guardrails.types import (
     UseManyValidatorTuple,
     UseManyValidatorSpec,
@@ -136,11 +150,14 @@ class Guard(IGuard, Generic[OT]):
         output_schema: Optional[Dict[str, Any]] = None,
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
+        _loaded_guard: Optional[IGuard] = None,
     ):
         """Initialize the Guard with serialized validator references and an
         output schema.
 
-        Output schema must be a valid JSON Schema.
+        Output schema must be a valid JSON Schema. `_loaded_guard` is a
+        definition already fetched from the server, so it isn't fetched
+        again.
         """
 
         _try_to_load = name is not None
@@ -161,7 +178,7 @@ class Guard(IGuard, Generic[OT]):
         model_schema = ModelSchema.from_dict(output_schema)
 
         # TODO: Support a sink for history so that it is not solely held in memory
-        history: Stack[Call] = Stack()
+        history: Stack[Call] = ServerHistory() if settings.use_server else Stack()
 
         # Super Init
         super().__init__(
@@ -193,10 +210,12 @@ class Guard(IGuard, Generic[OT]):
         ### Private ###
         self._validator_map: ValidatorMap = {}
         self._validators: List[Validator] = []
+        self._validators_state: Optional[Tuple] = None
         self._output_type: OutputTypes = OutputTypes.__from_json_schema__(output_schema)
         self._exec_opts: GuardExecutionOptions = GuardExecutionOptions()
         self._tracer: Optional[Tracer] = None
         self._tracer_context: Optional[Context] = None
+        self._validator_executor: Optional[ValidatorExecutor] = None
         self._hub_telemetry: HubTelemetry
         self._user_id: Optional[str] = None
         self._api_client: Optional[GuardrailsApiClient] = None
@@ -214,7 +233,7 @@ class Guard(IGuard, Generic[OT]):
             )
             _loaded = False
             if _try_to_load:
-                loaded_guard = self._api_client.fetch_guard(self.name)
+                loaded_guard = _loaded_guard or self._api_client.fetch_guard(self.name)
                 if loaded_guard:
                     self.id = loaded_guard.id
                     self.description = loaded_guard.description
@@ -242,6 +261,14 @@ class Guard(IGuard, Generic[OT]):
         else:
             self.configure()
 
+    @field_validator("validators")
+    @classmethod
+    def track_validator_changes(
+        cls, validators: List[ValidatorReference]
+    ) -> ValidatorReferenceList:
+        # Runs on assignment too, so in place edits of any list are counted
+        return ValidatorReferenceList(validators)
+
     @field_validator("output_schema")
     @classmethod
     def must_be_valid_json_schema(
@@ -260,6 +287,9 @@ class Guard(IGuard, Generic[OT]):
         num_reasks: Optional[int] = None,
         tracer: Optional[Tracer] = None,
         allow_metrics_collection: Optional[bool] = None,
+        speculative_input_validation: Optional[bool] = None,
+        validation_timeout: Optional[float] = None,
+        validator_executor: Optional[ValidatorExecutor] = None,
     ):
         """Configure the Guard.
 
@@ -272,9 +302,29 @@ class Guard(IGuard, Generic[OT]):
                 Guardrails to collect anonymous metrics.
                 Defaults to None, and falls back to waht is
                     set via the `guardrails configure` command.
+            speculative_input_validation (bool, optional): Whether to call
+                the LLM while the messages are being validated instead of
+                after. The response is discarded if input validation fails,
+                and the LLM is called again if input validation changes the
+                messages. Defaults to None, which leaves it unchanged.
+            validation_timeout (float, optional): The number of seconds from
+                the start of a guard call by which its validators must finish.
+                Validators still running then are stopped and their
+                `on_timeout` action applies. Defaults to None, which leaves
+                it unchanged.
+            validator_executor (Executor | "inline", optional): Where sync
+                validators without an `executor` of their own run: a thread
+                or process pool, or "inline" on the event loop's thread.
+                Defaults to None, which leaves it unchanged.
         """
         if num_reasks:
             self._set_num_reasks(num_reasks)
+        if speculative_input_validation is not None:
+            self._exec_opts.speculative_input_validation = speculative_input_validation
+        if validation_timeout is not None:
+            self._exec_opts.validation_timeout = validation_timeout
+        if validator_executor is not None:
+            self._validator_executor = validator_executor
         if tracer:
             self._set_tracer(tracer)
         self._load_rc()
@@ -327,31 +377,53 @@ class Guard(IGuard, Generic[OT]):
             # Get unique id of user from rc file
             self._user_id = settings.rc.id or ""
 
+    @staticmethod
+    def _validator_key(
+        validator_id: Optional[str],
+        on: Optional[str],
+        on_fail: Any,
+        kwargs: Optional[Dict[str, Any]],
+    ) -> Tuple:
+        """Returns a hashable key that is equal for a validator instance and
+        the references it satisfies."""
+
+        def freeze(value: Any) -> Any:
+            if isinstance(value, dict):
+                return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+            if isinstance(value, (list, tuple)):
+                return tuple(freeze(v) for v in value)
+            try:
+                hash(value)
+                return value
+            except TypeError:
+                return repr(value)
+
+        # Missing on_fail actions are the default NOOP.
+        on_fail = on_fail or OnFailAction.NOOP
+        on_fail = getattr(on_fail, "value", on_fail)
+        return (validator_id, on, on_fail, freeze(kwargs or {}))
+
     def _fill_validator_map(self):
         # dont init validators if were going to call the server
         if settings.use_server:
             return
+        existing_keys = {
+            self._validator_key(v.rail_alias, on, v.on_fail_descriptor, v.get_args())
+            for on, entry in self._validator_map.items()
+            for v in entry
+        }
         for ref in self.validators:
-            entry: List[Validator] = self._validator_map.get(ref.on, [])  # type: ignore
+            key = self._validator_key(ref.id, ref.on, ref.on_fail, ref.kwargs)
             # Check if the validator from the reference
             #   has an instance in the validator_map
-            existing_instance: Optional[Validator] = None
-            for v in entry:
-                same_id = v.rail_alias == ref.id
-                same_on_fail = v.on_fail_descriptor == ref.on_fail or (  # is default
-                    v.on_fail_descriptor == OnFailAction.NOOP and not ref.on_fail
-                )
-                same_args = v.get_args() == ref.kwargs or (  # Both are empty
-                    not v.get_args() and not ref.kwargs
-                )
-                if same_id and same_on_fail and same_args:
-                    existing_instance = v
-                    break
-            if not existing_instance:
-                validator = parse_validator_reference(ref)
-                if validator:
-                    entry.append(validator)
-                self._validator_map[ref.on] = entry  # type: ignore
+            if key in existing_keys:
+                continue
+            entry: List[Validator] = self._validator_map.get(ref.on, [])  # type: ignore
+            validator = parse_validator_reference(ref)
+            if validator:
+                entry.append(validator)
+                existing_keys.add(key)
+            self._validator_map[ref.on] = entry  # type: ignore
 
     def _fill_validators(self):
         self._validators = [
@@ -360,6 +432,30 @@ class Guard(IGuard, Generic[OT]):
             for v in v_list
         ]
 
+    def _reconcile_validators(self):
+        """Fills the validator map and list from `validators`, but only when
+        the list was reassigned or changed since the last call.
+
+        Changes to the list itself are counted by ValidatorReferenceList.
+        Fields of a reference edited in place aren't picked up; replace
+        the reference instead.
+        """
+        validators = self.validators
+        if not isinstance(validators, ValidatorReferenceList):
+            self.validators = validators  # type: ignore
+            validators = self.validators
+        state = (
+            id(validators),
+            cast(ValidatorReferenceList, validators).version,
+            id(self._validator_map),
+            settings.use_server,
+        )
+        if state == self._validators_state:
+            return
+        self._fill_validator_map()
+        self._fill_validators()
+        self._validators_state = state
+
     def _fill_exec_opts(
         self,
         *,
@@ -453,7 +549,9 @@ class Guard(IGuard, Generic[OT]):
         #   and therefore the Validators, are initialized
         cls._set_tracer(cls, tracer)  # type: ignore
 
-        schema = rail_file_to_schema(rail_file)
+        schema = schema_cache.get_or_compile(
+            rail_file_key(rail_file), lambda: rail_file_to_schema(rail_file)
+        )
         return cls._for_rail_schema(
             schema,
             rail=rail_file,
@@ -515,7 +613,9 @@ class Guard(IGuard, Generic[OT]):
         #   and therefore the Validators, are initialized
         cls._set_tracer(cls, tracer)  # type: ignore
 
-        schema = rail_string_to_schema(rail_string)
+        schema = schema_cache.get_or_compile(
+            rail_string_key(rail_string), lambda: rail_string_to_schema(rail_string)
+        )
         return cls._for_rail_schema(
             schema,
             rail=rail_string,
@@ -576,7 +676,9 @@ class Guard(IGuard, Generic[OT]):
         #   and therefore the Validators, are initialized
         cls._set_tracer(cls, tracer)  # type: ignore
 
-        schema = pydantic_model_to_schema(output_class)
+        schema = schema_cache.get_or_compile(
+            pydantic_key(output_class), lambda: pydantic_model_to_schema(output_class)
+        )
         exec_opts = GuardExecutionOptions(
             reask_messages=reask_messages,
             messages=messages,
@@ -696,10 +798,10 @@ class Guard(IGuard, Generic[OT]):
         reask_messages: Optional[List[Dict]] = None,
         metadata: Optional[Dict],
         full_schema_reask: Optional[bool] = None,
+        num_candidates: Optional[int] = None,
         **kwargs,
     ) -> Union[ValidationOutcome[OT], Iterator[ValidationOutcome[OT]]]:
-        self._fill_validator_map()
-        self._fill_validators()
+        self._reconcile_validators()
         self._fill_exec_opts(
             num_reasks=num_reasks,
             messages=messages,
@@ -726,6 +828,7 @@ class Guard(IGuard, Generic[OT]):
             messages: Optional[List[Dict]] = None,
             metadata: Optional[Dict] = None,
             full_schema_reask: Optional[bool] = None,
+            num_candidates: Optional[int] = None,
             **kwargs,
         ):
             prompt_params = prompt_params or {}
@@ -737,6 +840,7 @@ class Guard(IGuard, Generic[OT]):
             set_tracer(self._tracer)
             set_tracer_context(self._tracer_context)
             set_guard_name(self.name)
+            set_validator_executor(self._validator_executor)
 
             self._set_num_reasks(num_reasks=num_reasks)
             if self._num_reasks is None:
@@ -783,6 +887,7 @@ class Guard(IGuard, Generic[OT]):
                 messages=messages,
                 metadata=metadata,
                 full_schema_reask=full_schema_reask,
+                num_candidates=num_candidates,
                 call_log=call_log,
                 *args,
                 **kwargs,
@@ -806,6 +911,7 @@ class Guard(IGuard, Generic[OT]):
             messages=messages,
             metadata=metadata,
             full_schema_reask=full_schema_reask,
+            num_candidates=num_candidates,
             *args,
             **kwargs,
         )
@@ -820,6 +926,7 @@ class Guard(IGuard, Generic[OT]):
         num_reasks: int = 0,  # Should be defined at this point
         metadata: Dict,  # Should be defined at this point
         full_schema_reask: bool = False,  # Should be defined at this point
+        num_candidates: Optional[int] = None,
         messages: Optional[List[Dict]] = None,
         **kwargs,
     ) -> Union[ValidationOutcome[OT], Iterator[ValidationOutcome[OT]]]:
@@ -832,6 +939,9 @@ class Guard(IGuard, Generic[OT]):
             # Type suppression here? ArbitraryCallable is a subclass of PromptCallable!?
             api = self._output_formatter.wrap_callable(api)  # type: ignore
 
+        if kwargs.get("stream", False) and (num_candidates or 1) > 1:
+            raise ValueError("Multiple candidates are not supported when streaming.")
+
         # Check whether stream is set
         if kwargs.get("stream", False):
             # If stream is True, use StreamRunner
@@ -873,6 +983,7 @@ class Guard(IGuard, Generic[OT]):
                     else None
                 ),
                 exec_options=self._exec_opts,
+                num_candidates=num_candidates or 1,
             )
             call = runner(call_log=call_log, prompt_params=prompt_params)
             return ValidationOutcome[OT].from_guard_history(call)
@@ -887,6 +998,7 @@ class Guard(IGuard, Generic[OT]):
         messages: Optional[List[Dict]] = None,
         metadata: Optional[Dict] = None,
         full_schema_reask: Optional[bool] = None,
+        num_candidates: Optional[int] = None,
         **kwargs,
     ) -> Union[ValidationOutcome[OT], Iterator[ValidationOutcome[OT]]]:
         """Call the LLM and validate the output.
@@ -902,6 +1014,10 @@ class Guard(IGuard, Generic[OT]):
                                or just the incorrect values.
                                Defaults to `True` if a base model is provided,
                                `False` otherwise.
+            num_candidates: The number of completions to request on each step.
+                            They are validated concurrently and the first that
+                            passes is returned; the LLM is only reasked if
+                            every candidate fails. Defaults to 1.
 
         Returns:
             ValidationOutcome
@@ -909,7 +1025,7 @@ class Guard(IGuard, Generic[OT]):
 
         messages = messages or self._exec_opts.messages or []
 
-        if messages is not None and not len(messages):
+        if not messages and getattr(llm_api, "requires_messages", True):
             raise RuntimeError(
                 "You must provide messages. "
                 "Alternatively, you can provide messages in the Schema constructor."
@@ -927,6 +1043,7 @@ class Guard(IGuard, Generic[OT]):
             messages=messages,
             metadata=metadata,
             full_schema_reask=full_schema_reask,
+            num_candidates=num_candidates,
             **kwargs,
         )
 
@@ -1126,20 +1243,8 @@ class Guard(IGuard, Generic[OT]):
                     validation_passed=False,
                     error="The response from the server was empty!",
                 )
-            if os.environ.get("GUARD_HISTORY_ENABLED", "true").lower() == "true":
-                guard_history = self._api_client.get_history(
-                    self.name, validation_output.call_id
-                )
-                self.history.extend(
-                    [Call.from_interface(call) for call in guard_history]
-                )
-
-            validation_summaries = []
-            if self.history.last and self.history.last.iterations.last:
-                validator_logs = self.history.last.iterations.last.validator_logs
-                validation_summaries = ValidationSummary.from_validator_logs_only_fails(
-                    validator_logs
-                )
+            self._defer_server_history(validation_output.call_id)
+            validation_summaries = self._server_validation_summaries(validation_output)
 
             # TODO: See if the below statement is still true
             # Our interfaces are too different for this to work right now.
@@ -1196,17 +1301,44 @@ class Guard(IGuard, Generic[OT]):
                         validation_passed=(validation_output.validation_passed is True),
                     )
 
-            if os.environ.get("GUARD_HISTORY_ENABLED", "true").lower() == "true":
-                if validation_output:
-                    guard_history = self._api_client.get_history(
-                        self.name, validation_output.call_id
-                    )
-                    self.history.extend(
-                        [Call.from_interface(call) for call in guard_history]
-                    )
+            if validation_output:
+                self._defer_server_history(validation_output.call_id)
         else:
             raise ValueError("Guard does not have an api client!")
 
+    def _defer_server_history(
+        self,
+        call_id: Optional[str],
+        afetch: Optional[Callable[[], Awaitable[List[ICall]]]] = None,
+    ):
+        """Queues the server-side history of a call to be fetched the first
+        time `guard.history` is read, instead of after every call.
+
+        `afetch` fetches the history with an async client, for
+        `guard.history.aload()`.
+        """
+        if os.environ.get("GUARD_HISTORY_ENABLED", "true").lower() != "true":
+            return
+        api_client = self._api_client
+        if not call_id or api_client is None:
+            return
+        if not isinstance(self.history, ServerHistory):
+            self.history = ServerHistory(*self.history)
+        guard_name = self.name
+        self.history.defer(lambda: api_client.get_history(guard_name, call_id), afetch)
+
+    @staticmethod
+    def _server_validation_summaries(
+        validation_output: IValidationOutcome,
+    ) -> List[ValidationSummary]:
+        """Returns the failed validation summaries the server sent back
+        inline with the outcome."""
+        return [
+            ValidationSummary.from_dict(summary.to_dict())  # type: ignore
+            for summary in validation_output.validation_summaries or []
+            if summary.failure_reason
+        ]
+
     def _call_server(
         self,
         *args,
@@ -1352,6 +1484,13 @@ class Guard(IGuard, Generic[OT]):
         api_client = GuardrailsApiClient(api_key=api_key, base_url=base_url)
         guard = api_client.fetch_guard(name)
         if guard:
-            return Guard(name=name, base_url=base_url, api_key=api_key, *args, **kwargs)
+            return Guard(
+                name=name,
+                base_url=base_url,
+                api_key=api_key,
+                _loaded_guard=guard,
+                *args,
+                **kwargs,
+            )
 
         raise ValueError(f"Guard with name {name} not found")
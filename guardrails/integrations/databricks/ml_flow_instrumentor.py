@@ -1,3 +1,4 @@
+import copy
 from functools import wraps
 import inspect
 import sys
@@ -6,8 +7,12 @@ from typing import (
     AsyncIterator,
     Awaitable,
     Callable,
+    ContextManager,
     Coroutine,
+    Dict,
     Iterator,
+    List,
+    Optional,
     Union,
 )
 
@@ -24,10 +29,13 @@ from guardrails.telemetry.guard_tracing import (
 from guardrails.telemetry.runner_tracing import add_step_attributes, add_call_attributes
 from guardrails.telemetry.validator_tracing import add_validator_attributes
 from guardrails.classes.generic.stack import Stack
+from guardrails.classes.history.call import Call
+from guardrails.classes.history.server_history import ServerHistory
 from guardrails.classes.llm.llm_response import LLMResponse
 from guardrails.classes.history.iteration import Iteration
 from guardrails.classes.output_type import OT
 from guardrails.classes.validation_outcome import ValidationOutcome
+from guardrails.integrations.databricks.span_buffer import BufferedSpan, SpanBuffer
 from guardrails.utils.safe_get import safe_get
 
 try:
@@ -43,19 +51,88 @@ if sys.version_info.minor < 10:
     from guardrails.utils.polyfills import anext
 
 
+def _snapshot(value: Any) -> Any:
+    """Copies the parts of a traced value that change after the traced call
+    returns, so a deferred span attribute reflects the call as it was.
+
+    Iterations, LLM responses and outcomes are not changed once made, so
+    they are kept by reference.
+    """
+    if isinstance(value, Call):
+        return value.model_copy(update={"iterations": Stack(*value.iterations)})
+    if isinstance(value, (list, dict)):
+        return copy.copy(value)
+    return value
+
+
+def _last_call(history: Stack[Call]) -> Stack[Call]:
+    # Only the last call is traced; server-side calls are only fetched when
+    #   the history is read, so they aren't fetched just to trace this one.
+    if isinstance(history, ServerHistory) and history.pending:
+        return Stack()
+    last_call = history.last
+    return Stack(_snapshot(last_call)) if last_call is not None else Stack()
+
+
+def _add_validator_attributes(validator_span: Any, *args, **kwargs):
+    add_validator_attributes(*args, validator_span=validator_span, **kwargs)
+
+
 # TODO: Abstract these methods and common logic into a base class
 #   that can be extended by other instrumentors
 class MlFlowInstrumentor:
-    """Instruments Guardrails to send traces to MLFlow."""
-
-    def __init__(self, experiment_name: str):
+    """Instruments Guardrails to send traces to MLFlow.
+
+    By default spans are created and exported by MLFlow inline. With
+    `buffered=True`, spans are recorded in memory instead and exported to
+    MLFlow in batches from a background thread. Their attributes are
+    serialized there too, from snapshots taken during the guard call, so
+    neither adds latency to guard calls. Streaming guard spans still set
+    their attributes as the stream is consumed.
+
+    Args:
+        experiment_name: The MLFlow experiment to log traces to.
+        buffered: Whether to buffer spans and export them in the background.
+        sample_rate: The fraction of guard calls to trace when buffered.
+        attribute_budget: The maximum number of characters of attribute
+            values kept per span when buffered. Unlimited if None.
+        batch_size: The maximum number of traces exported at once.
+        flush_interval: The maximum number of seconds a buffered trace
+            waits before being exported.
+        max_queue_size: The maximum number of buffered traces.
+            Traces are dropped when the buffer is full.
+    """
+
+    def __init__(
+        self,
+        experiment_name: str,
+        *,
+        buffered: bool = False,
+        sample_rate: float = 1.0,
+        attribute_budget: Optional[int] = None,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+    ):
         self.experiment_name = experiment_name
+        self.experiment_id: Optional[str] = None
+        self.span_buffer: Optional[SpanBuffer] = None
+        if buffered:
+            self.span_buffer = SpanBuffer(
+                self._export_spans,
+                sample_rate=sample_rate,
+                attribute_budget=attribute_budget,
+                batch_size=batch_size,
+                flush_interval=flush_interval,
+                max_queue_size=max_queue_size,
+            )
         # Disable legacy OTEL tracing to avoid duplicate spans
         settings.disable_tracing = True
 
     def instrument(self):
         mlflow.tracing.enable()
-        mlflow.set_experiment(self.experiment_name)
+        experiment = mlflow.set_experiment(self.experiment_name)
+        self.experiment_id = getattr(experiment, "experiment_id", None)
 
         wrapped_guard_execute = self._instrument_guard(Guard._execute)
         setattr(Guard, "_execute", wrapped_guard_execute)
@@ -108,6 +185,104 @@ class MlFlowInstrumentor:
 
                 setattr(guardrails.hub, validator_name, export)  # type: ignore
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until all buffered traces are exported to MLFlow.
+
+        Returns False if the timeout expired first.
+        """
+        if self.span_buffer is None:
+            return True
+        return self.span_buffer.flush(timeout)
+
+    def _add_attributes(
+        self, span: Any, add_attributes: Callable[..., None], *args, **kwargs
+    ):
+        """Sets a span's attributes with `add_attributes(span, *args,
+        **kwargs)`.
+
+        Buffered spans snapshot the arguments instead, and the attributes
+        are serialized in the export worker.
+        """
+        if isinstance(span, BufferedSpan):
+            span.defer(
+                add_attributes,
+                *[_snapshot(arg) for arg in args],
+                **{key: _snapshot(value) for key, value in kwargs.items()},
+            )
+        else:
+            add_attributes(span, *args, **kwargs)
+
+    def _add_guard_attributes(
+        self, guard_span: Any, history: Stack[Call], result: ValidationOutcome
+    ):
+        if isinstance(guard_span, BufferedSpan):
+            # Only the last call is traced, so it's the only one kept
+            history = _last_call(history)
+        self._add_attributes(guard_span, add_guard_attributes, history, result)
+
+    def _start_span(
+        self, name: str, span_type: str, attributes: Dict[str, Any]
+    ) -> ContextManager[Any]:
+        if self.span_buffer is not None:
+            return self.span_buffer.start_span(
+                name=name, span_type=span_type, attributes=attributes
+            )
+        return mlflow.start_span(name=name, span_type=span_type, attributes=attributes)
+
+    def _get_current_span(self) -> Any:
+        if self.span_buffer is not None:
+            return self.span_buffer.get_current_span()
+        return mlflow.get_current_active_span()
+
+    def _export_spans(self, spans: List[BufferedSpan]):
+        client = mlflow.MlflowClient()
+        for span in spans:
+            root_span = client.start_trace(
+                name=span.name,
+                span_type=span.span_type,
+                attributes=span.attributes,
+                experiment_id=self.experiment_id,
+                start_time_ns=span.start_time_ns,
+            )
+            # MLFlow 2 identifies traces by request_id, MLFlow 3 by trace_id
+            trace_id = getattr(root_span, "request_id", None) or root_span.trace_id
+            for child in span.children:
+                self._export_span(client, trace_id, root_span.span_id, child)
+            client.end_trace(
+                trace_id,
+                status=self._export_status(span),
+                end_time_ns=span.end_time_ns,
+            )
+
+    def _export_span(
+        self,
+        client: "mlflow.MlflowClient",
+        trace_id: str,
+        parent_id: str,
+        span: BufferedSpan,
+    ):
+        mlflow_span = client.start_span(
+            span.name,
+            trace_id,
+            parent_id,
+            span_type=span.span_type,
+            attributes=span.attributes,
+            start_time_ns=span.start_time_ns,
+        )
+        for child in span.children:
+            self._export_span(client, trace_id, mlflow_span.span_id, child)
+        client.end_span(
+            trace_id,
+            mlflow_span.span_id,
+            status=self._export_status(span),
+            end_time_ns=span.end_time_ns,
+        )
+
+    @staticmethod
+    def _export_status(span: BufferedSpan) -> Any:
+        status = span.status
+        return status.value if isinstance(status, SpanStatusCode) else status
+
     def _instrument_guard(
         self,
         guard_execute: Callable[
@@ -118,7 +293,7 @@ class MlFlowInstrumentor:
         def _guard_execute_wrapper(
             *args, **kwargs
         ) -> Union[ValidationOutcome[OT], Iterator[ValidationOutcome[OT]]]:
-            with mlflow.start_span(
+            with self._start_span(
                 name="guardrails/guard",
                 span_type="guard",
                 attributes={
@@ -139,7 +314,7 @@ class MlFlowInstrumentor:
                         result, ValidationOutcome
                     ):
                         return trace_stream_guard(guard_span, result, history)  # type: ignore
-                    add_guard_attributes(guard_span, history, result)  # type: ignore
+                    self._add_guard_attributes(guard_span, history, result)
                     return result
                 except Exception as e:
                     guard_span.set_status(status=SpanStatusCode.ERROR)
@@ -170,7 +345,7 @@ class MlFlowInstrumentor:
             Awaitable[ValidationOutcome[OT]],
             AsyncIterator[ValidationOutcome[OT]],
         ]:
-            with mlflow.start_span(
+            with self._start_span(
                 name="guardrails/guard",
                 span_type="guard",
                 attributes={
@@ -193,7 +368,7 @@ class MlFlowInstrumentor:
                     res = result
                     if inspect.isawaitable(result):
                         res = await result
-                    add_guard_attributes(guard_span, history, res)  # type: ignore
+                    self._add_guard_attributes(guard_span, history, res)
                     return res
                 except Exception as e:
                     guard_span.set_status(status=SpanStatusCode.ERROR)
@@ -204,7 +379,7 @@ class MlFlowInstrumentor:
     def _instrument_runner_step(self, runner_step: Callable[..., Iteration]):
         @wraps(runner_step)
         def trace_step_wrapper(*args, **kwargs) -> Iteration:
-            with mlflow.start_span(
+            with self._start_span(
                 name="guardrails/guard/step",
                 span_type="step",
                 attributes={
@@ -214,11 +389,15 @@ class MlFlowInstrumentor:
             ) as step_span:
                 try:
                     response = runner_step(*args, **kwargs)
-                    add_step_attributes(step_span, response, *args, **kwargs)  # type: ignore
+                    self._add_attributes(
+                        step_span, add_step_attributes, response, *args, **kwargs
+                    )
                     return response
                 except Exception as e:
                     step_span.set_status(status=SpanStatusCode.ERROR)
-                    add_step_attributes(step_span, None, *args, **kwargs)  # type: ignore
+                    self._add_attributes(
+                        step_span, add_step_attributes, None, *args, **kwargs
+                    )
                     raise e
 
         return trace_step_wrapper
@@ -230,7 +409,7 @@ class MlFlowInstrumentor:
         def trace_stream_step_wrapper(
             *args, **kwargs
         ) -> Iterator[ValidationOutcome[OT]]:
-            with mlflow.start_span(
+            with self._start_span(
                 name="guardrails/guard/step",
                 span_type="step",
                 attributes={
@@ -255,7 +434,9 @@ class MlFlowInstrumentor:
                 finally:
                     call = safe_get(args, 8, kwargs.get("call_log", None))
                     iteration = call.iterations.last if call else None
-                    add_step_attributes(step_span, iteration, *args, **kwargs)  # type: ignore
+                    self._add_attributes(
+                        step_span, add_step_attributes, iteration, *args, **kwargs
+                    )
                     if exception:
                         raise exception
 
@@ -266,7 +447,7 @@ class MlFlowInstrumentor:
     ):
         @wraps(runner_step)
         async def trace_async_step_wrapper(*args, **kwargs) -> Iteration:
-            with mlflow.start_span(
+            with self._start_span(
                 name="guardrails/guard/step",
                 span_type="step",
                 attributes={
@@ -277,11 +458,15 @@ class MlFlowInstrumentor:
             ) as step_span:
                 try:
                     response = await runner_step(*args, **kwargs)
-                    add_step_attributes(step_span, response, *args, **kwargs)  # type: ignore
+                    self._add_attributes(
+                        step_span, add_step_attributes, response, *args, **kwargs
+                    )
                     return response
                 except Exception as e:
                     step_span.set_status(status=SpanStatusCode.ERROR)
-                    add_step_attributes(step_span, None, *args, **kwargs)  # type: ignore
+                    self._add_attributes(
+                        step_span, add_step_attributes, None, *args, **kwargs
+                    )
                     raise e
 
         return trace_async_step_wrapper
@@ -293,7 +478,7 @@ class MlFlowInstrumentor:
         async def trace_async_stream_step_wrapper(
             *args, **kwargs
         ) -> AsyncIterator[ValidationOutcome[OT]]:
-            with mlflow.start_span(
+            with self._start_span(
                 name="guardrails/guard/step",
                 span_type="step",
                 attributes={
@@ -321,7 +506,9 @@ class MlFlowInstrumentor:
                 finally:
                     call = safe_get(args, 3, kwargs.get("call_log", None))
                     iteration = call.iterations.last if call else None
-                    add_step_attributes(step_span, iteration, *args, **kwargs)  # type: ignore
+                    self._add_attributes(
+                        step_span, add_step_attributes, iteration, *args, **kwargs
+                    )
                     if exception:
                         raise exception
 
@@ -330,7 +517,7 @@ class MlFlowInstrumentor:
     def _instrument_runner_call(self, runner_call: Callable[..., LLMResponse]):
         @wraps(runner_call)
         def trace_call_wrapper(*args, **kwargs):
-            with mlflow.start_span(
+            with self._start_span(
                 name="guardrails/guard/step/call",
                 span_type="LLM",
                 attributes={
@@ -340,11 +527,15 @@ class MlFlowInstrumentor:
             ) as call_span:
                 try:
                     response = runner_call(*args, **kwargs)
-                    add_call_attributes(call_span, response, *args, **kwargs)  # type: ignore
+                    self._add_attributes(
+                        call_span, add_call_attributes, response, *args, **kwargs
+                    )
                     return response
                 except Exception as e:
                     call_span.set_status(status=SpanStatusCode.ERROR)
-                    add_call_attributes(call_span, None, *args, **kwargs)  # type: ignore
+                    self._add_attributes(
+                        call_span, add_call_attributes, None, *args, **kwargs
+                    )
                     raise e
 
         return trace_call_wrapper
@@ -354,7 +545,7 @@ class MlFlowInstrumentor:
     ):
         @wraps(runner_call)
         async def trace_async_call_wrapper(*args, **kwargs):
-            with mlflow.start_span(
+            with self._start_span(
                 name="guardrails/guard/step/call",
                 span_type="LLM",
                 attributes={
@@ -365,11 +556,15 @@ class MlFlowInstrumentor:
             ) as call_span:
                 try:
                     response = await runner_call(*args, **kwargs)
-                    add_call_attributes(call_span, response, *args, **kwargs)  # type: ignore
+                    self._add_attributes(
+                        call_span, add_call_attributes, response, *args, **kwargs
+                    )
                     return response
                 except Exception as e:
                     call_span.set_status(status=SpanStatusCode.ERROR)
-                    add_call_attributes(call_span, None, *args, **kwargs)  # type: ignore
+                    self._add_attributes(
+                        call_span, add_call_attributes, None, *args, **kwargs
+                    )
                     raise e
 
         return trace_async_call_wrapper
@@ -397,11 +592,11 @@ class MlFlowInstrumentor:
             # Skip this instrumentation in the case of async
             #  when the parent span cannot be fetched from the current context
             #  because Validator.validate is running in a ThreadPoolExecutor
-            parent_span = mlflow.get_current_active_span()
+            parent_span = self._get_current_span()
             if not parent_span:
                 return validator_validate(*args, **kwargs)
 
-            with mlflow.start_span(
+            with self._start_span(
                 name=validator_span_name,
                 span_type="validator",
                 attributes={
@@ -411,9 +606,10 @@ class MlFlowInstrumentor:
             ) as validator_span:
                 try:
                     resp = validator_validate(*args, **kwargs)
-                    add_validator_attributes(
+                    self._add_attributes(
+                        validator_span,
+                        _add_validator_attributes,
                         *args,
-                        validator_span=validator_span,  # type: ignore
                         validator_name=validator_name,
                         obj_id=obj_id,
                         on_fail_descriptor=on_fail_descriptor,
@@ -425,9 +621,10 @@ class MlFlowInstrumentor:
                     return resp
                 except Exception as e:
                     validator_span.set_status(status=SpanStatusCode.ERROR)
-                    add_validator_attributes(
+                    self._add_attributes(
+                        validator_span,
+                        _add_validator_attributes,
                         *args,
-                        validator_span=validator_span,  # type: ignore
                         validator_name=validator_name,
                         obj_id=obj_id,
                         on_fail_descriptor=on_fail_descriptor,
@@ -461,7 +658,7 @@ class MlFlowInstrumentor:
 
             validator_span_name = f"{validator_name}.validate"
 
-            with mlflow.start_span(
+            with self._start_span(
                 name=validator_span_name,
                 span_type="validator",
                 attributes={
@@ -472,9 +669,10 @@ class MlFlowInstrumentor:
             ) as validator_span:
                 try:
                     resp = await validator_async_validate(*args, **kwargs)
-                    add_validator_attributes(
+                    self._add_attributes(
+                        validator_span,
+                        _add_validator_attributes,
                         *args,
-                        validator_span=validator_span,  # type: ignore
                         validator_name=validator_name,
                         obj_id=obj_id,
                         on_fail_descriptor=on_fail_descriptor,
@@ -486,9 +684,10 @@ class MlFlowInstrumentor:
                     return resp
                 except Exception as e:
                     validator_span.set_status(status=SpanStatusCode.ERROR)
-                    add_validator_attributes(
+                    self._add_attributes(
+                        validator_span,
+                        _add_validator_attributes,
                         *args,
-                        validator_span=validator_span,  # type: ignore
                         validator_name=validator_name,
                         obj_id=obj_id,
                         on_fail_descriptor=on_fail_descriptor,
@@ -0,0 +1,286 @@
+import atexit
+from contextlib import contextmanager
+import contextvars
+import queue
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from opentelemetry import context as otel_context
+from opentelemetry.trace import INVALID_SPAN_CONTEXT, SpanContext
+
+from guardrails.logger import logger
+
+
+TRUNCATED_SUFFIX = "...[truncated]"
+
+
+def estimate_size(value: Any) -> int:
+    """Estimates the number of characters a span attribute takes up,
+    without serializing it.
+
+    Span attributes are strings, numbers, booleans, or sequences of
+    them. Numbers and booleans are counted as the digits of their
+    representation, and sequences by their items plus a separator each.
+    """
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(item) + 2 for item in value) + 2
+    if isinstance(value, (bool, int, float)):
+        return len(repr(value))
+    # MLflow serializes anything else when the span is exported,
+    #   so it's counted as a placeholder rather than serialized here.
+    return len(TRUNCATED_SUFFIX)
+
+
+class BufferedSpan:
+    """A lightweight, in-memory record of a span.
+
+    Attributes that are expensive to compute can be deferred, so they
+    are only serialized in the export worker. If an attribute budget is
+    set, string attributes are truncated once the span's budget is
+    exhausted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        span_type: str = "UNKNOWN",
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional["BufferedSpan"] = None,
+        attribute_budget: Optional[int] = None,
+    ):
+        self.name = name
+        self.span_type = span_type
+        self.parent = parent
+        self.children: List[BufferedSpan] = []
+        self.attributes: Dict[str, Any] = {}
+        self.status: Any = "OK"
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self._attribute_budget = attribute_budget
+        self._attribute_sizes: Dict[str, int] = {}
+        self._attributes_size = 0
+        self._deferred: List[
+            Tuple[contextvars.Context, Callable[..., None], tuple, dict]
+        ] = []
+        for key, value in (attributes or {}).items():
+            self.set_attribute(key, value)
+
+    def set_attribute(self, key: str, value: Any):
+        if self._attribute_budget is not None:
+            value = self._fit_to_budget(key, value)
+        self.attributes[key] = value
+
+    def set_status(self, status: Any, description: Optional[str] = None):
+        self.status = status
+
+    def defer(self, add_attributes: Callable[..., None], *args, **kwargs):
+        """Sets attributes later, with `add_attributes(span, *args,
+        **kwargs)`, when the span is exported.
+
+        The arguments are kept as they are, so they should not change
+        before the span is exported. `add_attributes` runs in a copy of the
+        current context.
+        """
+        self._deferred.append(
+            (contextvars.copy_context(), add_attributes, args, kwargs)
+        )
+
+    def resolve(self):
+        """Sets the deferred attributes of the span and its children."""
+        deferred, self._deferred = self._deferred, []
+        for context, add_attributes, args, kwargs in deferred:
+            try:
+                context.run(add_attributes, self, *args, **kwargs)
+            except Exception as e:
+                logger.debug(f"Could not add the attributes of span {self.name}: {e}")
+        for child in self.children:
+            child.resolve()
+
+    def add_event(self, *args, **kwargs):
+        pass
+
+    def is_recording(self) -> bool:
+        return self.end_time_ns is None
+
+    def get_span_context(self) -> SpanContext:
+        return INVALID_SPAN_CONTEXT
+
+    def end(self):
+        if self.end_time_ns is None:
+            self.end_time_ns = time.time_ns()
+
+    def _fit_to_budget(self, key: str, value: Any) -> Any:
+        budget = self._attribute_budget or 0
+        used = self._attributes_size - self._attribute_sizes.get(key, 0)
+        remaining = max(budget - used, 0)
+        size = estimate_size(value)
+        if size > remaining:
+            if isinstance(value, str):
+                value = value[:remaining] + TRUNCATED_SUFFIX
+            else:
+                value = TRUNCATED_SUFFIX
+            size = remaining
+        self._attribute_sizes[key] = size
+        self._attributes_size = used + size
+        return value
+
+
+class UnsampledSpan(BufferedSpan):
+    """A span that belongs to a trace that was not sampled.
+
+    Nothing set on it is kept.
+    """
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_status(self, status: Any, description: Optional[str] = None):
+        pass
+
+    def defer(self, add_attributes: Callable[..., None], *args, **kwargs):
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+
+# The current span is kept in the OTEL context since Guard carries it
+#   over into the isolated context each guard call runs in.
+CURRENT_SPAN_KEY = otel_context.create_key("guardrails-buffered-span")
+
+
+class SpanBuffer:
+    """Collects finished traces in memory and exports them in batches from
+    a background thread.
+
+    Args:
+        exporter: Called from the background thread with each batch of
+            finished root spans, once their deferred attributes are set.
+        sample_rate: The fraction of traces to record, between 0 and 1.
+        attribute_budget: The maximum number of characters of attribute
+            values kept per span. Unlimited if None.
+        batch_size: The maximum number of traces per export.
+        flush_interval: The maximum number of seconds a finished trace
+            waits before being exported.
+        max_queue_size: The maximum number of traces waiting to be
+            exported. Traces are dropped when the queue is full.
+    """
+
+    def __init__(
+        self,
+        exporter: Callable[[List[BufferedSpan]], None],
+        *,
+        sample_rate: float = 1.0,
+        attribute_budget: Optional[int] = None,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+    ):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.attribute_budget = attribute_budget
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: queue.Queue[BufferedSpan] = queue.Queue(maxsize=max_queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def get_current_span(self) -> Optional[BufferedSpan]:
+        return otel_context.get_value(CURRENT_SPAN_KEY)  # type: ignore
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        span_type: str = "UNKNOWN",
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Union[BufferedSpan, UnsampledSpan]]:
+        parent = self.get_current_span()
+        # Spans whose parent already finished start a trace of their own,
+        #   since the parent's trace may already be queued for export.
+        if parent is not None and parent.end_time_ns is not None:
+            parent = None
+
+        if isinstance(parent, UnsampledSpan) or (parent is None and not self._sample()):
+            span: BufferedSpan = UnsampledSpan(name, span_type, parent=parent)
+        else:
+            span = BufferedSpan(
+                name,
+                span_type,
+                attributes,
+                parent=parent,
+                attribute_budget=self.attribute_budget,
+            )
+            if parent is not None:
+                parent.children.append(span)
+
+        token = otel_context.attach(otel_context.set_value(CURRENT_SPAN_KEY, span))
+        try:
+            yield span
+        finally:
+            otel_context.detach(token)
+            span.end()
+            if parent is None and not isinstance(span, UnsampledSpan):
+                self._enqueue(span)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued trace is exported.
+
+        Returns False if the timeout expired first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _sample(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def _enqueue(self, span: BufferedSpan):
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+            logger.debug("The span buffer is full; dropping trace %s.", span.name)
+            return
+        self._ensure_worker()
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="guardrails-span-buffer", daemon=True
+                )
+                self._worker.start()
+                atexit.register(self.flush, self.flush_interval * 5)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                for span in batch:
+                    span.resolve()
+                self.exporter(batch)
+            except Exception as e:
+                logger.warning(f"Failed to export {len(batch)} trace(s): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
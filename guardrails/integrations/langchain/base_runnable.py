@@ -1,8 +1,19 @@
-from copy import deepcopy
-from typing import Dict, Optional, cast
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    cast,
+)
 import json
 from langchain_core.messages import BaseMessage
 from langchain_core.runnables import Runnable, RunnableConfig
+from langchain_core.runnables.config import get_executor_for_config
+from langchain_core.runnables.utils import gather_with_concurrency
 from guardrails.classes.input_type import InputType
 from guardrails.classes.output_type import OT
 
@@ -20,20 +31,185 @@ class BaseRunnable(Runnable):
             run_type="parser",
         )
 
+    async def ainvoke(
+        self,
+        input: InputType,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Optional[Any],
+    ) -> InputType:
+        return await self._acall_with_config(
+            self._aprocess_input,
+            input,
+            config,
+            run_type="parser",
+        )
+
+    def batch(
+        self,
+        inputs: List[InputType],
+        config: Optional[Union[RunnableConfig, List[RunnableConfig]]] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Optional[Any],
+    ) -> List[InputType]:
+        return self._batch_with_config(
+            self._process_inputs,
+            inputs,
+            config,
+            return_exceptions=return_exceptions,
+            run_type="parser",
+        )
+
+    async def abatch(
+        self,
+        inputs: List[InputType],
+        config: Optional[Union[RunnableConfig, List[RunnableConfig]]] = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Optional[Any],
+    ) -> List[InputType]:
+        return await self._abatch_with_config(
+            self._aprocess_inputs,
+            inputs,
+            config,
+            return_exceptions=return_exceptions,
+            run_type="parser",
+        )
+
+    def stream(
+        self,
+        input: InputType,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Optional[Any],
+    ) -> Iterator[InputType]:
+        yield from self.transform(iter([input]), config, **kwargs)
+
+    async def astream(
+        self,
+        input: InputType,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Optional[Any],
+    ) -> AsyncIterator[InputType]:
+        async def input_aiter() -> AsyncIterator[InputType]:
+            yield input
+
+        async for chunk in self.atransform(input_aiter(), config, **kwargs):
+            yield chunk
+
+    def transform(
+        self,
+        input: Iterator[InputType],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Optional[Any],
+    ) -> Iterator[InputType]:
+        yield from self._transform_stream_with_config(
+            input,
+            self._process_stream,
+            config,
+            run_type="parser",
+        )
+
+    async def atransform(
+        self,
+        input: AsyncIterator[InputType],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Optional[Any],
+    ) -> AsyncIterator[InputType]:
+        async for chunk in self._atransform_stream_with_config(
+            input,
+            self._aprocess_stream,
+            config,
+            run_type="parser",
+        ):
+            yield chunk
+
     def _process_input(self, input: InputType) -> InputType:
-        str_input = str(input.content) if isinstance(input, BaseMessage) else str(input)
+        validated_output = self._validate(self._input_text(input))
+        return self._format_output(input, validated_output)
+
+    async def _aprocess_input(self, input: InputType) -> InputType:
+        validated_output = await self._avalidate(self._input_text(input))
+        return self._format_output(input, validated_output)
+
+    def _process_inputs(
+        self, inputs: List[InputType], config: List[RunnableConfig]
+    ) -> List[Union[InputType, Exception]]:
+        def process(input: InputType) -> Union[InputType, Exception]:
+            try:
+                return self._process_input(input)
+            except Exception as e:
+                return e
+
+        if len(inputs) == 1:
+            return [process(inputs[0])]
+        # Inputs are validated at once, up to the config's max_concurrency.
+        with get_executor_for_config(config[0]) as executor:
+            return list(executor.map(process, inputs))
+
+    async def _aprocess_inputs(
+        self, inputs: List[InputType], config: List[RunnableConfig]
+    ) -> List[Union[InputType, Exception]]:
+        async def process(input: InputType) -> Union[InputType, Exception]:
+            try:
+                return await self._aprocess_input(input)
+            except Exception as e:
+                return e
+
+        return await gather_with_concurrency(
+            config[0].get("max_concurrency"), *(process(input) for input in inputs)
+        )
+
+    def _process_stream(self, input: Iterator[InputType]) -> Iterator[InputType]:
+        # The most recent message chunk is used as the template for the
+        #   validated chunks so message types and metadata are preserved.
+        last_input: List[InputType] = []
 
-        validated_output = self._validate(str_input)
+        def text_chunks() -> Iterator[str]:
+            for chunk in input:
+                last_input[:] = [chunk]
+                yield self._input_text(chunk)
 
+        for validated_output in self._validate_stream(text_chunks()):
+            yield self._format_output(last_input[-1], validated_output)
+
+    async def _aprocess_stream(
+        self, input: AsyncIterator[InputType]
+    ) -> AsyncIterator[InputType]:
+        last_input: List[InputType] = []
+
+        async def text_chunks() -> AsyncIterator[str]:
+            async for chunk in input:
+                last_input[:] = [chunk]
+                yield self._input_text(chunk)
+
+        async for validated_output in self._avalidate_stream(text_chunks()):
+            yield self._format_output(last_input[-1], validated_output)
+
+    @staticmethod
+    def _input_text(input: InputType) -> str:
+        return str(input.content) if isinstance(input, BaseMessage) else str(input)
+
+    @staticmethod
+    def _format_output(input: InputType, validated_output: OT) -> InputType:
         if isinstance(validated_output, Dict):
             validated_output = json.dumps(validated_output)
 
         if isinstance(input, BaseMessage):
-            output = deepcopy(input)
-            output.content = validated_output
+            # Only the content changes, so a shallow copy is sufficient.
+            output = input.model_copy(update={"content": validated_output})
             return cast(InputType, output)
 
         return cast(InputType, validated_output)
 
     def _validate(self, input: str) -> OT:
         raise NotImplementedError
+
+    async def _avalidate(self, input: str) -> OT:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._validate, input)
+
+    def _validate_stream(self, input: Iterator[str]) -> Iterator[OT]:
+        raise NotImplementedError
+
+    def _avalidate_stream(self, input: AsyncIterator[str]) -> AsyncIterator[OT]:
+        raise NotImplementedError
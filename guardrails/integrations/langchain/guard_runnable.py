@@ -1,8 +1,12 @@
+from typing import AsyncIterator, Iterator, Optional, Tuple
+
 from guardrails.integrations.langchain.base_runnable import BaseRunnable
+from guardrails.async_guard import AsyncGuard
 from guardrails.guard import Guard
 from guardrails.errors import ValidationError
 from guardrails.classes.output_type import OT
 from guardrails.classes.validation_outcome import ValidationOutcome
+from guardrails.llm_providers import AsyncStreamCallable, StreamCallable
 
 
 class GuardRunnable(BaseRunnable):
@@ -11,9 +15,56 @@ class GuardRunnable(BaseRunnable):
     def __init__(self, guard: Guard):
         self.name = guard.name
         self.guard = guard
+        # The guard the AsyncGuard was built from, and the AsyncGuard
+        self._async_guard_copy: Optional[Tuple[Guard, AsyncGuard]] = None
 
     def _validate(self, input: str) -> OT:
         response: ValidationOutcome[OT] = self.guard.validate(input)
+        return self._validated_output(response)
+
+    async def _avalidate(self, input: str) -> OT:
+        async_guard = self._async_guard()
+        if async_guard is None:
+            return await super()._avalidate(input)
+        response: ValidationOutcome[OT] = await async_guard.validate(input)
+        return self._validated_output(response)
+
+    def _validate_stream(self, input: Iterator[str]) -> Iterator[OT]:
+        for response in self.guard(llm_api=StreamCallable(input), stream=True):
+            yield self._validated_output(response)
+
+    async def _avalidate_stream(self, input: AsyncIterator[str]) -> AsyncIterator[OT]:
+        async_guard = self._async_guard()
+        if async_guard is None:
+            raise NotImplementedError(
+                "Async streaming is only supported for Guard and AsyncGuard."
+            )
+        responses = await async_guard(
+            llm_api=AsyncStreamCallable(input),
+            stream=True,
+        )
+        async for response in responses:  # type: ignore
+            yield self._validated_output(response)
+
+    def _async_guard(self) -> Optional[AsyncGuard]:
+        """Returns an AsyncGuard that shares its configuration and history
+        with the wrapped guard.
+
+        Returns None for Guard subclasses since they may override the
+        validation flow. The AsyncGuard is built once, so its API client and
+        connections are reused across calls.
+        """
+        if not isinstance(self.guard, AsyncGuard) and type(self.guard) is not Guard:
+            return None
+        if (
+            self._async_guard_copy is None
+            or self._async_guard_copy[0] is not self.guard
+        ):
+            self._async_guard_copy = (self.guard, AsyncGuard._from_guard(self.guard))
+        return self._async_guard_copy[1]
+
+    @staticmethod
+    def _validated_output(response: ValidationOutcome[OT]) -> OT:
         validated_output = response.validated_output
         if validated_output is None or response.validation_passed is False:
             raise ValidationError(
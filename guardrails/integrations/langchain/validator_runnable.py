@@ -1,5 +1,8 @@
+from typing import AsyncIterator, Iterator, Optional
+
 from guardrails.integrations.langchain.base_runnable import BaseRunnable
 from guardrails.validator_base import FailResult, Validator
+from guardrails.classes.validation.validation_result import ValidationResult
 from guardrails.errors import ValidationError
 
 
@@ -12,6 +15,43 @@ class ValidatorRunnable(BaseRunnable):
 
     def _validate(self, input: str) -> str:
         response = self.validator.validate(input, self.validator._metadata)
+        self._raise_on_fail(response)
+        return input
+
+    async def _avalidate(self, input: str) -> str:
+        response = await self.validator.async_validate(input, self.validator._metadata)
+        self._raise_on_fail(response)
+        return input
+
+    def _validate_stream(self, input: Iterator[str]) -> Iterator[str]:
+        metadata = self.validator._metadata
+        for chunk in input:
+            response = self.validator.validate_stream(chunk, metadata)
+            if response is not None:
+                yield self._validated_chunk(response)
+        # Validate whatever is left over once the stream is exhausted.
+        response = self.validator.validate_stream("", metadata, remainder=True)
+        if response is not None and response.validated_chunk:
+            yield self._validated_chunk(response)
+
+    async def _avalidate_stream(self, input: AsyncIterator[str]) -> AsyncIterator[str]:
+        metadata = self.validator._metadata
+        async for chunk in input:
+            response = await self.validator.async_validate_stream(chunk, metadata)
+            if response is not None:
+                yield self._validated_chunk(response)
+        response = await self.validator.async_validate_stream(
+            "", metadata, remainder=True
+        )
+        if response is not None and response.validated_chunk:
+            yield self._validated_chunk(response)
+
+    def _validated_chunk(self, response: ValidationResult) -> str:
+        self._raise_on_fail(response)
+        return response.validated_chunk
+
+    @staticmethod
+    def _raise_on_fail(response: Optional[ValidationResult]):
         if isinstance(response, FailResult):
             raise ValidationError(
                 (
@@ -19,4 +59,3 @@ class ValidatorRunnable(BaseRunnable):
                     f" {response.error_message}"
                 )
             )
-        return input
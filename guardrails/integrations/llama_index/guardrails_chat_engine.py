@@ -1,6 +1,8 @@
-from typing import Any, Optional, Dict, List
-from guardrails import Guard
+from typing import Any, AsyncIterator, Optional, Dict, Iterator, List, cast
+from guardrails import Guard, AsyncGuard
 from guardrails.errors import ValidationError
+from guardrails.classes.validation_outcome import ValidationOutcome
+from guardrails.llm_providers import AsyncStreamCallable, StreamCallable
 
 
 try:
@@ -11,7 +13,11 @@ try:
         AgentChatResponse,
         StreamingAgentChatResponse,
     )
-    from llama_index.core.base.llms.types import ChatMessage
+    from llama_index.core.base.llms.types import (
+        ChatMessage,
+        ChatResponse,
+        MessageRole,
+    )
     from llama_index.core.prompts.mixin import PromptMixinType
 except ImportError:
     raise ImportError(
@@ -32,12 +38,21 @@ class GuardrailsChatEngine(BaseChatEngine):
         self._engine = engine
         self._guard = guard
         self._guard_kwargs = guard_kwargs or {}
+        self._async_guard: Optional[AsyncGuard] = None
         super().__init__()
 
     @property
     def guard(self) -> Guard:
         return self._guard
 
+    @property
+    def async_guard(self) -> AsyncGuard:
+        """An AsyncGuard that shares its configuration and history with
+        `guard`."""
+        if self._async_guard is None:
+            self._async_guard = AsyncGuard._from_guard(self._guard)
+        return self._async_guard
+
     def engine_api(self, *, messages: List[Dict[str, str]], **kwargs) -> str:
         query = messages[0]["content"]
         chat_history = kwargs.get("chat_history", [])
@@ -75,6 +90,12 @@ class GuardrailsChatEngine(BaseChatEngine):
             raise RuntimeError(f"An error occurred during chat processing: {str(e)}")
 
     def _create_chat_response(self, validated_output) -> AGENT_CHAT_RESPONSE_TYPE:
+        return self._apply_validated_output(self._engine_response, validated_output)
+
+    @staticmethod
+    def _apply_validated_output(
+        engine_response: AGENT_CHAT_RESPONSE_TYPE, validated_output
+    ) -> AGENT_CHAT_RESPONSE_TYPE:
         if validated_output.validation_passed:
             content = validated_output.validated_output
         else:
@@ -87,41 +108,136 @@ class GuardrailsChatEngine(BaseChatEngine):
             "raw_llm_output": validated_output.raw_llm_output,
         }
 
-        if isinstance(self._engine_response, AgentChatResponse):
-            if self._engine_response.metadata is None:
-                self._engine_response.metadata = {}
-            self._engine_response.metadata.update(metadata_update)
-        elif isinstance(self._engine_response, StreamingAgentChatResponse):
+        if isinstance(engine_response, AgentChatResponse):
+            if engine_response.metadata is None:
+                engine_response.metadata = {}
+            engine_response.metadata.update(metadata_update)
+        elif isinstance(engine_response, StreamingAgentChatResponse):
             for key, value in metadata_update.items():
-                setattr(self._engine_response, key, value)
+                setattr(engine_response, key, value)
 
-        self._engine_response.response = content
-        return self._engine_response
+        engine_response.response = content
+        return engine_response
 
     async def achat(
         self, message: str, chat_history: Optional[List["ChatMessage"]] = None
-    ):
+    ) -> AGENT_CHAT_RESPONSE_TYPE:
         """Async version of chat."""
-        raise NotImplementedError(
-            "Async chat is not yet supported in the GuardrailsChatEngine."
-        )
+        if chat_history is None:
+            chat_history = []
+        # Keep the engine response local so concurrent chats don't collide.
+        engine_responses: List[AGENT_CHAT_RESPONSE_TYPE] = []
+
+        async def engine_api(*, messages: List[Dict[str, str]], **kwargs) -> str:
+            response = await self._engine.achat(
+                messages[0]["content"], kwargs.get("chat_history", [])
+            )
+            engine_responses.append(response)
+            return str(response)
+
+        try:
+            messages = [
+                {
+                    "role": "user",
+                    "content": message,
+                }
+            ]
+            validated_output = await self.async_guard(
+                llm_api=engine_api,
+                messages=messages,
+                chat_history=chat_history,
+                **self._guard_kwargs,
+            )
+            response = self._apply_validated_output(
+                engine_responses[-1], validated_output
+            )
+            if response is None:
+                raise ValueError("Failed to create a valid chat response")
+
+            return response
+        except ValidationError as e:
+            raise ValidationError(f"Validation failed: {str(e)}")
+        except Exception as e:
+            raise RuntimeError(f"An error occurred during chat processing: {str(e)}")
 
     def stream_chat(
         self, message: str, chat_history: Optional[List["ChatMessage"]] = None
-    ):
-        """Stream chat responses."""
-        raise NotImplementedError(
-            "Stream chat is not yet supported in the GuardrailsChatEngine."
+    ) -> StreamingAgentChatResponse:
+        """Stream chat responses, validating them chunk by chunk.
+
+        Raises a ValidationError while streaming if a chunk fails
+        validation.
+        """
+        if chat_history is None:
+            chat_history = []
+        response = self._engine.stream_chat(message, chat_history)
+
+        validated_outputs = self.guard(
+            llm_api=StreamCallable(response.response_gen),
+            messages=[{"role": "user", "content": message}],
+            chat_history=chat_history,
+            **{**self._guard_kwargs, "stream": True},
+        )
+
+        def chat_stream() -> Iterator[ChatResponse]:
+            content = ""
+            for validated_output in validated_outputs:
+                delta = self._validated_chunk(validated_output)
+                content += delta
+                yield ChatResponse(
+                    message=ChatMessage(role=MessageRole.ASSISTANT, content=content),
+                    delta=delta,
+                )
+
+        return StreamingAgentChatResponse(
+            chat_stream=chat_stream(),
+            sources=response.sources,
+            source_nodes=response.source_nodes,
+            is_writing_to_memory=False,
         )
 
     async def astream_chat(
         self, message: str, chat_history: Optional[List["ChatMessage"]] = None
-    ):
-        """Async stream chat responses."""
-        raise NotImplementedError(
-            "Async stream chat is not yet supported in the GuardrailsChatEngine."
+    ) -> StreamingAgentChatResponse:
+        """Async stream chat responses, validating them chunk by chunk.
+
+        Raises a ValidationError while streaming if a chunk fails
+        validation.
+        """
+        if chat_history is None:
+            chat_history = []
+        response = await self._engine.astream_chat(message, chat_history)
+
+        validated_outputs = await self.async_guard(
+            llm_api=AsyncStreamCallable(response.async_response_gen()),
+            messages=[{"role": "user", "content": message}],
+            chat_history=chat_history,
+            **{**self._guard_kwargs, "stream": True},
         )
 
+        async def achat_stream() -> AsyncIterator[ChatResponse]:
+            content = ""
+            async for validated_output in validated_outputs:  # type: ignore
+                delta = self._validated_chunk(validated_output)
+                content += delta
+                yield ChatResponse(
+                    message=ChatMessage(role=MessageRole.ASSISTANT, content=content),
+                    delta=delta,
+                )
+
+        return StreamingAgentChatResponse(
+            achat_stream=achat_stream(),
+            sources=response.sources,
+            source_nodes=response.source_nodes,
+            is_writing_to_memory=False,
+        )
+
+    @staticmethod
+    def _validated_chunk(validated_output: ValidationOutcome) -> str:
+        if not validated_output.validation_passed:
+            raise ValidationError(f"Validation failed: {validated_output.error}")
+        return cast(str, validated_output.validated_output or "")
+
     def reset(self):
         """Reset the chat history."""
         self._engine.reset()
@@ -1,7 +1,8 @@
-from typing import Any, Optional, Dict, List, cast
-from guardrails import Guard
+from typing import Any, AsyncIterator, Optional, Dict, Iterator, List, cast
+from guardrails import Guard, AsyncGuard
 from guardrails.errors import ValidationError
 from guardrails.classes.validation_outcome import ValidationOutcome
+from guardrails.llm_providers import AsyncStreamCallable, StreamCallable
 
 
 try:
@@ -37,12 +38,26 @@ class GuardrailsQueryEngine(BaseQueryEngine):
         self._engine = engine
         self._guard = guard
         self._guard_kwargs = guard_kwargs or {}
+        self._async_guard: Optional[AsyncGuard] = None
         super().__init__(callback_manager)
 
     @property
     def guard(self) -> Guard:
         return self._guard
 
+    @property
+    def async_guard(self) -> AsyncGuard:
+        """An AsyncGuard that shares its configuration and history with
+        `guard`."""
+        if self._async_guard is None:
+            self._async_guard = AsyncGuard._from_guard(self._guard)
+        return self._async_guard
+
+    @property
+    def stream(self) -> bool:
+        """Whether validated responses are streamed chunk by chunk."""
+        return bool(self._guard_kwargs.get("stream", False))
+
     def engine_api(self, *, messages: List[Dict[str, str]], **kwargs) -> str:
         query = messages[0]["content"]
         response = self._engine.query(query)
@@ -63,50 +78,159 @@ class GuardrailsQueryEngine(BaseQueryEngine):
                     "content": query_bundle.query_str,
                 }
             ]
+            if self.stream:
+                return self._stream_query(query_bundle, messages)
+
             validated_output = self.guard(
                 llm_api=self.engine_api,
                 messages=messages,
                 **self._guard_kwargs,
             )
-
-            validated_output = cast(ValidationOutcome, validated_output)
-            # self._engine_response = cast(RESPONSE_TYPE, self._engine_response)
-            if not validated_output.validation_passed:
-                raise ValidationError(f"Validation failed: {validated_output.error}")
-            self._update_response_metadata(validated_output)
-            if validated_output.validation_passed:
-                if isinstance(self._engine_response, Response):
-                    self._engine_response.response = validated_output.validated_output
-                elif isinstance(
-                    self._engine_response, (StreamingResponse, AsyncStreamingResponse)
-                ):
-                    self._engine_response.response_txt = (
-                        validated_output.validated_output
-                    )
-                elif isinstance(self._engine_response, PydanticResponse):
-                    if self._engine_response.response:
-                        import json
-
-                        json_str = (
-                            validated_output.validated_output
-                            if isinstance(validated_output.validated_output, str)
-                            else json.dumps(validated_output.validated_output)
-                        )
-                        self._engine_response.response = self._engine_response.response.__class__.model_validate_json(  # noqa: E501
-                            json_str
-                        )
-                else:
-                    raise ValueError("Unsupported response type")
+            self._apply_validated_output(
+                self._engine_response, cast(ValidationOutcome, validated_output)
+            )
         except ValidationError as e:
             raise ValidationError(f"Validation failed: {str(e)}")
         except Exception as e:
             raise RuntimeError(f"An error occurred during query processing: {str(e)}")
         return self._engine_response
 
-    def _update_response_metadata(self, validated_output):
-        if self._engine_response is None:
+    async def _aquery(self, query_bundle: "QueryBundle") -> "RESPONSE_TYPE":
+        """Async version of _query."""
+        if not isinstance(self._engine, BaseQueryEngine):
+            raise ValueError(
+                "Cannot perform query with a ChatEngine. Use achat() method instead."
+            )
+        if isinstance(query_bundle, str):
+            query_bundle = QueryBundle(query_bundle)
+        # Keep the engine response local so concurrent queries don't collide.
+        engine_responses: List[RESPONSE_TYPE] = []
+
+        async def engine_api(*, messages: List[Dict[str, str]], **kwargs) -> str:
+            response = await self._engine.aquery(messages[0]["content"])
+            engine_responses.append(response)
+            if isinstance(response, AsyncStreamingResponse):
+                return str(await response.get_response())
+            return str(response)
+
+        try:
+            messages = [
+                {
+                    "role": "user",
+                    "content": query_bundle.query_str,
+                }
+            ]
+            if self.stream:
+                return await self._astream_query(query_bundle, messages)
+
+            validated_output = await self.async_guard(
+                llm_api=engine_api,
+                messages=messages,
+                **self._guard_kwargs,
+            )
+            engine_response = engine_responses[-1]
+            self._apply_validated_output(
+                engine_response, cast(ValidationOutcome, validated_output)
+            )
+        except ValidationError as e:
+            raise ValidationError(f"Validation failed: {str(e)}")
+        except Exception as e:
+            raise RuntimeError(f"An error occurred during query processing: {str(e)}")
+        return engine_response
+
+    def _stream_query(
+        self, query_bundle: "QueryBundle", messages: List[Dict[str, str]]
+    ) -> StreamingResponse:
+        response = self._engine.query(query_bundle)
+        self._engine_response = response
+        if isinstance(response, StreamingResponse) and response.response_txt is None:
+            chunks = response.response_gen
+        else:
+            chunks = iter([str(response)])
+
+        validated_outputs = self.guard(
+            llm_api=StreamCallable(chunks),
+            messages=messages,
+            **self._guard_kwargs,
+        )
+
+        def response_gen() -> Iterator[str]:
+            for validated_output in validated_outputs:
+                yield self._validated_chunk(validated_output)
+
+        return StreamingResponse(
+            response_gen=response_gen(),
+            source_nodes=getattr(response, "source_nodes", []),
+            metadata=getattr(response, "metadata", None),
+        )
+
+    async def _astream_query(
+        self, query_bundle: "QueryBundle", messages: List[Dict[str, str]]
+    ) -> AsyncStreamingResponse:
+        response = await self._engine.aquery(query_bundle)
+
+        async def chunks() -> AsyncIterator[str]:
+            if isinstance(response, AsyncStreamingResponse):
+                async for chunk in response.async_response_gen():
+                    yield chunk
+            elif isinstance(response, StreamingResponse):
+                for chunk in response.response_gen:
+                    yield chunk
+            else:
+                yield str(response)
+
+        validated_outputs = await self.async_guard(
+            llm_api=AsyncStreamCallable(chunks()),
+            messages=messages,
+            **self._guard_kwargs,
+        )
+
+        async def response_gen() -> AsyncIterator[str]:
+            async for validated_output in validated_outputs:  # type: ignore
+                yield self._validated_chunk(validated_output)
+
+        return AsyncStreamingResponse(
+            response_gen=response_gen(),
+            source_nodes=getattr(response, "source_nodes", []),
+            metadata=getattr(response, "metadata", None),
+        )
+
+    @staticmethod
+    def _validated_chunk(validated_output: ValidationOutcome) -> str:
+        if not validated_output.validation_passed:
+            raise ValidationError(f"Validation failed: {validated_output.error}")
+        return cast(str, validated_output.validated_output or "")
+
+    def _apply_validated_output(
+        self, engine_response: RESPONSE_TYPE, validated_output: ValidationOutcome
+    ):
+        if not validated_output.validation_passed:
+            raise ValidationError(f"Validation failed: {validated_output.error}")
+        self._update_response_metadata(engine_response, validated_output)
+        if isinstance(engine_response, Response):
+            engine_response.response = validated_output.validated_output
+        elif isinstance(engine_response, (StreamingResponse, AsyncStreamingResponse)):
+            engine_response.response_txt = validated_output.validated_output
+        elif isinstance(engine_response, PydanticResponse):
+            if engine_response.response:
+                import json
+
+                json_str = (
+                    validated_output.validated_output
+                    if isinstance(validated_output.validated_output, str)
+                    else json.dumps(validated_output.validated_output)
+                )
+                engine_response.response = (
+                    engine_response.response.__class__.model_validate_json(json_str)
+                )
+        else:
+            raise ValueError("Unsupported response type")
+
+    def _update_response_metadata(
+        self, engine_response: RESPONSE_TYPE, validated_output: ValidationOutcome
+    ):
+        if engine_response is None:
             return
-        self._engine_response = cast(RESPONSE_TYPE, self._engine_response)
 
         metadata_update = {
             "validation_passed": validated_output.validation_passed,
@@ -115,13 +239,9 @@ class GuardrailsQueryEngine(BaseQueryEngine):
             "raw_llm_output": validated_output.raw_llm_output,
         }
 
-        if self._engine_response.metadata is None:
-            self._engine_response.metadata = {}
-        self._engine_response.metadata.update(metadata_update)
-
-    async def _aquery(self, query_bundle: "QueryBundle") -> "RESPONSE_TYPE":
-        """Async version of _query."""
-        return self._query(query_bundle)
+        if engine_response.metadata is None:
+            engine_response.metadata = {}
+        engine_response.metadata.update(metadata_update)
 
     def _get_prompt_modules(self) -> "PromptMixinType":
         """Get prompt modules."""
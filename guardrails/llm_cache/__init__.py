@@ -0,0 +1,21 @@
+"""For caching LLM responses across calls.
+
+llm_cache_base defines the cache interface and how requests are keyed.
+in_memory_llm_cache is a bounded LRU cache local to the process, and
+sqlite_llm_cache persists responses to a SQLite database on disk.
+
+Caching is off by default. To turn it on, set a cache on the settings:
+>>> from guardrails.settings import settings
+>>> settings.llm_cache = InMemoryLLMCache(max_size=1024, ttl=3600)
+
+Only requests with a temperature of 0 are cached, unless the cache is
+created with force=True. Custom LLM callables are keyed by their code and
+the values they close over; ones that close over objects that can't be
+keyed, like API clients, are only cached if given a `cache_namespace`.
+"""
+
+from guardrails.llm_cache.llm_cache_base import LLMCache
+from guardrails.llm_cache.in_memory_llm_cache import InMemoryLLMCache
+from guardrails.llm_cache.sqlite_llm_cache import SQLiteLLMCache
+
+__all__ = ["LLMCache", "InMemoryLLMCache", "SQLiteLLMCache"]
@@ -0,0 +1,56 @@
+from collections import OrderedDict
+import threading
+import time
+from typing import Optional, Tuple
+
+from guardrails.classes.llm.llm_response import LLMResponse
+from guardrails.llm_cache.llm_cache_base import LLMCache
+
+
+class InMemoryLLMCache(LLMCache):
+    """A thread safe LRU cache of LLM responses.
+
+    Args:
+        max_size: The maximum number of responses kept. The least
+            recently used response is evicted once it is reached.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        *,
+        ttl: Optional[float] = None,
+        force: bool = False,
+    ):
+        super().__init__(ttl=ttl, force=force)
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Tuple[Optional[float], LLMResponse]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return self._as_hit(response)
+
+    def set(self, key: str, response: LLMResponse):
+        with self._lock:
+            self._entries[key] = (self._expires_at(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
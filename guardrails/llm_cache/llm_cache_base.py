@@ -0,0 +1,119 @@
+"""llm_cache_base.py.
+
+This file defines the interface every LLM response cache implements, and
+how requests are turned into cache keys.
+"""
+
+import hashlib
+import json
+import time
+import types
+from enum import Enum
+from typing import Any, Dict, Optional, Sequence
+
+from pydantic import BaseModel
+
+from guardrails.classes.llm.llm_response import LLMResponse
+
+
+def _code_identity(code: types.CodeType) -> Dict[str, Any]:
+    return {
+        "code": hashlib.sha256(code.co_code).hexdigest(),
+        "consts": list(code.co_consts),
+        "names": list(code.co_names),
+    }
+
+
+def _function_identity(fn: types.FunctionType) -> Dict[str, Any]:
+    # Closures and lambdas share a name, so functions are told apart by
+    #   their code and the values they close over, which are the same in
+    #   every process.
+    return {
+        "function": f"{fn.__module__}.{fn.__qualname__}",
+        **_code_identity(fn.__code__),
+        "closure": [cell.cell_contents for cell in fn.__closure__ or ()],
+        "defaults": fn.__defaults__,
+        "kwdefaults": fn.__kwdefaults__,
+    }
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, types.FunctionType):
+        return _function_identity(value)
+    if isinstance(value, types.CodeType):
+        return _code_identity(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, bytes):
+        return value.hex()
+    # A repr could hold a memory address, which would give the same
+    #   request a different key in every process.
+    raise TypeError(f"{type(value).__qualname__} can't be part of a cache key")
+
+
+class LLMCache:
+    """Stores LLM responses keyed by a hash of the request that produced
+    them.
+
+    Args:
+        ttl: The number of seconds a response stays valid for.
+            Responses never expire if None.
+        force: Whether to cache responses to requests sampled with a
+            temperature above 0, which are otherwise not cached since
+            they are not expected to be reproducible.
+    """
+
+    def __init__(self, *, ttl: Optional[float] = None, force: bool = False):
+        self.ttl = ttl
+        self.force = force
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """Returns the cached response for the key, or None if there is no
+        valid one."""
+        raise NotImplementedError
+
+    def set(self, key: str, response: LLMResponse):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def is_cacheable(self, kwargs: Dict[str, Any]) -> bool:
+        """Whether the response to a request can be cached.
+
+        Requests that don't set a temperature run at the provider's
+        default, which usually samples, so only requests with a
+        temperature of 0 are cached unless `force` is set.
+        """
+        if kwargs.get("stream", False):
+            return False
+        temperature = kwargs.get("temperature")
+        return self.force or (temperature is not None and temperature <= 0)
+
+    @staticmethod
+    def make_key(namespace: Any, args: Sequence[Any], kwargs: Dict[str, Any]) -> str:
+        """Hash the request into a key that does not depend on the order of
+        the keyword arguments.
+
+        Raises a TypeError or ValueError if part of the request can't be
+        turned into the same key in every process.
+        """
+        request = json.dumps(
+            {"namespace": namespace, "args": list(args), "kwargs": kwargs},
+            sort_keys=True,
+            default=_canonical,
+        )
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def _expires_at(self) -> Optional[float]:
+        return None if self.ttl is None else time.time() + self.ttl
+
+    @staticmethod
+    def _as_hit(response: LLMResponse) -> LLMResponse:
+        return response.model_copy(update={"cache_hit": True})
@@ -0,0 +1,85 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from guardrails.classes.llm.llm_response import LLMResponse
+from guardrails.llm_cache.llm_cache_base import LLMCache
+
+
+CACHE_FILENAME = "guardrails_llm_cache.db"
+CACHE_FILE_PATH = os.environ.get(
+    "GUARDRAILS_LLM_CACHE_PATH",
+    os.path.join(tempfile.gettempdir(), CACHE_FILENAME),
+)
+
+
+class SQLiteLLMCache(LLMCache):
+    """An LLM response cache persisted to a SQLite database, so responses
+    are reused across processes and runs.
+
+    Args:
+        path: The path of the database. Defaults to a file in the
+            temporary directory, or GUARDRAILS_LLM_CACHE_PATH if set.
+    """
+
+    CREATE_COMMAND = """
+        CREATE TABLE IF NOT EXISTS llm_responses (
+            key TEXT PRIMARY KEY,
+            response TEXT NOT NULL,
+            expires_at REAL
+        );
+    """
+    SELECT_COMMAND = "SELECT response, expires_at FROM llm_responses WHERE key = ?;"
+    UPSERT_COMMAND = """
+        INSERT OR REPLACE INTO llm_responses (key, response, expires_at)
+        VALUES (?, ?, ?);
+    """
+
+    def __init__(
+        self,
+        path: Optional[os.PathLike] = None,
+        *,
+        ttl: Optional[float] = None,
+        force: bool = False,
+    ):
+        super().__init__(ttl=ttl, force=force)
+        self.path = path or CACHE_FILE_PATH
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self.db.execute("PRAGMA journal_mode = wal")
+        self.db.execute(self.CREATE_COMMAND)
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        with self._lock:
+            row = self.db.execute(self.SELECT_COMMAND, (key,)).fetchone()
+            if row is None:
+                return None
+            serialized_response, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                self.db.execute("DELETE FROM llm_responses WHERE key = ?;", (key,))
+                return None
+        return self._as_hit(LLMResponse(**json.loads(serialized_response)))
+
+    def set(self, key: str, response: LLMResponse):
+        serialized_response = json.dumps(
+            {
+                "output": response.output,
+                "prompt_token_count": response.prompt_token_count,
+                "response_token_count": response.response_token_count,
+                "candidate_outputs": response.candidate_outputs,
+            }
+        )
+        with self._lock:
+            self.db.execute(
+                self.UPSERT_COMMAND, (key, serialized_response, self._expires_at())
+            )
+
+    def clear(self):
+        with self._lock:
+            self.db.execute("DELETE FROM llm_responses;")
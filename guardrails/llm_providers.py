@@ -3,6 +3,7 @@ import asyncio
 import inspect
 from typing import (
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
@@ -28,11 +29,27 @@ from guardrails.types.inputs import MessageHistory
 
 import warnings
 
+from guardrails.settings import settings
 from guardrails.utils.safe_get import safe_get
 from guardrails.telemetry import trace_llm_call, trace_operation
 
 from guardrails.utils.prompt_utils import messages_to_prompt_string
 
+def _choice_output(choice: Any) -> str:
+    if choice.message.content is not None:
+        return choice.message.content
+    try:
+        return choice.message.function_call.arguments
+    except AttributeError:
+        try:
+            return choice.message.tool_calls[-1].function.arguments
+        except AttributeError as ae_tools:
+            raise ValueError(
+                "No message content or function"
+                " call arguments returned from OpenAI"
+            ) from ae_tools
+
+
 ###
 # Synchronous wrappers
 ###
@@ -223,20 +240,11 @@ class LiteLLMCallable(PromptCallableBase):
             )
 
         trace_operation(output_mime_type="application/json", output_value=response)
-        if response.choices[0].message.content is not None:  # type: ignore
-            output = response.choices[0].message.content  # type: ignore
-        else:
-            try:
-                output = response.choices[0].message.function_call.arguments  # type: ignore
-            except AttributeError:
-                try:
-                    choice = response.choices[0]  # type: ignore
-                    output = choice.message.tool_calls[-1].function.arguments  # type: ignore
-                except AttributeError as ae_tools:
-                    raise ValueError(
-                        "No message content or function"
-                        " call arguments returned from OpenAI"
-                    ) from ae_tools
+        output = _choice_output(response.choices[0])  # type: ignore
+        # Every choice is a candidate when several completions were requested.
+        candidate_outputs = None
+        if len(response.choices) > 1:  # type: ignore
+            candidate_outputs = [_choice_output(c) for c in response.choices]  # type: ignore
 
         completion_tokens = response.usage.completion_tokens  # type: ignore
         prompt_tokens = response.usage.prompt_tokens  # type: ignore
@@ -254,6 +262,7 @@ class LiteLLMCallable(PromptCallableBase):
             output=output,  # type: ignore
             prompt_token_count=prompt_tokens,  # type: ignore
             response_token_count=completion_tokens,  # type: ignore
+            candidate_outputs=candidate_outputs,
         )
 
 
@@ -505,11 +514,31 @@ class ArbitraryCallable(PromptCallableBase):
         )
 
 
+class StreamCallable(PromptCallableBase):
+    """Replays a stream that was produced elsewhere, e.g. by an earlier
+    step in a LangChain chain, as the streamed LLM response.
+
+    The stream is the response, so no messages are needed.
+    """
+
+    requires_messages = False
+
+    def __init__(self, stream: Iterator[str], *args, **kwargs):
+        self.stream = stream
+        super().__init__(*args, **kwargs)
+
+    def _invoke_llm(self, *args, **kwargs) -> LLMResponse:
+        return LLMResponse(output="", stream_output=self.stream)
+
+
 def get_llm_ask(
     llm_api: Optional[Callable] = None,
     *args,
     **kwargs,
 ) -> Optional[PromptCallableBase]:
+    if isinstance(llm_api, PromptCallableBase):
+        return llm_api
+
     if "temperature" not in kwargs:
         kwargs.update({"temperature": 0})
 
@@ -595,6 +624,14 @@ class AsyncPromptCallableBase(PromptCallableBase):
         raise NotImplementedError
 
     async def __call__(self, *args, **kwargs) -> LLMResponse:
+        cache_key = self._cache_key(
+            (*self.init_args, *args), {**self.init_kwargs, **kwargs}
+        )
+        if cache_key is not None:
+            cached_response = settings.llm_cache.get(cache_key)  # type: ignore
+            if cached_response is not None:
+                return cached_response
+
         try:
             result = await self.invoke_llm(
                 *self.init_args, *args, **self.init_kwargs, **kwargs
@@ -609,6 +646,9 @@ class AsyncPromptCallableBase(PromptCallableBase):
                 "The callable `fn` passed to `Guard(fn, ...)` returned"
                 f" a non-string value: {result}. {CALLABLE_FAILURE_SUFFIX}"
             )
+
+        if cache_key is not None:
+            settings.llm_cache.set(cache_key, result)  # type: ignore
         return result
 
 
@@ -693,20 +733,11 @@ class AsyncLiteLLMCallable(AsyncPromptCallableBase):
             )
 
         trace_operation(output_mime_type="application/json", output_value=response)
-        if response.choices[0].message.content is not None:  # type: ignore
-            output = response.choices[0].message.content  # type: ignore
-        else:
-            try:
-                output = response.choices[0].message.function_call.arguments  # type: ignore
-            except AttributeError:
-                try:
-                    choice = response.choices[0]  # type: ignore
-                    output = choice.message.tool_calls[-1].function.arguments  # type: ignore
-                except AttributeError as ae_tools:
-                    raise ValueError(
-                        "No message content or function"
-                        " call arguments returned from OpenAI"
-                    ) from ae_tools
+        output = _choice_output(response.choices[0])  # type: ignore
+        # Every choice is a candidate when several completions were requested.
+        candidate_outputs = None
+        if len(response.choices) > 1:  # type: ignore
+            candidate_outputs = [_choice_output(c) for c in response.choices]  # type: ignore
 
         completion_tokens = response.usage.completion_tokens  # type: ignore
         prompt_tokens = response.usage.prompt_tokens  # type: ignore
@@ -723,6 +754,7 @@ class AsyncLiteLLMCallable(AsyncPromptCallableBase):
             output=output,  # type: ignore
             prompt_token_count=prompt_tokens,  # type: ignore
             response_token_count=completion_tokens,  # type: ignore
+            candidate_outputs=candidate_outputs,
         )
 
 
@@ -859,9 +891,29 @@ class AsyncArbitraryCallable(AsyncPromptCallableBase):
         )
 
 
+class AsyncStreamCallable(AsyncPromptCallableBase):
+    """Replays an async stream that was produced elsewhere as the
+    streamed LLM response.
+
+    The stream is the response, so no messages are needed.
+    """
+
+    requires_messages = False
+
+    def __init__(self, stream: AsyncIterator[str], *args, **kwargs):
+        self.stream = stream
+        super().__init__(*args, **kwargs)
+
+    async def invoke_llm(self, *args, **kwargs) -> LLMResponse:
+        return LLMResponse(output="", async_stream_output=self.stream)
+
+
 def get_async_llm_ask(
     llm_api: Callable[..., Awaitable[Any]], *args, **kwargs
 ) -> AsyncPromptCallableBase:
+    if isinstance(llm_api, AsyncPromptCallableBase):
+        return llm_api
+
     try:
         import litellm
 
@@ -1,13 +1,12 @@
 """Class for representing a prompt entry."""
 
 import re
-from string import Template
 from typing import List, Optional
 
 import regex
 
-from guardrails.classes.templating.namespace_template import NamespaceTemplate
-from guardrails.utils.constants import constants
+from guardrails.classes.templating.compiled_template import CompiledTemplate
+from guardrails.utils.constants import constants, substitute_constants
 from guardrails.utils.templating_utils import get_template_variables
 
 
@@ -32,7 +31,7 @@ class BasePrompt:
         # FIXME: Why is this happening on init instead of on format?
         # If an output schema is provided, substitute it in the prompt.
         if output_schema or xml_output_schema:
-            self.source = Template(source).safe_substitute(
+            self.source = CompiledTemplate.compile(source).safe_substitute(
                 output_schema=output_schema, xml_output_schema=xml_output_schema
             )
         else:
@@ -58,18 +57,7 @@ class BasePrompt:
 
     def substitute_constants(self, text: str) -> str:
         """Substitute constants in the prompt."""
-        # Substitute constants by reading the constants file.
-        # Regex to extract all occurrences of ${gr.<constant_name>}
-        matches = re.findall(r"\${gr\.(\w+)}", text)
-
-        # Substitute all occurrences of ${gr.<constant_name>}
-        #   with the value of the constant.
-        for match in matches:
-            template = NamespaceTemplate(text)
-            mapping = {f"gr.{match}": constants[match]}
-            text = template.safe_substitute(**mapping)
-
-        return text
+        return substitute_constants(text)
 
     def get_prompt_variables(self) -> List[str]:
         return self.variable_names
@@ -1,8 +1,6 @@
 """Instructions to the LLM, to be passed in the prompt."""
 
-from string import Template
-
-from guardrails.utils.templating_utils import get_template_variables
+from guardrails.classes.templating.compiled_template import CompiledTemplate
 
 from .base_prompt import BasePrompt
 
@@ -27,12 +25,10 @@ class Instructions(BasePrompt):
 
     def format(self, **kwargs) -> "Instructions":
         """Format the prompt using the given keyword arguments."""
-        # Only use the keyword arguments that are present in the prompt.
-        vars = get_template_variables(self.source)
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k in vars}
+        # Only the keyword arguments that are present in the prompt are used.
+        formatted_instructions = CompiledTemplate.compile(self.source).safe_substitute(
+            **kwargs
+        )
 
         # Return another instance of the class with the formatted prompt.
-        formatted_instructions = Template(self.source).safe_substitute(
-            **filtered_kwargs
-        )
         return Instructions(formatted_instructions)
@@ -1,13 +1,10 @@
 """Class for representing a messages entry."""
 
-import re
-from string import Template
 from typing import Dict, List, Optional, Union
 
 from guardrails.prompt import Prompt, Instructions
-from guardrails.classes.templating.namespace_template import NamespaceTemplate
-from guardrails.utils.constants import constants
-from guardrails.utils.templating_utils import get_template_variables
+from guardrails.classes.templating.compiled_template import CompiledTemplate
+from guardrails.utils.constants import substitute_constants
 
 
 class Messages:
@@ -33,7 +30,9 @@ class Messages:
         if output_schema or xml_output_schema:
             for message in self._source:
                 if isinstance(message["content"], str):
-                    message["content"] = Template(message["content"]).safe_substitute(
+                    message["content"] = CompiledTemplate.compile(
+                        message["content"]
+                    ).safe_substitute(
                         output_schema=output_schema, xml_output_schema=xml_output_schema
                     )
         else:
@@ -66,12 +65,11 @@ class Messages:
                 msg_str = message["content"]
             else:
                 msg_str = message["content"]._source
-            # Only use the keyword arguments that are present in the message.
-            vars = get_template_variables(msg_str)
-            filtered_kwargs = {k: v for k, v in kwargs.items() if k in vars}
-
             # Return another instance of the class with the formatted message.
-            formatted_message = Template(msg_str).safe_substitute(**filtered_kwargs)
+            # Only the keyword arguments that are present in the message are used.
+            formatted_message = CompiledTemplate.compile(msg_str).safe_substitute(
+                **kwargs
+            )
             formatted_messages.append(
                 {"role": message["role"], "content": formatted_message}
             )
@@ -79,15 +77,4 @@ class Messages:
 
     def substitute_constants(self, text):
         """Substitute constants in the prompt."""
-        # Substitute constants by reading the constants file.
-        # Regex to extract all occurrences of ${gr.<constant_name>}
-        matches = re.findall(r"\${gr\.(\w+)}", text)
-
-        # Substitute all occurrences of ${gr.<constant_name>}
-        #   with the value of the constant.
-        for match in matches:
-            template = NamespaceTemplate(text)
-            mapping = {f"gr.{match}": constants[match]}
-            text = template.safe_substitute(**mapping)
-
-        return text
+        return substitute_constants(text)
@@ -1,8 +1,6 @@
 """The LLM prompt."""
 
-from string import Template
-
-from guardrails.utils.templating_utils import get_template_variables
+from guardrails.classes.templating.compiled_template import CompiledTemplate
 
 from .base_prompt import BasePrompt
 
@@ -18,10 +16,10 @@ class Prompt(BasePrompt):
 
     def format(self, **kwargs) -> "Prompt":
         """Format the prompt using the given keyword arguments."""
-        # Only use the keyword arguments that are present in the prompt.
-        vars = get_template_variables(self.source)
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k in vars}
+        # Only the keyword arguments that are present in the prompt are used.
+        formatted_prompt = CompiledTemplate.compile(self.source).safe_substitute(
+            **kwargs
+        )
 
         # Return another instance of the class with the formatted prompt.
-        formatted_prompt = Template(self.source).safe_substitute(**filtered_kwargs)
         return Prompt(formatted_prompt)
@@ -1,6 +1,17 @@
+import asyncio
 import copy
 from functools import partial
-from typing import Any, Dict, List, Optional, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 
 from guardrails import validator_service
@@ -8,7 +19,7 @@ from guardrails.classes.execution.guard_execution_options import GuardExecutionO
 from guardrails.classes.history import Call, Inputs, Iteration, Outputs
 from guardrails.classes.output_type import OutputTypes
 from guardrails.errors import ValidationError
-from guardrails.llm_providers import AsyncPromptCallableBase
+from guardrails.llm_providers import AsyncLiteLLMCallable, AsyncPromptCallableBase
 from guardrails.logger import set_scope
 from guardrails.run.runner import Runner
 from guardrails.run.utils import messages_source
@@ -19,7 +30,16 @@ from guardrails.types.pydantic import ModelOrListOfModels
 from guardrails.types.validator import ValidatorMap
 from guardrails.utils.exception_utils import UserFacingException
 from guardrails.classes.llm.llm_response import LLMResponse
-from guardrails.actions.reask import NonParseableReAsk, ReAsk
+from guardrails.actions.reask import (
+    NonParseableReAsk,
+    ReAsk,
+    get_ancestor_paths,
+    get_json_path,
+    get_reask_response_path,
+    get_reference_path,
+    get_response_by_path,
+    update_response_by_path,
+)
 from guardrails.telemetry import trace_async_call, trace_async_step
 
 from guardrails.constants import fail_status
@@ -42,6 +62,7 @@ class AsyncRunner(Runner):
         full_schema_reask: bool = False,
         disable_tracer: Optional[bool] = True,
         exec_options: Optional[GuardExecutionOptions] = None,
+        num_candidates: int = 1,
     ):
         super().__init__(
             output_type=output_type,
@@ -56,6 +77,7 @@ class AsyncRunner(Runner):
             full_schema_reask=full_schema_reask,
             disable_tracer=disable_tracer,
             exec_options=exec_options,
+            num_candidates=num_candidates,
         )
         self.api = api
 
@@ -76,6 +98,7 @@ class AsyncRunner(Runner):
             The Call log for this run.
         """
         prompt_params = prompt_params or {}
+        self.start_validation_deadline()
         try:
             (
                 messages,
@@ -84,6 +107,7 @@ class AsyncRunner(Runner):
                 self.messages,
                 self.output_schema,
             )
+            reask_paths, previous_output = None, None
             index = 0
             for index in range(self.num_reasks + 1):
                 # Run a single step.
@@ -95,6 +119,8 @@ class AsyncRunner(Runner):
                     output_schema=output_schema,
                     output=self.output if index == 0 else None,
                     call_log=call_log,
+                    reask_paths=reask_paths,
+                    previous_output=previous_output,
                 )
 
                 # Loop again?
@@ -102,6 +128,7 @@ class AsyncRunner(Runner):
                     break
 
                 # Get new prompt and output schema.
+                validated_output = call_log.validation_response
                 (
                     output_schema,
                     messages,
@@ -109,10 +136,14 @@ class AsyncRunner(Runner):
                     iteration.reasks,
                     output_schema,
                     parsed_output=iteration.outputs.parsed_output,
-                    validated_output=call_log.validation_response,
+                    validated_output=validated_output,
                     prompt_params=prompt_params,
                 )
 
+                # Only revalidate the reasked fields on the next step.
+                reask_paths = self.get_reask_paths(iteration.reasks)
+                previous_output = validated_output if reask_paths else None
+
         except UserFacingException as e:
             # Because Pydantic v1 doesn't respect property setters
             call_log.exception = e.original_exception
@@ -137,6 +168,8 @@ class AsyncRunner(Runner):
         messages: Optional[List[Dict]] = None,
         prompt_params: Optional[Dict] = None,
         output: Optional[str] = None,
+        reask_paths: Optional[List[List[Union[str, int]]]] = None,
+        previous_output: Optional[Union[str, List, Dict, ReAsk]] = None,
     ) -> Iteration:
         """Run a full step."""
         prompt_params = prompt_params or {}
@@ -160,6 +193,16 @@ class AsyncRunner(Runner):
             # Prepare: run pre-processing, and input validation.
             if output is not None:
                 messages = None
+                llm_response = await self.async_call(messages, api, output)
+            elif self._speculate(messages, api):
+                # Prepare and Call: run input validation alongside the API.
+                messages, llm_response = await self.async_prepare_and_call(
+                    call_log,
+                    messages=messages,  # type: ignore
+                    prompt_params=prompt_params,
+                    api=api,  # type: ignore
+                    attempt_number=index,
+                )
             else:
                 messages = await self.async_prepare(
                     call_log,
@@ -168,40 +211,28 @@ class AsyncRunner(Runner):
                     api=api,
                     attempt_number=index,
                 )
+                # Call: run the API.
+                llm_response = await self.async_call(messages, api, output)
 
             iteration.inputs.messages = messages
 
-            # Call: run the API.
-            llm_response = await self.async_call(messages, api, output)
-
             iteration.outputs.llm_response_info = llm_response
-            output = llm_response.output
-
-            # Parse: parse the output.
-            parsed_output, parsing_error = self.parse(output, output_schema)
-            if parsing_error:
-                # Parsing errors are captured and not raised
-                #   because they are recoverable
-                #   i.e. result in a reask
-                iteration.outputs.exception = parsing_error  # type: ignore  # pyright and pydantic don't agree
-                iteration.outputs.error = str(parsing_error)
-
-            iteration.outputs.parsed_output = parsed_output  # type: ignore  # pyright and pydantic don't agree
-
-            if parsing_error and isinstance(parsed_output, NonParseableReAsk):
-                reasks, _ = self.introspect(parsed_output)
+            if llm_response.candidate_outputs:
+                await self.async_process_candidates(
+                    iteration,
+                    index,
+                    output_schema,
+                    reask_paths=reask_paths,
+                    previous_output=previous_output,
+                )
             else:
-                # Validate: run output validation.
-                validated_output = await self.async_validate(
-                    iteration, index, parsed_output, output_schema
+                await self.async_process_output(
+                    iteration,
+                    index,
+                    output_schema,
+                    reask_paths=reask_paths,
+                    previous_output=previous_output,
                 )
-                iteration.outputs.validation_response = validated_output
-
-                # Introspect: inspect validated output for reasks.
-                reasks, valid_output = self.introspect(validated_output)
-                iteration.outputs.guarded_output = valid_output
-
-            iteration.outputs.reasks = reasks  # type: ignore  # pyright and pydantic don't agree
 
         except Exception as e:
             error_message = str(e)
@@ -210,6 +241,88 @@ class AsyncRunner(Runner):
             raise e
         return iteration
 
+    async def async_process_output(
+        self,
+        iteration: Iteration,
+        index: int,
+        output_schema: Dict[str, Any],
+        *,
+        reask_paths: Optional[List[List[Union[str, int]]]] = None,
+        previous_output: Optional[Union[str, List, Dict, ReAsk]] = None,
+    ) -> None:
+        """Parse, validate and introspect the LLM output of an iteration."""
+        output = iteration.outputs.llm_response_info.output  # type: ignore
+
+        # Parse: parse the output.
+        parsed_output, parsing_error = self.parse(output, output_schema)
+        if parsing_error:
+            # Parsing errors are captured and not raised
+            #   because they are recoverable
+            #   i.e. result in a reask
+            iteration.outputs.exception = parsing_error  # type: ignore  # pyright and pydantic don't agree
+            iteration.outputs.error = str(parsing_error)
+
+        iteration.outputs.parsed_output = parsed_output  # type: ignore  # pyright and pydantic don't agree
+
+        if parsing_error and isinstance(parsed_output, NonParseableReAsk):
+            reasks, _ = self.introspect(parsed_output)
+        else:
+            # Validate: run output validation.
+            if reask_paths and previous_output is not None:
+                validated_output = await self.async_revalidate(
+                    iteration,
+                    index,
+                    parsed_output,
+                    output_schema,
+                    reask_paths=reask_paths,
+                    previous_output=previous_output,
+                )
+            else:
+                validated_output = await self.async_validate(
+                    iteration, index, parsed_output, output_schema
+                )
+            iteration.outputs.validation_response = validated_output
+
+            # Introspect: inspect validated output for reasks.
+            reasks, valid_output = self.introspect(validated_output)
+            iteration.outputs.guarded_output = valid_output
+
+        iteration.outputs.reasks = reasks  # type: ignore  # pyright and pydantic don't agree
+
+    async def async_process_candidates(
+        self,
+        iteration: Iteration,
+        index: int,
+        output_schema: Dict[str, Any],
+        *,
+        reask_paths: Optional[List[List[Union[str, int]]]] = None,
+        previous_output: Optional[Union[str, List, Dict, ReAsk]] = None,
+    ) -> None:
+        """Process every candidate output concurrently and keep the outputs
+        of the best one on the iteration, and the metadata its validators
+        returned on the runner."""
+        candidates = self.candidate_iterations(iteration)
+        runners = [self.candidate_runner() for _ in candidates]
+        results = await asyncio.gather(
+            *(
+                runner.async_process_output(
+                    candidate,
+                    index,
+                    output_schema,
+                    reask_paths=reask_paths,
+                    previous_output=previous_output,
+                )
+                for runner, candidate in zip(runners, candidates)
+            ),
+            return_exceptions=True,
+        )
+        errors = [
+            result if isinstance(result, BaseException) else None for result in results
+        ]
+        selected = self.select_candidate(candidates, errors)
+        self.metadata.update(runners[selected].metadata)
+        iteration.outputs = candidates[selected].outputs
+
     # TODO: Refactor this to use inheritance and overrides
     @async_trace(name="/llm_call", origin="AsyncRunner.async_call")
     @trace_async_call
@@ -237,12 +350,34 @@ class AsyncRunner(Runner):
             )
         elif api_fn is None:
             raise ValueError("API or output must be provided.")
+        elif self.num_candidates > 1:
+            llm_response = await self.async_call_candidates(messages, api, api_fn)
         elif messages:
             llm_response = await api_fn(messages=messages_source(messages))
         else:
             llm_response = await api_fn()
         return llm_response
 
+    async def async_call_candidates(
+        self,
+        messages: Optional[List[Dict]],
+        api: Optional[AsyncPromptCallableBase],
+        api_fn: Callable[..., Awaitable[LLMResponse]],
+    ) -> LLMResponse:
+        """Request `num_candidates` completions.
+
+        LiteLLM supports this natively through `n`; any other API is
+        called once per candidate, concurrently.
+        """
+        llm_kwargs = {"messages": messages_source(messages)} if messages else {}
+        if isinstance(api, AsyncLiteLLMCallable) and "n" not in api.init_kwargs:
+            return await api_fn(n=self.num_candidates, **llm_kwargs)
+
+        responses = await asyncio.gather(
+            *(api_fn(**llm_kwargs) for _ in range(self.num_candidates))
+        )
+        return self.merge_candidates(list(responses))
+
     # TODO: Refactor this to use inheritance and overrides
     @async_trace(name="/validation", origin="AsyncRunner.async_validate")
     async def async_validate(
@@ -282,6 +417,86 @@ class AsyncRunner(Runner):
 
         return validated_output
 
+    # TODO: Refactor this to use inheritance and overrides
+    @async_trace(name="/validation", origin="AsyncRunner.async_revalidate")
+    async def async_revalidate(
+        self,
+        iteration: Iteration,
+        attempt_number: int,
+        parsed_output: Any,
+        output_schema: Dict[str, Any],
+        *,
+        reask_paths: List[List[Union[str, int]]],
+        previous_output: Any,
+        **kwargs,
+    ):
+        """Validate only the reasked fields of the output."""
+        # Break early if empty
+        if parsed_output is None:
+            return None
+
+        revalidated_output = copy.deepcopy(previous_output)
+        try:
+            # The response may only hold the reasked fields,
+            # in the shape of the pruned output they were reasked with.
+            reasked_values = [
+                get_response_by_path(
+                    parsed_output,
+                    get_reask_response_path(previous_output, parsed_output, path),
+                )
+                for path in reask_paths
+            ]
+        except (KeyError, IndexError, TypeError):
+            return await self.async_validate(
+                iteration, attempt_number, parsed_output, output_schema, **kwargs
+            )
+
+        # Check the schema of the whole output with the reasked fields in place.
+        for path, reasked_value in zip(reask_paths, reasked_values):
+            update_response_by_path(revalidated_output, path, reasked_value)
+        skeleton_reask = schema_validation(revalidated_output, output_schema, **kwargs)
+        if skeleton_reask:
+            return skeleton_reask
+
+        # Validate the reasked fields and everything beneath them.
+        for path, reasked_value in zip(reask_paths, reasked_values):
+            validated_value, _metadata = await validator_service.async_validate(
+                value=reasked_value,
+                metadata=self.metadata,
+                validator_map=self.validation_map,
+                iteration=iteration,
+                disable_tracer=self._disable_tracer,
+                path=get_json_path(path),
+                reference_path=get_reference_path(path),
+                **kwargs,
+            )
+            update_response_by_path(revalidated_output, path, validated_value)
+
+        # Then re-run the validators on their ancestors whose values changed.
+        for path in get_ancestor_paths(reask_paths):
+            reference_path = get_reference_path(path)
+            validators = self.validation_map.get(reference_path)
+            if not validators:
+                continue
+            validated_value, _metadata = await validator_service.async_validate(
+                value=get_response_by_path(revalidated_output, path),
+                metadata=self.metadata,
+                validator_map={reference_path: validators},
+                iteration=iteration,
+                disable_tracer=self._disable_tracer,
+                path=get_json_path(path),
+                reference_path=reference_path,
+                **kwargs,
+            )
+            if path:
+                update_response_by_path(revalidated_output, path, validated_value)
+            else:
+                revalidated_output = validated_value
+
+        return validator_service.post_process_validation(
+            revalidated_output, attempt_number, iteration, self.output_type
+        )
+
     # TODO: Refactor this to use inheritance and overrides
     @async_trace(name="/input_prep", origin="AsyncRunner.async_prepare")
     async def async_prepare(
@@ -311,7 +526,7 @@ class AsyncRunner(Runner):
                 attempt_number=attempt_number,
             )
 
-        else:
+        elif api.requires_messages:
             raise UserFacingException(ValueError("'messages' must be provided."))
 
         return messages
@@ -323,18 +538,71 @@ class AsyncRunner(Runner):
         prompt_params: Dict,
         attempt_number: int,
     ) -> MessageHistory:
-        formatted_messages = []
+        formatted_messages = self.format_messages(
+            messages, prompt_params, attempt_number
+        )
+
+        if "messages" in self.validation_map:
+            await self.validate_messages(call_log, formatted_messages, attempt_number)
+
+        return formatted_messages
+
+    def format_messages(
+        self,
+        messages: MessageHistory,
+        prompt_params: Dict,
+        attempt_number: int,
+    ) -> MessageHistory:
+        formatted_messages: MessageHistory = []
 
         # Format any variables in the message history with the prompt params.
+        # The Prompts themselves are never mutated and their compiled templates
+        #   are cached, so a shallow copy of each message is sufficient.
         for msg in messages:
-            msg_copy = copy.deepcopy(msg)
+            msg_copy = copy.copy(msg)
             msg_copy["content"] = msg_copy["content"].format(**prompt_params)
             formatted_messages.append(msg_copy)
+        return formatted_messages
 
-        if "messages" in self.validation_map:
-            await self.validate_messages(call_log, formatted_messages, attempt_number)
+    @async_trace(name="/input_prep", origin="AsyncRunner.async_prepare_and_call")
+    async def async_prepare_and_call(
+        self,
+        call_log: Call,
+        attempt_number: int,
+        *,
+        messages: MessageHistory,
+        prompt_params: Optional[Dict] = None,
+        api: AsyncPromptCallableBase,
+    ) -> Tuple[MessageHistory, LLMResponse]:
+        """Prepare the messages and call the LLM API while they are
+        validated.
 
-        return formatted_messages
+        The speculative call is cancelled if input validation fails, and
+        replaced with a new one if input validation changes the messages.
+
+        Returns:
+            The validated message history and the LLM response.
+        """
+        prompt_params = prompt_params or {}
+        formatted_messages = self.format_messages(
+            messages, prompt_params, attempt_number
+        )
+        # Input validation updates the messages in place,
+        #   so the speculative call gets copies of its own.
+        speculative_messages = [copy.copy(msg) for msg in formatted_messages]
+        speculative_call = asyncio.ensure_future(
+            self.async_call(speculative_messages, api)
+        )
+        try:
+            await self.validate_messages(call_log, formatted_messages, attempt_number)
+        except BaseException:
+            speculative_call.cancel()
+            raise
+
+        if messages_source(formatted_messages) != messages_source(speculative_messages):
+            speculative_call.cancel()
+            return formatted_messages, await self.async_call(formatted_messages, api)
+        return formatted_messages, await speculative_call
 
     @async_trace(name="/input_validation", origin="AsyncRunner.validate_messages")
     async def validate_messages(
@@ -12,6 +12,7 @@ from typing import (
 from guardrails.validator_service import AsyncValidatorService
 from guardrails.actions.reask import SkeletonReAsk
 from guardrails.classes import ValidationOutcome
+from guardrails.classes.generic.stream_buffer import StreamBuffer
 from guardrails.classes.history import Call, Inputs, Iteration, Outputs
 from guardrails.classes.output_type import OutputTypes
 from guardrails.llm_providers import (
@@ -39,6 +40,7 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
         self, call_log: Call, prompt_params: Optional[Dict] = None
     ) -> AsyncIterator[ValidationOutcome]:
         prompt_params = prompt_params or {}
+        self.start_validation_deadline()
 
         (
             messages,
@@ -114,7 +116,10 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
                 "the API is returning an async generator."
             )
 
-        fragment = ""
+        # Chunks are recorded once on the LLMResponse, which
+        # the history reads instead of copying the stream
+        stream_chunks = llm_response.record_stream()
+        fragment = StreamBuffer()
         parsed_fragment, validated_fragment, valid_op = None, None, None
         verified = set()
         validation_response = ""
@@ -143,13 +148,23 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
             validator_service = AsyncValidatorService(self.disable_tracer)
 
             next_exists = True
+            finished = False
             while next_exists:
                 try:
-                    chunk = await anext(stream_output)
-                    chunk_text = self.get_chunk_text(chunk, api)
-                    _ = self.is_last_chunk(chunk, api)
+                    try:
+                        chunk = await anext(stream_output)
+                        chunk_text = self.get_chunk_text(chunk, api)
+                        finished = self.is_last_chunk(chunk, api)
+                    except StopAsyncIteration:
+                        next_exists = False
+                        if finished or not fragment:
+                            break
+                        # The LLM didn't flag its last chunk, so validate
+                        # the text the validators are still accumulating
+                        chunk_text, finished = "", True
 
-                    fragment += chunk_text
+                    stream_chunks.append(chunk_text)
+                    fragment.append(chunk_text)
 
                     results = await validator_service.async_partial_validate(
                         chunk_text,
@@ -161,6 +176,7 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
                         True,
                         context=context,
                         context_vars=stream_context_vars,
+                        remainder=finished,
                     )
                     validators = self.validation_map.get("$", [])
 
@@ -213,34 +229,34 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
                                         rechecked_value=None,
                                     )  # type: ignore
 
-                            if validator_log.validator_name not in validation_progress:
-                                validation_progress[validator_log.validator_name] = ""
-
-                            validation_progress[validator_log.validator_name] += chunk
+                            validation_progress.setdefault(
+                                validator_log.validator_name, StreamBuffer()
+                            ).append(chunk)
                     # if there is an entry for every validator
                     # run a merge and emit a validation outcome
                     if (
                         len(validation_progress) == len(validators)
                         or len(validators) == 0
                     ):
+                        fragment_text = fragment.text
                         if refrain_triggered:
                             current = ""
                         else:
                             merge_chunks = []
                             for piece in validation_progress:
-                                merge_chunks.append(validation_progress[piece])
+                                merge_chunks.append(validation_progress[piece].text)
 
                             current = validator_service.multi_merge(
-                                fragment, merge_chunks
+                                fragment_text, merge_chunks
                             )
 
                         vo = ValidationOutcome(
                             call_id=call_log.id,  # type: ignore
-                            raw_llm_output=fragment,
+                            raw_llm_output=fragment_text,
                             validated_output=current,
                             validation_passed=True,
                         )
-                        fragment = ""
+                        fragment = StreamBuffer()
                         validation_progress = {}
                         refrain_triggered = False
 
@@ -264,12 +280,13 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
             if len(validation_progress) > 0:
                 merge_chunks = []
                 for piece in validation_progress:
-                    merge_chunks.append(validation_progress[piece])
+                    merge_chunks.append(validation_progress[piece].text)
 
-                current = validator_service.multi_merge(fragment, merge_chunks)
+                fragment_text = fragment.text
+                current = validator_service.multi_merge(fragment_text, merge_chunks)
                 yield ValidationOutcome(
                     call_id=call_log.id,  # type: ignore
-                    raw_llm_output=fragment,
+                    raw_llm_output=fragment_text,
                     validated_output=current,
                     validation_passed=validation_passed,
                 )
@@ -279,10 +296,14 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
                 try:
                     chunk = await anext(stream_output)
                     chunk_text = self.get_chunk_text(chunk, api)
-                    fragment += chunk_text
+                    stream_chunks.append(chunk_text)
+                    fragment.append(chunk_text)
 
+                    # A partial JSON document can only be parsed as a whole,
+                    # so the fragment is joined and re-parsed on every chunk.
+                    fragment_text = fragment.text
                     parsed_fragment, move_to_next = self.parse(
-                        fragment, output_schema, verified=verified
+                        fragment_text, output_schema, verified=verified
                     )
                     if move_to_next:
                         continue
@@ -314,11 +335,11 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
                         validation_response = cast(dict, validated_fragment)
                     yield ValidationOutcome(
                         call_id=call_log.id,  # type: ignore
-                        raw_llm_output=fragment,
+                        raw_llm_output=fragment_text,
                         validated_output=validated_fragment,
                         validation_passed=validated_fragment is not None,
                     )
-                    fragment = ""
+                    fragment = StreamBuffer()
                 except StopIteration:
                     next_exists = False
                 except StopAsyncIteration:
@@ -333,8 +354,9 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
                     token = context.run(stream_context_vars.set, {})
                     context.run(stream_context_vars.reset, token)
 
-        iteration.outputs.raw_output = fragment
+        raw_output = fragment.text
+        iteration.outputs.raw_output = raw_output
         # FIXME: Handle case where parsing continuously fails/is a reask
-        iteration.outputs.parsed_output = parsed_fragment or fragment  # type: ignore
+        iteration.outputs.parsed_output = parsed_fragment or raw_output  # type: ignore
         iteration.outputs.validation_response = validation_response
         iteration.outputs.guarded_output = valid_op
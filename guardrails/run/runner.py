@@ -1,10 +1,34 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
 import copy
+import threading
+import time
 from functools import partial
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 
 from guardrails import validator_service
-from guardrails.actions.reask import get_reask_setup
+from guardrails.actions.reask import (
+    get_ancestor_paths,
+    get_json_path,
+    get_reask_paths,
+    get_reask_response_path,
+    get_reask_setup,
+    get_reference_path,
+    get_response_by_path,
+    update_response_by_path,
+)
 from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
 from guardrails.classes.history import Call, Inputs, Iteration, Outputs
 from guardrails.classes.output_type import OutputTypes
@@ -12,9 +36,11 @@ from guardrails.constants import fail_status
 from guardrails.errors import ValidationError
 from guardrails.llm_providers import (
     AsyncPromptCallableBase,
+    LiteLLMCallable,
     PromptCallableBase,
 )
 from guardrails.logger import set_scope
+from guardrails.stores.context import set_validation_deadline
 from guardrails.prompt import Prompt
 from guardrails.prompt.messages import Messages
 from guardrails.run.utils import messages_source
@@ -37,6 +63,67 @@ from guardrails.actions.reask import NonParseableReAsk, ReAsk, introspect
 from guardrails.telemetry import trace_call, trace_step
 
 
+# Work submitted from a runner worker, e.g. the candidate calls of a
+#   speculative call, goes to a pool of its own, so a worker never waits on
+#   tasks queued behind it. Deeper work runs inline on the worker.
+_RUNNER_POOL_DEPTH = 2
+_runner_executors: Dict[int, ThreadPoolExecutor] = {}
+_runner_executor_lock = threading.Lock()
+_runner_worker = threading.local()
+
+
+def get_runner_executor(depth: int = 0) -> ThreadPoolExecutor:
+    """Returns the worker pool runners make concurrent LLM calls and
+    candidate validations on, which lives as long as the process.
+
+    Work submitted from the workers of one pool runs on the pool of the
+    next `depth`.
+    """
+    executor = _runner_executors.get(depth)
+    if executor is None:
+        with _runner_executor_lock:
+            executor = _runner_executors.get(depth)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    thread_name_prefix="guardrails-runner"
+                    + (f"-{depth}" if depth else "")
+                )
+                _runner_executors[depth] = executor
+    return executor
+
+
+def _run_on_worker(depth: int, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    previous_depth = getattr(_runner_worker, "depth", 0)
+    _runner_worker.depth = depth
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _runner_worker.depth = previous_depth
+
+
+def submit(fn: Callable[..., Any], *args, **kwargs) -> Future:
+    """Runs `fn` on the runner pools in a copy of the current context.
+
+    Work submitted from one of the pools' own workers runs on the pool
+    of the next depth, and inline once there is none left, so a worker
+    never waits on tasks queued behind it.
+    """
+    depth = getattr(_runner_worker, "depth", 0)
+    if depth >= _RUNNER_POOL_DEPTH:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+    return get_runner_executor(depth).submit(
+        contextvars.copy_context().run, _run_on_worker, depth + 1, fn, *args, **kwargs
+    )
+
+
+RunnerT = TypeVar("RunnerT", bound="Runner")
+
+
 class Runner:
     """Runner class that calls an LLM API with a prompt, and performs input and
     output validation.
@@ -52,6 +139,9 @@ class Runner:
             validation failure, defaults to 0.
         output: The output to use instead of calling the API, used in cases
             where the output is already known.
+        num_candidates: The number of completions to request from the API
+            on each step. The first candidate that passes validation is
+            kept, and the LLM is only reasked if every candidate fails.
     """
 
     # Validation Inputs
@@ -70,6 +160,7 @@ class Runner:
     output: Optional[str] = None
     num_reasks: int
     full_schema_reask: bool = False
+    num_candidates: int = 1
 
     # Internal Metrics Collection
     disable_tracer: Optional[bool] = True
@@ -93,6 +184,7 @@ class Runner:
         full_schema_reask: bool = False,
         disable_tracer: Optional[bool] = True,
         exec_options: Optional[GuardExecutionOptions] = None,
+        num_candidates: int = 1,
     ):
         # Validation Inputs
         self.output_type = output_type
@@ -130,6 +222,7 @@ class Runner:
         self.output = output
         self.num_reasks = num_reasks
         self.full_schema_reask = full_schema_reask
+        self.num_candidates = num_candidates
 
         # Internal Metrics Collection
         # Get metrics opt-out from credentials
@@ -152,6 +245,7 @@ class Runner:
             The Call log for this run.
         """
         prompt_params = prompt_params or {}
+        self.start_validation_deadline()
         try:
             # NOTE: At first glance this seems gratuitous,
             #   but these local variables are reassigned after
@@ -164,6 +258,8 @@ class Runner:
                 self.output_schema,
             )
 
+            reask_paths, previous_output = None, None
+
             index = 0
             for index in range(self.num_reasks + 1):
                 # Run a single step.
@@ -175,6 +271,8 @@ class Runner:
                     output_schema=output_schema,
                     output=self.output if index == 0 else None,
                     call_log=call_log,
+                    reask_paths=reask_paths,
+                    previous_output=previous_output,
                 )
 
                 # Loop again?
@@ -182,14 +280,19 @@ class Runner:
                     break
 
                 # Get new prompt and output schema.
+                validated_output = call_log.validation_response
                 (output_schema, messages) = self.prepare_to_loop(
                     iteration.reasks,
                     output_schema,
                     parsed_output=iteration.outputs.parsed_output,
-                    validated_output=call_log.validation_response,
+                    validated_output=validated_output,
                     prompt_params=prompt_params,
                 )
 
+                # Only revalidate the reasked fields on the next step.
+                reask_paths = self.get_reask_paths(iteration.reasks)
+                previous_output = validated_output if reask_paths else None
+
         except UserFacingException as e:
             # Because Pydantic v1 doesn't respect property setters
             call_log.exception = e.original_exception
@@ -200,6 +303,17 @@ class Runner:
             raise e
         return call_log
 
+    def start_validation_deadline(self) -> None:
+        """Start the clock on the validation timeout of this guard call.
+
+        Validators that are still running once it runs out are stopped
+        and their `on_timeout` action applies.
+        """
+        timeout = self.exec_options.validation_timeout
+        set_validation_deadline(
+            time.monotonic() + timeout if timeout is not None else None
+        )
+
     @trace(name="/step", origin="Runner.step")
     @trace_step
     def step(
@@ -212,8 +326,15 @@ class Runner:
         messages: Optional[List[Dict]] = None,
         prompt_params: Optional[Dict] = None,
         output: Optional[str] = None,
+        reask_paths: Optional[List[List[Union[str, int]]]] = None,
+        previous_output: Optional[Union[str, List, Dict, ReAsk]] = None,
     ) -> Iteration:
-        """Run a full step."""
+        """Run a full step.
+
+        If `reask_paths` and `previous_output` are provided, only the
+        reasked fields are validated and the results are spliced into
+        `previous_output`.
+        """
         prompt_params = prompt_params or {}
         inputs = Inputs(
             llm_api=api,
@@ -235,6 +356,16 @@ class Runner:
             # Prepare: run pre-processing, and input validation.
             if output is not None:
                 messages = None
+                llm_response = self.call(messages, api, output)
+            elif self._speculate(messages, api):
+                # Prepare and Call: run input validation alongside the API.
+                messages, llm_response = self.prepare_and_call(
+                    call_log,
+                    messages=messages,
+                    prompt_params=prompt_params,
+                    api=api,
+                    attempt_number=index,
+                )
             else:
                 messages = self.prepare(
                     call_log,
@@ -243,46 +374,157 @@ class Runner:
                     api=api,
                     attempt_number=index,
                 )
+                # Call: run the API.
+                llm_response = self.call(messages, api, output)
 
             iteration.inputs.messages = messages
 
-            # Call: run the API.
-            llm_response = self.call(messages, api, output)
-
             iteration.outputs.llm_response_info = llm_response
-            raw_output = llm_response.output
-
-            # Parse: parse the output.
-            parsed_output, parsing_error = self.parse(raw_output, output_schema)
-            if parsing_error or isinstance(parsed_output, ReAsk):
-                iteration.outputs.exception = parsing_error  # type: ignore
-                iteration.outputs.error = str(parsing_error)
-                iteration.outputs.reasks.append(parsed_output)  # type: ignore
+            if llm_response.candidate_outputs:
+                self.process_candidates(
+                    iteration,
+                    index,
+                    output_schema,
+                    reask_paths=reask_paths,
+                    previous_output=previous_output,
+                )
             else:
-                iteration.outputs.parsed_output = parsed_output
+                self.process_output(
+                    iteration,
+                    index,
+                    output_schema,
+                    reask_paths=reask_paths,
+                    previous_output=previous_output,
+                )
+
+        except Exception as e:
+            error_message = str(e)
+            iteration.outputs.error = error_message
+            iteration.outputs.exception = e
+            raise e
+        return iteration
+
+    def process_output(
+        self,
+        iteration: Iteration,
+        index: int,
+        output_schema: Dict[str, Any],
+        *,
+        reask_paths: Optional[List[List[Union[str, int]]]] = None,
+        previous_output: Optional[Union[str, List, Dict, ReAsk]] = None,
+    ) -> None:
+        """Parse, validate and introspect the LLM output of an iteration."""
+        raw_output = iteration.outputs.llm_response_info.output  # type: ignore
+
+        # Parse: parse the output.
+        parsed_output, parsing_error = self.parse(raw_output, output_schema)
+        if parsing_error or isinstance(parsed_output, ReAsk):
+            iteration.outputs.exception = parsing_error  # type: ignore
+            iteration.outputs.error = str(parsing_error)
+            iteration.outputs.reasks.append(parsed_output)  # type: ignore
+        else:
+            iteration.outputs.parsed_output = parsed_output
 
+        # Validate: run output validation.
+        if parsing_error and isinstance(parsed_output, NonParseableReAsk):
+            reasks, _ = self.introspect(parsed_output)
+        else:
             # Validate: run output validation.
-            if parsing_error and isinstance(parsed_output, NonParseableReAsk):
-                reasks, _ = self.introspect(parsed_output)
+            if reask_paths and previous_output is not None:
+                validated_output = self.revalidate(
+                    iteration,
+                    index,
+                    parsed_output,
+                    output_schema,
+                    reask_paths=reask_paths,
+                    previous_output=previous_output,
+                )
             else:
-                # Validate: run output validation.
                 validated_output = self.validate(
                     iteration, index, parsed_output, output_schema
                 )
-                iteration.outputs.validation_response = validated_output
+            iteration.outputs.validation_response = validated_output
 
-                # Introspect: inspect validated output for reasks.
-                reasks, valid_output = self.introspect(validated_output)
-                iteration.outputs.guarded_output = valid_output
+            # Introspect: inspect validated output for reasks.
+            reasks, valid_output = self.introspect(validated_output)
+            iteration.outputs.guarded_output = valid_output
 
-            iteration.outputs.reasks = list(reasks)
+        iteration.outputs.reasks = list(reasks)
 
-        except Exception as e:
-            error_message = str(e)
-            iteration.outputs.error = error_message
-            iteration.outputs.exception = e
-            raise e
-        return iteration
+    def process_candidates(
+        self,
+        iteration: Iteration,
+        index: int,
+        output_schema: Dict[str, Any],
+        *,
+        reask_paths: Optional[List[List[Union[str, int]]]] = None,
+        previous_output: Optional[Union[str, List, Dict, ReAsk]] = None,
+    ) -> None:
+        """Process every candidate output concurrently and keep the outputs
+        of the best one on the iteration, and the metadata its validators
+        returned on the runner."""
+        candidates = self.candidate_iterations(iteration)
+        runners = [self.candidate_runner() for _ in candidates]
+        futures = [
+            submit(
+                runner.process_output,
+                candidate,
+                index,
+                output_schema,
+                reask_paths=reask_paths,
+                previous_output=previous_output,
+            )
+            for runner, candidate in zip(runners, candidates)
+        ]
+        errors = [future.exception() for future in futures]
+        selected = self.select_candidate(candidates, errors)
+        self.metadata.update(runners[selected].metadata)
+        iteration.outputs = candidates[selected].outputs
+
+    def candidate_runner(self: RunnerT) -> RunnerT:
+        """A copy of the runner to process a candidate output with, whose
+        validators get a copy of the metadata of their own."""
+        runner = copy.copy(self)
+        runner.metadata = dict(self.metadata)
+        return runner
+
+    @staticmethod
+    def candidate_iterations(iteration: Iteration) -> List[Iteration]:
+        """Create a scratch iteration for each candidate output."""
+        llm_response = cast(LLMResponse, iteration.outputs.llm_response_info)
+        return [
+            Iteration(
+                call_id=iteration.call_id,
+                index=iteration.index,
+                inputs=iteration.inputs,
+                outputs=Outputs(
+                    llm_response_info=llm_response.model_copy(
+                        update={"output": candidate_output}
+                    )
+                ),
+            )
+            for candidate_output in llm_response.candidate_outputs or []
+        ]
+
+    @staticmethod
+    def select_candidate(
+        candidates: List[Iteration], errors: Sequence[Optional[BaseException]]
+    ) -> int:
+        """Returns the index of the first candidate that passed validation,
+        or of the one with the fewest reasks if none did.
+
+        Raises the first error if processing failed for every candidate.
+        """
+        processed = [i for i, error in enumerate(errors) if error is None]
+        if not processed:
+            raise cast(BaseException, errors[0])
+        return min(
+            processed,
+            key=lambda i: (
+                candidates[i].status == fail_status,
+                len(candidates[i].outputs.reasks),
+            ),
+        )
 
     @trace(name="/input_validation", origin="Runner.validate_messages")
     def validate_messages(
@@ -331,19 +573,32 @@ class Runner:
         messages: MessageHistory,
         prompt_params: Dict,
         attempt_number: int,
+    ) -> MessageHistory:
+        formatted_messages = self.format_messages(
+            messages, prompt_params, attempt_number
+        )
+
+        # validate messages
+        if "messages" in self.validation_map:
+            self.validate_messages(call_log, formatted_messages, attempt_number)
+
+        return formatted_messages
+
+    def format_messages(
+        self,
+        messages: MessageHistory,
+        prompt_params: Dict,
+        attempt_number: int,
     ) -> MessageHistory:
         formatted_messages: MessageHistory = []
         # Format any variables in the message history with the prompt params.
+        # The Prompts themselves are never mutated and their compiled templates
+        #   are cached, so a shallow copy of each message is sufficient.
         for msg in messages:
-            msg_copy = copy.deepcopy(msg)
+            msg_copy = copy.copy(msg)
             if attempt_number == 0:
                 msg_copy["content"] = msg_copy["content"].format(**prompt_params)
             formatted_messages.append(msg_copy)
-
-        # validate messages
-        if "messages" in self.validation_map:
-            self.validate_messages(call_log, formatted_messages, attempt_number)
-
         return formatted_messages
 
     @trace(name="/input_validation", origin="Runner.validate_prompt")
@@ -400,6 +655,62 @@ class Runner:
 
         return messages
 
+    def _speculate(
+        self,
+        messages: Optional[MessageHistory],
+        api: Optional[Union[PromptCallableBase, AsyncPromptCallableBase]],
+    ) -> bool:
+        """Whether to call the LLM while the messages are being validated."""
+        return bool(
+            self.exec_options
+            and self.exec_options.speculative_input_validation
+            and messages
+            and api is not None
+            and "messages" in self.validation_map
+        )
+
+    @trace(name="/input_prep", origin="Runner.prepare_and_call")
+    def prepare_and_call(
+        self,
+        call_log: Call,
+        attempt_number: int,
+        *,
+        messages: MessageHistory,
+        prompt_params: Optional[Dict] = None,
+        api: PromptCallableBase,
+    ) -> Tuple[MessageHistory, LLMResponse]:
+        """Prepare the messages and call the LLM API while they are
+        validated.
+
+        The speculative response is discarded if input validation fails,
+        and the API is called again if input validation changes the
+        messages.
+
+        Returns:
+            The validated message history and the LLM response.
+        """
+        prompt_params = prompt_params or {}
+        formatted_messages = self.format_messages(
+            messages, prompt_params, attempt_number
+        )
+        # Input validation updates the messages in place,
+        #   so the speculative call gets copies of its own.
+        speculative_messages = [copy.copy(msg) for msg in formatted_messages]
+
+        # A running thread cannot be interrupted, so a speculative call that
+        #   is no longer needed is left to finish and its response dropped.
+        future = submit(self.call, speculative_messages, api)
+        try:
+            self.validate_messages(call_log, formatted_messages, attempt_number)
+        except Exception:
+            future.cancel()
+            raise
+
+        if messages_source(formatted_messages) != messages_source(speculative_messages):
+            future.cancel()
+            return formatted_messages, self.call(formatted_messages, api)
+        return formatted_messages, future.result()
+
     @trace(name="/llm_call", origin="Runner.call")
     @trace_call
     def call(
@@ -426,6 +737,8 @@ class Runner:
             llm_response = LLMResponse(output=output)
         elif api_fn is None:
             raise ValueError("API or output must be provided.")
+        elif self.num_candidates > 1:
+            llm_response = self.call_candidates(messages, api, api_fn)
         elif messages:
             llm_response = api_fn(messages=messages_source(messages))
         else:
@@ -433,6 +746,41 @@ class Runner:
 
         return llm_response
 
+    def call_candidates(
+        self,
+        messages: Optional[MessageHistory],
+        api: Optional[PromptCallableBase],
+        api_fn: Callable[..., LLMResponse],
+    ) -> LLMResponse:
+        """Request `num_candidates` completions.
+
+        LiteLLM supports this natively through `n`; any other API is
+        called once per candidate, concurrently.
+        """
+        llm_kwargs = {"messages": messages_source(messages)} if messages else {}
+        if isinstance(api, LiteLLMCallable) and "n" not in api.init_kwargs:
+            return api_fn(n=self.num_candidates, **llm_kwargs)
+
+        futures = [submit(api_fn, **llm_kwargs) for _ in range(self.num_candidates)]
+        responses = [future.result() for future in futures]
+        return self.merge_candidates(responses)
+
+    @staticmethod
+    def merge_candidates(responses: List[LLMResponse]) -> LLMResponse:
+        """Merge the responses of several calls into a single response whose
+        candidates are their outputs."""
+
+        def total(counts: List[Optional[int]]) -> Optional[int]:
+            known_counts = [count for count in counts if count is not None]
+            return sum(known_counts) if known_counts else None
+
+        return LLMResponse(
+            output=responses[0].output,
+            prompt_token_count=total([r.prompt_token_count for r in responses]),
+            response_token_count=total([r.response_token_count for r in responses]),
+            candidate_outputs=[r.output for r in responses],
+        )
+
     def parse(self, output: str, output_schema: Dict[str, Any], **kwargs):
         parsed_output, error = parse_llm_output(output, self.output_type, **kwargs)
         if parsed_output and not error and not isinstance(parsed_output, ReAsk):
@@ -479,6 +827,93 @@ class Runner:
 
         return validated_output
 
+    @trace(name="/validation", origin="Runner.revalidate")
+    def revalidate(
+        self,
+        iteration: Iteration,
+        attempt_number: int,
+        parsed_output: Any,
+        output_schema: Dict[str, Any],
+        *,
+        reask_paths: List[List[Union[str, int]]],
+        previous_output: Any,
+        **kwargs,
+    ):
+        """Validate only the reasked fields of the output.
+
+        The reasked fields are read from the pruned response, spliced into
+        the previously validated output and validated, then any validators
+        on their ancestors are run against the updated values. Falls back
+        to a full validation if the reasked fields cannot be found.
+        """
+        # Break early if empty
+        if parsed_output is None:
+            return None
+
+        revalidated_output = copy.deepcopy(previous_output)
+        try:
+            # The response may only hold the reasked fields,
+            # in the shape of the pruned output they were reasked with.
+            reasked_values = [
+                get_response_by_path(
+                    parsed_output,
+                    get_reask_response_path(previous_output, parsed_output, path),
+                )
+                for path in reask_paths
+            ]
+        except (KeyError, IndexError, TypeError):
+            return self.validate(
+                iteration, attempt_number, parsed_output, output_schema, **kwargs
+            )
+
+        # Check the schema of the whole output with the reasked fields in place.
+        for path, reasked_value in zip(reask_paths, reasked_values):
+            update_response_by_path(revalidated_output, path, reasked_value)
+        skeleton_reask = schema_validation(revalidated_output, output_schema, **kwargs)
+        if skeleton_reask:
+            return skeleton_reask
+
+        # Validate the reasked fields and everything beneath them.
+        for path, reasked_value in zip(reask_paths, reasked_values):
+            validated_value, metadata = validator_service.validate(
+                value=reasked_value,
+                metadata=self.metadata,
+                validator_map=self.validation_map,
+                iteration=iteration,
+                disable_tracer=self._disable_tracer,
+                path=get_json_path(path),
+                reference_path=get_reference_path(path),
+                **kwargs,
+            )
+            self.metadata.update(metadata)
+            update_response_by_path(revalidated_output, path, validated_value)
+
+        # Then re-run the validators on their ancestors whose values changed.
+        for path in get_ancestor_paths(reask_paths):
+            reference_path = get_reference_path(path)
+            validators = self.validation_map.get(reference_path)
+            if not validators:
+                continue
+            validated_value, metadata = validator_service.validate(
+                value=get_response_by_path(revalidated_output, path),
+                metadata=self.metadata,
+                validator_map={reference_path: validators},
+                iteration=iteration,
+                disable_tracer=self._disable_tracer,
+                path=get_json_path(path),
+                reference_path=reference_path,
+                **kwargs,
+            )
+            self.metadata.update(metadata)
+            if path:
+                update_response_by_path(revalidated_output, path, validated_value)
+            else:
+                revalidated_output = validated_value
+
+        return validator_service.post_process_validation(
+            revalidated_output, attempt_number, iteration, self.output_type
+        )
+
     def introspect(
         self,
         validated_output: Any,
@@ -490,6 +925,17 @@ class Runner:
 
         return reasks, valid_output
 
+    def get_reask_paths(
+        self, reasks: Sequence[ReAsk]
+    ) -> Optional[List[List[Union[str, int]]]]:
+        """Determine which fields need to be validated on the next step.
+
+        Returns None if the next response must be fully validated.
+        """
+        if self.full_schema_reask or self.output_type == OutputTypes.STRING:
+            return None
+        return get_reask_paths(reasks)
+
     def do_loop(self, attempt_number: int, reasks: Sequence[ReAsk]) -> bool:
         """Determine if we should loop again."""
         if reasks and attempt_number < self.num_reasks:
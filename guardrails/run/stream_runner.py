@@ -1,6 +1,7 @@
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
 
 from guardrails import validator_service
+from guardrails.classes.generic.stream_buffer import StreamBuffer
 from guardrails.classes.history import Call, Inputs, Iteration, Outputs
 from guardrails.classes.output_type import OT, OutputTypes
 from guardrails.classes.validation_outcome import ValidationOutcome
@@ -118,28 +119,30 @@ class StreamRunner(Runner):
                 "the API is returning a generator."
             )
 
-        parsed_fragment, validated_fragment, valid_op = "", None, None
+        parsed_fragment, validated_fragment, valid_op = None, None, None
         verified = set()
         validation_response = ""
-        fragment = ""
+        # Chunks are recorded once on the LLMResponse, which
+        # the history reads instead of copying the stream
+        fragment = llm_response.record_stream()
         # Loop over the stream
         # and construct "fragments" of concatenated chunks
         # for now, handle string and json schema differently
         if self.output_type == OutputTypes.STRING:
+            parsed_chunks = StreamBuffer()
+            validated_chunks = StreamBuffer()
 
             def prepare_chunk_generator(stream) -> Iterator[Tuple[Any, bool]]:
                 for chunk in stream:
                     chunk_text = self.get_chunk_text(chunk, api)
-                    nonlocal fragment
-                    fragment += chunk_text
+                    fragment.append(chunk_text)
                     finished = self.is_last_chunk(chunk, api)
                     # 2. Parse the chunk
                     parsed_chunk, move_to_next = self.parse(
                         chunk_text, output_schema, verified=verified
                     )
-                    nonlocal parsed_fragment
                     # ignore types because output schema guarantees a string
-                    parsed_fragment += parsed_chunk  # type: ignore
+                    parsed_chunks.append(parsed_chunk)  # type: ignore
                     if move_to_next:
                         # Continue to next chunk
                         continue
@@ -173,7 +176,7 @@ class StreamRunner(Runner):
                         "remove reasks from schema or disable streaming."
                     )
                 # 5. Convert validated fragment to a pretty JSON string
-                validation_response += cast(str, chunk)
+                validated_chunks.append(cast(str, chunk))
                 passed = call_log.status == pass_status
                 yield ValidationOutcome(
                     call_id=call_log.id,  # type: ignore
@@ -182,17 +185,22 @@ class StreamRunner(Runner):
                     validated_output=chunk,
                     validation_passed=passed,
                 )
+            parsed_fragment = parsed_chunks.text
+            validation_response = validated_chunks.text
 
         # handle non string schema
         else:
             for chunk in stream:
                 # 1. Get the text from the chunk and append to fragment
                 chunk_text = self.get_chunk_text(chunk, api)
-                fragment += chunk_text
+                fragment.append(chunk_text)
 
                 # 2. Parse the fragment
+                # A partial JSON document can only be parsed as a whole, so
+                # the full fragment is joined and re-parsed on every chunk.
+                fragment_text = fragment.text
                 parsed_fragment, move_to_next = self.parse(
-                    fragment, output_schema, verified=verified
+                    fragment_text, output_schema, verified=verified
                 )
                 if move_to_next:
                     # Continue to next chunk
@@ -227,14 +235,15 @@ class StreamRunner(Runner):
                 # 5. Convert validated fragment to a pretty JSON string
                 yield ValidationOutcome(
                     call_id=call_log.id,  # type: ignore
-                    raw_llm_output=fragment,
+                    raw_llm_output=fragment_text,
                     validated_output=validated_fragment,
                     validation_passed=validated_fragment is not None,
                 )
 
         # # Finally, add to logs
-        iteration.outputs.raw_output = fragment
-        iteration.outputs.parsed_output = parsed_fragment or fragment  # type: ignore
+        raw_output = fragment.text
+        iteration.outputs.raw_output = raw_output
+        iteration.outputs.parsed_output = parsed_fragment or raw_output  # type: ignore
         iteration.outputs.validation_response = validation_response
         iteration.outputs.guarded_output = valid_op
 
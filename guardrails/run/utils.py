@@ -16,7 +16,7 @@ from guardrails.prompt.instructions import Instructions
 def messages_source(messages: MessageHistory) -> MessageHistory:
     messages_copy = []
     for msg in messages:
-        msg_copy = copy.deepcopy(msg)
+        msg_copy = copy.copy(msg)
         content = (
             msg["content"].source
             if isinstance(msg["content"], Prompt)
@@ -204,7 +204,11 @@ def extract_validators(
             # Only for backwards compatibility
             if isinstance(validators, Validator):
                 validator_instances.append(validators)
+                processed_schema.user_validators.append(validators)
             else:
+                processed_schema.user_validators.extend(
+                    v for v in validators if isinstance(v, Validator)
+                )
                 validator_list = [
                     safe_get_validator(v)  # type: ignore
                     for v in validators
@@ -0,0 +1,125 @@
+from collections import OrderedDict
+import copy
+import os
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+from guardrails.classes.schema.processed_schema import ProcessedSchema
+from guardrails.validator_base import Validator
+
+
+def clone_validator(validator: Validator) -> Validator:
+    """Returns a copy of a validator for a new guard.
+
+    The copy gets its own kwargs and other containers, and no streaming
+    state, but shares everything else with the cached validator,
+    including any models it loaded and a custom on_fail method.
+    """
+    clone = copy.copy(validator)
+    for name, value in vars(validator).items():
+        if isinstance(value, (dict, list, set)):
+            vars(clone)[name] = copy.copy(value)
+    clone.accumulated_chunks = []
+    return clone
+
+
+def clone_schema(schema: ProcessedSchema) -> ProcessedSchema:
+    """Returns a copy of a processed schema that a new Guard can own.
+
+    Validators the user passed in, e.g. in a Pydantic Field, are kept
+    as they are, as they would be without the cache, so changes to them
+    reach every guard built from the schema.
+    """
+    user_validators = {id(v) for v in schema.user_validators}
+    return ProcessedSchema(
+        output_type=schema.output_type,
+        validators=[ref.model_copy() for ref in schema.validators],
+        validator_map={
+            path: [
+                v if id(v) in user_validators else clone_validator(v)
+                for v in validators
+            ]
+            for path, validators in schema.validator_map.items()
+        },
+        json_schema=copy.deepcopy(schema.json_schema),
+        exec_opts=copy.copy(schema.exec_opts),
+        user_validators=list(schema.user_validators),
+    )
+
+
+class SchemaCache:
+    """A thread safe LRU cache of the schemas compiled from rails and
+    Pydantic models.
+
+    Guards built from the same spec get a clone of the cached schema
+    instead of reparsing it and reinstantiating its validators.
+
+    Args:
+        max_size: The maximum number of schemas kept. The least recently
+            used schema is evicted once it is reached. 0 turns the cache
+            off.
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._schemas: OrderedDict[Hashable, ProcessedSchema] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compile(
+        self, key: Optional[Hashable], compile: Callable[[], ProcessedSchema]
+    ) -> ProcessedSchema:
+        """Returns a clone of the schema cached under `key`, compiling and
+        caching it first if needed.
+
+        Schemas without a key are compiled every time.
+        """
+        if key is None or self.max_size <= 0:
+            return compile()
+        with self._lock:
+            schema = self._schemas.get(key)
+            if schema is not None:
+                self._schemas.move_to_end(key)
+        if schema is None:
+            schema = compile()
+            with self._lock:
+                self._schemas[key] = schema
+                while len(self._schemas) > self.max_size:
+                    self._schemas.popitem(last=False)
+        return clone_schema(schema)
+
+    def clear(self):
+        with self._lock:
+            self._schemas.clear()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+
+schema_cache = SchemaCache()
+
+
+def rail_file_key(file_path: str) -> Optional[Hashable]:
+    """Keys a rail file by its path and last modification, so edits to the
+    file are picked up."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return ("rail_file", os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def rail_string_key(rail_string: str) -> Hashable:
+    return ("rail_string", rail_string)
+
+
+def pydantic_key(output_class: Any) -> Optional[Hashable]:
+    """Keys a Pydantic model, or a list of them, by identity.
+
+    Returns None for specs that can't be hashed.
+    """
+    key = ("pydantic", output_class)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
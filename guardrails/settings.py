@@ -1,8 +1,11 @@
 import threading
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from guardrails.classes.rc import RC
 
+if TYPE_CHECKING:
+    from guardrails.llm_cache import LLMCache
+
 
 class Settings:
     _instance = None
@@ -17,6 +20,11 @@ class Settings:
     environment variables or by instantiating a TracerProvider.
     """
     disable_tracing: Optional[bool]
+    """The cache LLM responses are served from.
+
+    Responses are not cached if None.
+    """
+    llm_cache: Optional["LLMCache"]
 
     def __new__(cls) -> "Settings":
         if cls._instance is None:
@@ -29,6 +37,7 @@ class Settings:
     def _initialize(self):
         self.use_server = None
         self.disable_tracing = None
+        self.llm_cache = None
         self._rc = RC.load()
         self._watch_mode_enabled = False
 
@@ -10,6 +10,12 @@ TRACER_KEY: Literal["gr.reserved.tracer"] = "gr.reserved.tracer"
 TRACER_CONTEXT_KEY: Literal["gr.reserved.tracer.context"] = "gr.reserved.tracer.context"
 DOCUMENT_STORE_KEY: Literal["gr.reserved.document_store"] = "gr.reserved.document_store"
 CALL_KWARGS_KEY: Literal["gr.reserved.call_kwargs"] = "gr.reserved.call_kwargs"
+VALIDATION_DEADLINE_KEY: Literal["gr.reserved.validation_deadline"] = (
+    "gr.reserved.validation_deadline"
+)
+VALIDATOR_EXECUTOR_KEY: Literal["gr.reserved.validator_executor"] = (
+    "gr.reserved.validator_executor"
+)
 
 
 def set_guard_name(guard_name: str) -> None:
@@ -57,6 +63,24 @@ def get_call_kwarg(kwarg_key: str) -> Union[Any, None]:
     return kwargs.get(kwarg_key)
 
 
+def set_validation_deadline(deadline: Optional[float]) -> None:
+    """Sets the `time.monotonic()` time by which validation must finish."""
+    set_context_var(VALIDATION_DEADLINE_KEY, deadline)
+
+
+def get_validation_deadline() -> Optional[float]:
+    return get_context_var(VALIDATION_DEADLINE_KEY)
+
+
+def set_validator_executor(executor: Any) -> None:
+    """Sets where sync validators run by default during this guard call."""
+    set_context_var(VALIDATOR_EXECUTOR_KEY, executor)
+
+
+def get_validator_executor() -> Any:
+    return get_context_var(VALIDATOR_EXECUTOR_KEY)
+
+
 def _get_contextvar(key):
     context = copy_context()
     context_var = None
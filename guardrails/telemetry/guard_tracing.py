@@ -20,6 +20,7 @@ from opentelemetry.trace import StatusCode, Tracer, Span, Link, get_tracer
 from guardrails.settings import settings
 from guardrails.classes.generic.stack import Stack
 from guardrails.classes.history.call import Call
+from guardrails.classes.history.server_history import ServerHistory
 from guardrails.classes.output_type import OT
 from guardrails.classes.validation_outcome import ValidationOutcome
 from guardrails.telemetry.open_inference import trace_operation
@@ -43,9 +44,14 @@ def add_guard_attributes(
     history: Stack[Call],
     resp: ValidationOutcome,
 ):
+    # Server-side calls are only fetched when the history is read,
+    #   so they aren't fetched just to trace this one.
+    last_call = (
+        None if isinstance(history, ServerHistory) and history.pending else history.last
+    )
     messages = []
-    if history.last and history.last.iterations.last:
-        messages = history.last.iterations.last.inputs.messages or []
+    if last_call and last_call.iterations.last:
+        messages = last_call.iterations.last.inputs.messages or []
 
     system_messages = [msg for msg in messages if msg["role"] == "system"]
     system_message = system_messages[-1] if system_messages else {}
@@ -66,17 +72,17 @@ def add_guard_attributes(
     guard_span.set_attribute("type", "guardrails/guard")
     guard_span.set_attribute("validation_passed", resp.validation_passed)
 
-    execution_id = history.last.id if history.last else None
+    execution_id = last_call.id if last_call else None
     if execution_id is not None:
         guard_span.set_attribute("execution_id", execution_id)
 
-    token_consumption = history.last.tokens_consumed if history.last else None
+    token_consumption = last_call.tokens_consumed if last_call else None
     if token_consumption is not None:
         guard_span.set_attribute("token_consumption", token_consumption)
 
     number_of_reasks = (
-        history.last.iterations.last.index
-        if history.last and history.last.iterations.last
+        last_call.iterations.last.index
+        if last_call and last_call.iterations.last
         else None
     )
     if number_of_reasks is not None:
@@ -1,4 +1,8 @@
 import re
+from guardrails.classes.templating.compiled_template import (
+    CompiledTemplate,
+    Placeholder,
+)
 from guardrails.classes.templating.constants_container import ConstantsContainer
 from guardrails.classes.templating.namespace_template import NamespaceTemplate
 
@@ -6,20 +10,25 @@ from guardrails.classes.templating.namespace_template import NamespaceTemplate
 # Singleton instance created on import/init
 constants = ConstantsContainer()
 
+# Matches all occurrences of ${gr.<constant_name>}
+CONSTANT_PATTERN = re.compile(r"\${gr\.(\w+)}")
+
 
 # TODO: Consolidate this and guardrails/utils/prompt_utils.py
 #       into guardrails/utils/templating_utils.py
 def substitute_constants(text):
     """Substitute constants in the prompt."""
-    # Substitute constants by reading the constants file.
-    # Regex to extract all occurrences of ${gr.<constant_name>}
-    matches = re.findall(r"\${gr\.(\w+)}", text)
-
     # Substitute all occurrences of ${gr.<constant_name>}
-    #   with the value of the constant.
-    for match in matches:
-        template = NamespaceTemplate(text)
-        mapping = {f"gr.{match}": constants[match]}
-        text = template.safe_substitute(**mapping)
+    #   with the value of the constant in a single pass.
+    template = CompiledTemplate.compile(text, NamespaceTemplate)
+    mapping = {}
+    for segment in template.segments:
+        if isinstance(segment, Placeholder):
+            match = CONSTANT_PATTERN.fullmatch(segment.text)
+            if match:
+                mapping[segment.name] = constants[match.group(1)]
+
+    if not mapping:
+        return text
 
-    return text
+    return template.safe_substitute(mapping)
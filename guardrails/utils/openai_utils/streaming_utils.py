@@ -1,9 +1,23 @@
-from typing import Dict, List
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from guardrails.logger import logger
 
 import tiktoken
 
 
+@lru_cache(maxsize=None)
+def get_encoding(model_name: str) -> tiktoken.Encoding:
+    """Returns the tiktoken encoding for a model, loaded once per model.
+
+    Falls back to cl100k_base for models tiktoken doesn't know.
+    """
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        logger.warning("model not found. Using cl100k_base encoding.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def num_tokens_from_string(text: str, model_name: str) -> int:
     """Returns the number of tokens in a text string.
 
@@ -19,20 +33,15 @@ def num_tokens_from_string(text: str, model_name: str) -> int:
     Returns:
         num_tokens (int): The number of tokens in the text string.
     """
-    encoding = tiktoken.encoding_for_model(model_name)
+    encoding = get_encoding(model_name)
     num_tokens = len(encoding.encode(text))
     return num_tokens
 
 
-def num_tokens_from_messages(
-    messages: List[Dict[str, str]], model: str = "gpt-3.5-turbo-0613"
-) -> int:
-    """Return the number of tokens used by a list of messages."""
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        logger.warning("model not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
+@lru_cache(maxsize=None)
+def get_message_token_overheads(model: str) -> Tuple[str, int, int]:
+    """Returns the model messages are counted as, and the tokens added per
+    message and per name."""
     if model in {
         "gpt-3.5-turbo-0613",
         "gpt-3.5-turbo-16k-0613",
@@ -41,25 +50,23 @@ def num_tokens_from_messages(
         "gpt-4-0613",
         "gpt-4-32k-0613",
     }:
-        tokens_per_message = 3
-        tokens_per_name = 1
+        return model, 3, 1
     elif model == "gpt-3.5-turbo-0301":
-        tokens_per_message = (
-            4  # every message follows <|start|>{role/name}\n{content}<|end|>\n
-        )
-        tokens_per_name = -1  # if there's a name, the role is omitted
+        # every message follows <|start|>{role/name}\n{content}<|end|>\n
+        #   and if there's a name, the role is omitted
+        return model, 4, -1
     elif "gpt-3.5-turbo" in model:
         logger.warning(
             """gpt-3.5-turbo may update over time.
             Returning num tokens assuming gpt-3.5-turbo-0613."""
         )
-        return num_tokens_from_messages(messages, model="gpt-3.5-turbo-0613")
+        return get_message_token_overheads("gpt-3.5-turbo-0613")
     elif "gpt-4" in model:
         logger.warning(
             """gpt-4 may update over time.
             Returning num tokens assuming gpt-4-0613."""
         )
-        return num_tokens_from_messages(messages, model="gpt-4-0613")
+        return get_message_token_overheads("gpt-4-0613")
     else:
         raise NotImplementedError(
             f"""num_tokens_from_messages() is not implemented for model {model}.
@@ -67,6 +74,14 @@ def num_tokens_from_messages(
             information on how messages are converted to tokens."""
         )
 
+
+def num_tokens_from_messages(
+    messages: List[Dict[str, str]], model: str = "gpt-3.5-turbo-0613"
+) -> int:
+    """Return the number of tokens used by a list of messages."""
+    model, tokens_per_message, tokens_per_name = get_message_token_overheads(model)
+    encoding = get_encoding(model)
+
     num_tokens = 0
     for message in messages:
         num_tokens += tokens_per_message
@@ -78,3 +93,54 @@ def num_tokens_from_messages(
     # every reply is primed with <|start|>assistant<|message|>
     num_tokens += 3
     return num_tokens
+
+
+class StreamTokenCounter:
+    """Counts the tokens of a streamed output as its deltas arrive, instead
+    of re-encoding the whole output once the stream ends.
+
+    Deltas are encoded on their own; OpenAI streams whole tokens per
+    delta, so the count matches encoding the full output. Usage reported
+    by the provider, e.g. with `stream_options={"include_usage": True}`,
+    takes precedence, and no deltas are encoded when it was requested.
+
+    Args:
+        model_name: The name of the OpenAI model to count tokens for.
+        usage_requested: Whether the provider will report usage at the
+            end of the stream.
+    """
+
+    def __init__(self, model_name: str, *, usage_requested: bool = False):
+        self.model_name = model_name
+        self.usage_requested = usage_requested
+        self.usage: Optional[Any] = None
+        self._response_token_count = 0
+
+    def add(self, text: Optional[str]):
+        if text and not self.usage_requested:
+            encoding = get_encoding(self.model_name)
+            self._response_token_count += len(encoding.encode(text))
+
+    def set_usage(self, usage: Any):
+        self.usage = usage
+
+    def prompt_token_count(self, count_prompt: Callable[[], int]) -> int:
+        """Returns the reported prompt tokens, or calls `count_prompt` to
+        count them."""
+        if self.usage is not None:
+            return _usage_field(self.usage, "prompt_tokens")
+        return count_prompt()
+
+    def response_token_count(self, output: str) -> int:
+        if self.usage is not None:
+            return _usage_field(self.usage, "completion_tokens")
+        if self.usage_requested:
+            # The provider didn't report usage after all.
+            return num_tokens_from_string(output, self.model_name)
+        return self._response_token_count
+
+
+def _usage_field(usage: Any, field: str) -> int:
+    if isinstance(usage, dict):
+        return usage.get(field) or 0
+    return getattr(usage, field, None) or 0
@@ -3,9 +3,11 @@ from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional,
 import openai
 
 import warnings
+from guardrails.classes.generic.stream_buffer import StreamBuffer
 from guardrails.classes.llm.llm_response import LLMResponse
 from guardrails.utils.openai_utils.base import BaseOpenAIClient
 from guardrails.utils.openai_utils.streaming_utils import (
+    StreamTokenCounter,
     num_tokens_from_messages,
     num_tokens_from_string,
 )
@@ -74,6 +76,19 @@ def is_static_openai_chat_acreate_func(llm_api: Optional[Callable]) -> bool:
 OpenAIServiceUnavailableError = openai.APIError
 
 
+def _get(obj: Any, key: str) -> Any:
+    """Reads a field of a streamed chunk, whether it is a dict or an
+    OpenAI object."""
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, key, None)
+
+
+def _usage_requested(kwargs: Dict[str, Any]) -> bool:
+    stream_options = kwargs.get("stream_options") or {}
+    return bool(stream_options.get("include_usage"))
+
+
 class OpenAIClientV1(BaseOpenAIClient):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -286,6 +301,7 @@ class AsyncOpenAIClientV1(BaseOpenAIClient):
             openai_response=response,
             prompt=prompt,
             engine=engine,
+            usage_requested=_usage_requested(kwargs),
         )
 
     async def construct_nonchat_response(
@@ -294,24 +310,32 @@ class AsyncOpenAIClientV1(BaseOpenAIClient):
         openai_response: Any,
         prompt: str,
         engine: str,
+        usage_requested: bool = False,
     ) -> LLMResponse:
         if stream:
             # If stream is defined and set to True,
             # openai returns a generator object
-            complete_output = ""
+            token_counter = StreamTokenCounter(engine, usage_requested=usage_requested)
+            collected_texts = StreamBuffer()
             openai_response = cast(AsyncIterator[Dict[str, Any]], openai_response)
             async for response in openai_response:
-                complete_output += response["choices"][0]["text"]
-
-            # Also, it no longer returns usage information
-            # So manually count the tokens using tiktoken
-            prompt_token_count = num_tokens_from_string(
-                text=prompt,
-                model_name=engine,
-            )
-            response_token_count = num_tokens_from_string(
-                text=complete_output, model_name=engine
+                usage = _get(response, "usage")
+                if usage:
+                    token_counter.set_usage(usage)
+                choices = _get(response, "choices")
+                if not choices:
+                    continue
+                text = _get(choices[0], "text") or ""
+                collected_texts.append(text)
+                token_counter.add(text)
+            complete_output = collected_texts.text
+
+            # Streams only return usage information when asked to,
+            # so otherwise count the tokens with tiktoken as they arrive
+            prompt_token_count = token_counter.prompt_token_count(
+                lambda: num_tokens_from_string(text=prompt, model_name=engine)
             )
+            response_token_count = token_counter.response_token_count(complete_output)
 
             # Return the LLMResponse
             return LLMResponse(
@@ -345,6 +369,7 @@ class AsyncOpenAIClientV1(BaseOpenAIClient):
             openai_response=response,
             prompt=messages,
             model=model,
+            usage_requested=_usage_requested(kwargs),
         )
 
     async def construct_chat_response(
@@ -353,6 +378,7 @@ class AsyncOpenAIClientV1(BaseOpenAIClient):
         openai_response: Any,
         prompt: List[Any],
         model: str,
+        usage_requested: bool = False,
     ) -> LLMResponse:
         """Construct an LLMResponse from an OpenAI response.
 
@@ -362,25 +388,29 @@ class AsyncOpenAIClientV1(BaseOpenAIClient):
         if stream:
             # If stream is defined and set to True,
             # openai returns a generator object
-            collected_messages = []
+            token_counter = StreamTokenCounter(model, usage_requested=usage_requested)
+            collected_contents = StreamBuffer()
             openai_response = cast(AsyncIterator[Dict[str, Any]], openai_response)
             async for chunk in openai_response:
-                chunk_message = chunk["choices"][0]["delta"]
-                collected_messages.append(chunk_message)  # save the message
-
-            complete_output = "".join(
-                [msg.get("content", "") for msg in collected_messages]
-            )
-
-            # Also, it no longer returns usage information
-            # So manually count the tokens using tiktoken
-            prompt_token_count = num_tokens_from_messages(
-                messages=prompt,
-                model=model,
-            )
-            response_token_count = num_tokens_from_string(
-                text=complete_output, model_name=model
+                usage = _get(chunk, "usage")
+                if usage:
+                    token_counter.set_usage(usage)
+                choices = _get(chunk, "choices")
+                if not choices:
+                    # The usage chunk comes without choices
+                    continue
+                content = _get(_get(choices[0], "delta"), "content") or ""
+                collected_contents.append(content)  # save the message
+                token_counter.add(content)
+
+            complete_output = collected_contents.text
+
+            # Streams only return usage information when asked to,
+            # so otherwise count the tokens with tiktoken as they arrive
+            prompt_token_count = token_counter.prompt_token_count(
+                lambda: num_tokens_from_messages(messages=prompt, model=model)
             )
+            response_token_count = token_counter.response_token_count(complete_output)
 
             # Return the LLMResponse
             return LLMResponse(
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Optional
+import threading
+from typing import ContextManager, List, Optional
 
 try:
     import sqlalchemy
     from sqlalchemy import text
+    from sqlalchemy.pool import StaticPool
 
     _HAS_SQLALCHEMY = True
 except ImportError:
@@ -42,11 +45,24 @@ class SimpleSqlDriver(SQLDriver):
         raise NotImplementedError
 
 
+# Statements that make the database plan a query without running it.
+#   Dialects without one run the query in a transaction that is rolled back.
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+    "mysql": "EXPLAIN ",
+    "mariadb": "EXPLAIN ",
+    "duckdb": "EXPLAIN ",
+}
+
+
 class SqlAlchemyDriver(SQLDriver):
     """SQL driver which uses sqlalchemy to validate SQL queries.
 
     It can setup the database schema and check if the queries are valid
-    by connecting to the database.
+    by connecting to the database. Queries are only planned, with
+    `EXPLAIN`, inside a transaction that is always rolled back, and each
+    validation checks out its own connection from the engine's pool.
     """
 
     def __init__(self, schema_file: Optional[str], conn: Optional[str]) -> None:
@@ -63,46 +79,82 @@ class SqlAlchemyDriver(SQLDriver):
            Use sqlite for ex: sqlite://"""
             )
 
+        self._schema: Optional[str] = None
+        # An in-memory sqlite database only lives as long as its connection,
+        #   so every checkout has to share that one connection, one at a time.
+        self._lock: ContextManager = nullcontext()
         if conn is not None:
             try:
-                self._engine = sqlalchemy.create_engine(conn)
-                self._conn = self._engine.connect()
+                url = sqlalchemy.engine.make_url(conn)
+                if url.get_backend_name() == "sqlite" and url.database in (
+                    None,
+                    "",
+                    ":memory:",
+                ):
+                    self._engine = sqlalchemy.create_engine(
+                        url,
+                        poolclass=StaticPool,
+                        connect_args={"check_same_thread": False},
+                    )
+                    self._lock = threading.Lock()
+                else:
+                    self._engine = sqlalchemy.create_engine(url, pool_pre_ping=True)
             except Exception as ex:
                 raise ValueError(ex)
+            self._explain_prefix = EXPLAIN_PREFIXES.get(self._engine.dialect.name)
 
         if schema_file is not None:
             schema = Path(schema_file).read_text()
-            if conn is not None and conn.startswith("sqlite"):
-                self._conn.connection.executescript(schema)  # type: ignore
-            else:
-                from sqlalchemy import text
-
-                self._conn.execute(text(schema))
+            with self._lock:
+                if self._engine.dialect.name == "sqlite":
+                    with self._engine.connect() as connection:
+                        connection.connection.executescript(schema)  # type: ignore
+                else:
+                    with self._engine.begin() as connection:
+                        connection.execute(text(schema))
 
     def validate_sql(self, query: str) -> List[str]:
         exceptions: List[str] = []
-        try:
-            self._conn.execute(text(query))
-        except Exception as ex:
-            exceptions.append(str(ex))
+        statement = f"{self._explain_prefix}{query}" if self._explain_prefix else query
+        with self._lock, self._engine.connect() as connection:
+            transaction = connection.begin()
+            try:
+                connection.execute(text(statement))
+            except Exception as ex:
+                # Report the database's own error, without the EXPLAIN
+                #   statement sqlalchemy would append to it.
+                exceptions.append(str(getattr(ex, "orig", None) or ex))
+            finally:
+                transaction.rollback()
         return exceptions
 
     def get_schema(self) -> str:
-        # Get table schema using sqlalchemy.inspect
-        insp = sqlalchemy.inspect(self._conn)
-
-        schema = {}
-        for table in insp.get_table_names():
-            schema[table] = {}
-            for column in insp.get_columns(table):
-                schema[table][column["name"]] = {"type": column["type"]}
-
-            # Get foreign keys
-            for fk in insp.get_foreign_keys(table):
-                schema[table][fk["constrained_columns"][0]]["foreign_key"] = {
-                    "table": fk["referred_table"],
-                    "column": fk["referred_columns"][0],
-                }
+        """Returns a description of the database's tables, inspected once
+        and then cached until `invalidate_schema` is called."""
+        if self._schema is None:
+            self._schema = self._inspect_schema()
+        return self._schema
+
+    def invalidate_schema(self):
+        self._schema = None
+
+    def _inspect_schema(self) -> str:
+        with self._lock, self._engine.connect() as connection:
+            # Get table schema using sqlalchemy.inspect
+            insp = sqlalchemy.inspect(connection)
+
+            schema = {}
+            for table in insp.get_table_names():
+                schema[table] = {}
+                for column in insp.get_columns(table):
+                    schema[table][column["name"]] = {"type": column["type"]}
+
+                # Get foreign keys
+                for fk in insp.get_foreign_keys(table):
+                    schema[table][fk["constrained_columns"][0]]["foreign_key"] = {
+                        "table": fk["referred_table"],
+                        "column": fk["referred_columns"][0],
+                    }
 
         # Create a nicely formatted schema from the dictionary
         formatted_schema = []
@@ -4,6 +4,7 @@
 #   - [ ] Remove validator_base.py in 0.6.x
 
 import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
 from contextvars import Context, ContextVar
 from functools import partial
 import inspect
@@ -13,7 +14,7 @@ from dataclasses import dataclass
 import re
 from string import Template
 from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
-from typing_extensions import deprecated
+from typing_extensions import Literal, deprecated
 from warnings import warn
 import warnings
 
@@ -28,6 +29,10 @@ from guardrails.constants import hub
 from guardrails.hub_token.token import VALIDATOR_HUB_SERVICE, get_jwt_token
 from guardrails.logger import logger
 from guardrails.remote_inference import remote_inference
+from guardrails.stores.context import (
+    get_validation_deadline,
+    get_validator_executor,
+)
 from guardrails.hub_telemetry.hub_tracing import trace
 from guardrails.types.on_fail import OnFailAction
 from guardrails.utils.safe_get import safe_get
@@ -37,6 +42,14 @@ from guardrails.utils.tokenization_utils import (
 )
 
 
+# Where sync validators run when validated asynchronously:
+#   an executor, or "inline" on the event loop's own thread.
+ValidatorExecutor = Union[Executor, Literal["inline"]]
+INLINE_EXECUTOR: Literal["inline"] = "inline"
+
+T = TypeVar("T")
+
+
 ### functions to get chunks ###
 def split_sentence_str(chunk: str):
     """A naive sentence splitter that splits on periods."""
@@ -98,6 +111,9 @@ class Validator:
 
     run_in_separate_process = False
     override_value_on_pass = False
+    validation_timeout: Optional[float] = None
+    validation_max_concurrency: Optional[int] = None
+    executor: Optional[ValidatorExecutor] = None
     required_metadata_keys = []
     _metadata = {}
 
@@ -157,6 +173,23 @@ class Validator:
             self.on_fail_descriptor = OnFailAction.CUSTOM
             self._set_on_fail_method(on_fail)
 
+        # Limits on how long the validator may take, and how many of its
+        #   validations may run at once across guards.
+        # These are namespaced and kept out of the kwargs so they don't clash
+        #   with a validator's own arguments, e.g. a `timeout` for its model.
+        self.validation_timeout = kwargs.pop(
+            "validation_timeout", self.validation_timeout
+        )
+        self.validation_max_concurrency = kwargs.pop(
+            "validation_max_concurrency", self.validation_max_concurrency
+        )
+        on_timeout = kwargs.pop("on_timeout", None)
+        # Executors aren't serializable, so they aren't kept with the kwargs.
+        self.executor = kwargs.pop("executor", self.executor)
+        self.on_timeout_descriptor: Union[str, OnFailAction] = (
+            OnFailAction.get(on_timeout) or self.on_fail_descriptor
+        )
+
         # Store the kwargs for the validator.
         self._kwargs = kwargs
 
@@ -248,11 +281,36 @@ class Validator:
 
         Guaranteed to work with AsyncGuard
 
-        May not work with synchronous Guards if they are used within an
-        async context     due to lack of available event loops.
+        Otherwise, `validate` runs on the validator's `executor`, falling
+        back to the one configured on the guard and then to the loop's
+        default executor. An executor of "inline" runs it on the loop's
+        own thread, which suits validators that only take microseconds:
+        sync guards share one background loop across the process, so an
+        inline validator blocks validation for every guard while it runs,
+        and can't be interrupted by a timeout. When a validation timeout
+        or deadline applies, inline validators run on the loop's default
+        executor instead. Validators run on a process pool must be
+        picklable.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.validate, value, metadata)
+        return await self._run_sync(self.validate, value, metadata)
+
+    async def _run_sync(self, func: Callable[..., T], *args, stream: bool = False) -> T:
+        executor = self.executor or get_validator_executor()
+        if executor == INLINE_EXECUTOR:
+            if self.validation_timeout is None and get_validation_deadline() is None:
+                return func(*args)
+            warnings.warn(
+                f"Validator {self.rail_alias} can't be timed out inline,"
+                " so it is run on the default executor instead.",
+                RuntimeWarning,
+            )
+            executor = None
+        if stream and isinstance(executor, ProcessPoolExecutor):
+            # Streaming validators accumulate chunks on the instance,
+            #   which a copy in another process would lose.
+            executor = None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, func, *args)
 
     @trace(name="/validator_inference", origin="Validator._inference")
     def _inference(self, model_input: Any) -> Any:
@@ -369,11 +427,10 @@ class Validator:
     async def async_validate_stream(
         self, chunk: Any, metadata: Dict[str, Any], **kwargs
     ) -> Optional[ValidationResult]:
-        loop = asyncio.get_event_loop()
         validate_stream_partial = partial(
             self.validate_stream, chunk, metadata, **kwargs
         )
-        return await loop.run_in_executor(None, validate_stream_partial)
+        return await self._run_sync(validate_stream_partial, stream=True)
 
     def _hub_inference_request(
         self, request_body: Union[dict, str], validation_endpoint: str
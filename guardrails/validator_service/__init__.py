@@ -19,12 +19,11 @@ from guardrails.validator_service.async_validator_service import AsyncValidatorS
 from guardrails.validator_service.sequential_validator_service import (
     SequentialValidatorService,
 )
+from guardrails.validator_service.background_loop import BackgroundEventLoop
 
 
-try:
-    import uvloop  # type: ignore
-except ImportError:
-    uvloop = None
+# Sync validation runs on this loop so it doesn't set one up per call.
+background_loop = BackgroundEventLoop()
 
 
 def should_run_sync():
@@ -48,18 +47,12 @@ def should_run_sync():
 
 
 def get_loop() -> asyncio.AbstractEventLoop:
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
+    """Returns the background event loop sync validation is submitted to.
 
-    if loop is not None:
-        raise RuntimeError("An event loop is already running.")
-
-    if uvloop is not None:
-        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-
-    return asyncio.get_event_loop()
+    It runs on a thread of its own, so it is available even if a loop is
+    already running on the calling thread.
+    """
+    return background_loop.get_loop()
 
 
 def validate(
@@ -69,10 +62,13 @@ def validate(
     iteration: Iteration,
     disable_tracer: Optional[bool] = True,
     path: Optional[str] = None,
+    reference_path: Optional[str] = None,
     **kwargs,
 ):
     if path is None:
         path = "$"
+    if reference_path is None:
+        reference_path = path
 
     loop = None
     if should_run_sync():
@@ -94,7 +90,7 @@ def validate(
         validator_map,
         iteration,
         path,
-        path,
+        reference_path,
         loop=loop,  # type: ignore It exists when we need it to.
         **kwargs,
     )
@@ -126,13 +122,23 @@ async def async_validate(
     disable_tracer: Optional[bool] = True,
     path: Optional[str] = None,
     stream: Optional[bool] = False,
+    reference_path: Optional[str] = None,
     **kwargs,
 ) -> Tuple[Any, dict]:
     if path is None:
         path = "$"
+    if reference_path is None:
+        reference_path = path
     validator_service = AsyncValidatorService(disable_tracer)
     return await validator_service.async_validate(
-        value, metadata, validator_map, iteration, path, path, stream, **kwargs
+        value,
+        metadata,
+        validator_map,
+        iteration,
+        path,
+        reference_path,
+        stream,
+        **kwargs,
     )
 
 
@@ -1,4 +1,6 @@
 import asyncio
+import threading
+import time
 from typing import Any, Awaitable, Coroutine, Dict, List, Optional, Tuple, Union
 
 from guardrails.actions.filter import Filter
@@ -10,6 +12,7 @@ from guardrails.classes.validation.validation_result import (
     ValidationResult,
 )
 from guardrails.hub_telemetry.hub_tracing import async_trace
+from guardrails.stores.context import get_validation_deadline
 from guardrails.telemetry.validator_tracing import trace_async_validator
 from guardrails.types import ValidatorMap, OnFailAction
 from guardrails.classes.validation.validator_logs import ValidatorLogs
@@ -22,6 +25,32 @@ from guardrails.validator_service.validator_service_base import (
 
 ValidatorResult = Optional[Union[ValidationResult, Awaitable[ValidationResult]]]
 
+# Semaphores limiting how many validations of a kind run at once,
+#   shared by every guard validating on the same event loop.
+_concurrency_limits: Dict[
+    asyncio.AbstractEventLoop, Dict[Tuple[str, int], asyncio.Semaphore]
+] = {}
+_concurrency_limits_lock = threading.Lock()
+
+
+def concurrency_limit(validator: Validator) -> Optional[asyncio.Semaphore]:
+    """Returns the semaphore limiting concurrent validations by validators
+    like this one on the running loop, or None if there is no limit."""
+    if validator.validation_max_concurrency is None:
+        return None
+    loop = asyncio.get_running_loop()
+    key = (validator.rail_alias, validator.validation_max_concurrency)
+    with _concurrency_limits_lock:
+        if loop not in _concurrency_limits:
+            # Semaphores are bound to their loop, so drop those of closed loops.
+            for closed_loop in [k for k in _concurrency_limits if k.is_closed()]:
+                del _concurrency_limits[closed_loop]
+            _concurrency_limits[loop] = {}
+        semaphores = _concurrency_limits[loop]
+        if key not in semaphores:
+            semaphores[key] = asyncio.Semaphore(validator.validation_max_concurrency)
+        return semaphores[key]
+
 
 class AsyncValidatorService(ValidatorServiceBase):
     @async_trace(
@@ -63,7 +92,12 @@ class AsyncValidatorService(ValidatorServiceBase):
         validation_session_id: str,
         **kwargs,
     ) -> ValidationResult:
-        result = await self.execute_validator(
+        """Runs the validator within its concurrency limit.
+
+        Raises an asyncio.TimeoutError if the validator doesn't finish
+        within its timeout, or before the deadline of the guard call.
+        """
+        coroutine = self.execute_validator_limited(
             validator,
             value,
             metadata,
@@ -71,11 +105,67 @@ class AsyncValidatorService(ValidatorServiceBase):
             validation_session_id=validation_session_id,
             **kwargs,
         )
+        timeout = self.validator_timeout(validator)
+        if timeout is None:
+            result = await coroutine
+        else:
+            result = await asyncio.wait_for(coroutine, max(timeout, 0))
 
         if result is None:
             result = PassResult()
         return result
 
+    async def execute_validator_limited(
+        self,
+        validator: Validator,
+        value: Any,
+        metadata: Dict,
+        stream: Optional[bool] = False,
+        *,
+        validation_session_id: str,
+        **kwargs,
+    ) -> Optional[ValidationResult]:
+        semaphore = concurrency_limit(validator)
+        if semaphore is None:
+            return await self.execute_validator(
+                validator,
+                value,
+                metadata,
+                stream,
+                validation_session_id=validation_session_id,
+                **kwargs,
+            )
+        async with semaphore:
+            return await self.execute_validator(
+                validator,
+                value,
+                metadata,
+                stream,
+                validation_session_id=validation_session_id,
+                **kwargs,
+            )
+
+    @staticmethod
+    def validator_timeout(validator: Validator) -> Optional[float]:
+        """The number of seconds the validator has left to run, whichever of
+        its own timeout and the guard call's deadline comes first."""
+        deadline = get_validation_deadline()
+        timeouts = [
+            timeout
+            for timeout in (
+                validator.validation_timeout,
+                deadline - time.monotonic() if deadline is not None else None,
+            )
+            if timeout is not None
+        ]
+        return min(timeouts) if timeouts else None
+
+    @staticmethod
+    def timeout_result(validator: Validator) -> FailResult:
+        return FailResult(
+            error_message=f"Validator {validator.rail_alias} timed out.",
+        )
+
     async def run_validator(
         self,
         iteration: Iteration,
@@ -92,36 +182,45 @@ class AsyncValidatorService(ValidatorServiceBase):
             iteration, validator, value, absolute_property_path
         )
 
-        result = await self.run_validator_async(
-            validator,
-            value,
-            metadata,
-            stream,
-            validation_session_id=iteration.id,
-            reference_path=reference_path,
-            **kwargs,
-        )
+        on_fail_action = validator.on_fail_descriptor
+        try:
+            result = await self.run_validator_async(
+                validator,
+                value,
+                metadata,
+                stream,
+                validation_session_id=iteration.id,
+                reference_path=reference_path,
+                **kwargs,
+            )
+        except asyncio.TimeoutError:
+            result = self.timeout_result(validator)
+            on_fail_action = validator.on_timeout_descriptor
 
         validator_logs = self.after_run_validator(validator, validator_logs, result)
 
         if isinstance(result, FailResult):
             rechecked_value = None
-            if validator.on_fail_descriptor == OnFailAction.FIX_REASK:
+            if on_fail_action == OnFailAction.FIX_REASK:
                 fixed_value = result.fix_value
-                rechecked_value = await self.run_validator_async(
-                    validator,
-                    fixed_value,
-                    result.metadata or {},
-                    stream,
-                    validation_session_id=iteration.id,
-                    reference_path=reference_path,
-                    **kwargs,
-                )
+                try:
+                    rechecked_value = await self.run_validator_async(
+                        validator,
+                        fixed_value,
+                        result.metadata or {},
+                        stream,
+                        validation_session_id=iteration.id,
+                        reference_path=reference_path,
+                        **kwargs,
+                    )
+                except asyncio.TimeoutError:
+                    rechecked_value = self.timeout_result(validator)
             value = self.perform_correction(
                 result,
                 value,
                 validator,
                 rechecked_value=rechecked_value,
+                on_fail_descriptor=on_fail_action,
             )
 
         # handle overrides
@@ -137,7 +236,7 @@ class AsyncValidatorService(ValidatorServiceBase):
         return ValidatorRun(
             value=value,
             metadata=metadata,
-            on_fail_action=validator.on_fail_descriptor,
+            on_fail_action=on_fail_action,
             validator_logs=validator_logs,
         )
 
@@ -342,16 +441,20 @@ class AsyncValidatorService(ValidatorServiceBase):
         stream: Optional[bool] = False,
         **kwargs,
     ) -> Tuple[Any, dict]:
-        value, metadata = loop.run_until_complete(
-            self.async_validate(
-                value,
-                metadata,
-                validator_map,
-                iteration,
-                absolute_path,
-                reference_path,
-                stream=stream,
-                **kwargs,
-            )
+        coroutine = self.async_validate(
+            value,
+            metadata,
+            validator_map,
+            iteration,
+            absolute_path,
+            reference_path,
+            stream=stream,
+            **kwargs,
         )
+        if loop.is_running():
+            # The loop runs on another thread, like the background loop.
+            future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+            value, metadata = future.result()
+        else:
+            value, metadata = loop.run_until_complete(coroutine)
         return value, metadata
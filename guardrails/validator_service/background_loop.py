@@ -0,0 +1,68 @@
+import asyncio
+import os
+import threading
+from typing import Optional
+
+
+try:
+    import uvloop  # type: ignore
+except ImportError:
+    uvloop = None
+
+
+class BackgroundEventLoop:
+    """An event loop that runs forever on a daemon thread of its own.
+
+    Sync callers submit coroutines to it with
+    `asyncio.run_coroutine_threadsafe`, so they get async concurrency
+    without setting up a loop per call, and even when a loop is already
+    running on their own thread.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """Returns the running background loop, starting it if needed.
+
+        Raises a RuntimeError when called from the loop's own thread,
+        since waiting on the loop from there would block it forever.
+        """
+        if self._is_alive():
+            if threading.current_thread() is self._thread:
+                raise RuntimeError(
+                    "Cannot wait on the background event loop from its own thread."
+                )
+            return self._loop  # type: ignore
+        with self._lock:
+            if not self._is_alive():
+                self._start()
+        return self._loop  # type: ignore
+
+    def _is_alive(self) -> bool:
+        # Threads don't survive a fork, so a child process starts its own.
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and self._pid == os.getpid()
+        )
+
+    def _start(self):
+        loop = uvloop.new_event_loop() if uvloop is not None else None
+        loop = loop or asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            loop.run_forever()
+
+        thread = threading.Thread(
+            target=run, name="guardrails-validation-loop", daemon=True
+        )
+        thread.start()
+        started.wait()
+        self._loop, self._thread, self._pid = loop, thread, os.getpid()
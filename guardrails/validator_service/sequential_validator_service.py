@@ -1,4 +1,7 @@
 import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import contextvars
+import threading
 from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 
 from guardrails.actions.filter import Filter
@@ -10,14 +13,50 @@ from guardrails.classes.validation.validation_result import (
     StreamValidationResult,
     ValidationResult,
 )
+from guardrails.stores.context import get_validator_executor
 from guardrails.types import ValidatorMap, OnFailAction
 from guardrails.utils.exception_utils import UserFacingException
 from guardrails.classes.validation.validator_logs import ValidatorLogs
 from guardrails.actions.reask import ReAsk
-from guardrails.validator_base import Validator
+from guardrails.validator_base import INLINE_EXECUTOR, Validator
 from guardrails.validator_service.validator_service_base import ValidatorServiceBase
 
 
+_stream_executor: Optional[ThreadPoolExecutor] = None
+_stream_executor_lock = threading.Lock()
+
+
+def get_stream_executor() -> ThreadPoolExecutor:
+    """Returns the worker pool streaming validators run on concurrently,
+    which lives as long as the process."""
+    global _stream_executor
+    if _stream_executor is None:
+        with _stream_executor_lock:
+            if _stream_executor is None:
+                _stream_executor = ThreadPoolExecutor(
+                    thread_name_prefix="guardrails-stream-validation"
+                )
+    return _stream_executor
+
+
+def merge_metadata(
+    metadata: Dict[str, Any], given: Dict[str, Any], returned: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merges the entries a validator added to or changed in the metadata it
+    was `given` into `metadata`.
+
+    Validators that run at once are all given the same metadata, so only
+    what each one changed is merged, in validator order, and a validator
+    doesn't overwrite another's changes with the values it was given.
+    """
+    changes = {
+        key: value
+        for key, value in returned.items()
+        if key not in given or given[key] is not value
+    }
+    return {**metadata, **changes}
+
+
 class SequentialValidatorService(ValidatorServiceBase):
     def run_validator_sync(
         self,
@@ -75,6 +114,68 @@ class SequentialValidatorService(ValidatorServiceBase):
 
         return self.after_run_validator(validator, validator_logs, result)
 
+    def run_validators_concurrently(
+        self,
+        iteration: Iteration,
+        validators: List[Validator],
+        value: Any,
+        metadata: Dict,
+        property_path: str,
+        stream: Optional[bool] = False,
+        **kwargs,
+    ) -> List[ValidatorLogs]:
+        """Runs every validator on the same value at once, and returns their
+        logs in the order of the validators.
+
+        Every validator gets its own copy of the metadata, so none of them
+        sees what another adds to it. Callers merge the metadata the
+        validators return with `merge_metadata`.
+        """
+        executor = get_validator_executor()
+        if len(validators) < 2 or executor == INLINE_EXECUTOR:
+            return [
+                self.run_validator(
+                    iteration,
+                    validator,
+                    value,
+                    dict(metadata),
+                    property_path,
+                    stream,
+                    **kwargs,
+                )
+                for validator in validators
+            ]
+        if executor is None or isinstance(executor, ProcessPoolExecutor):
+            # Streaming validators accumulate chunks on the instance,
+            #   so they have to run in this process.
+            executor = get_stream_executor()
+
+        # Logs are started here so they are kept in the order of the validators.
+        validators_logs = [
+            self.before_run_validator(iteration, validator, value, property_path)
+            for validator in validators
+        ]
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                self.run_validator_sync,
+                validator,
+                value,
+                dict(metadata),
+                validator_logs,
+                stream,
+                validation_session_id=iteration.id,
+                **kwargs,
+            )
+            for validator, validator_logs in zip(validators, validators_logs)
+        ]
+        return [
+            self.after_run_validator(validator, validator_logs, future.result())
+            for validator, validator_logs, future in zip(
+                validators, validators_logs, futures
+            )
+        ]
+
     def run_validators_stream(
         self,
         iteration: Iteration,
@@ -128,25 +229,28 @@ class SequentialValidatorService(ValidatorServiceBase):
         refrain_triggered = False
         for chunk, finished in value_stream:
             original_text = chunk
+            chunk_metadata = metadata
             acc_output += chunk
             fixed_values = []
             last_chunk = chunk
             last_chunk_missing_validators = []
             if refrain_triggered:
                 break
-            for validator in validators:
+            # Every validator validates the original chunk,
+            #   so they all run at once.
+            validators_logs = self.run_validators_concurrently(
+                iteration,
+                validators,
+                original_text,
+                metadata,
+                absolute_property_path,
+                True,
+                remainder=finished,
+                **kwargs,
+            )
+            for validator, validator_logs in zip(validators, validators_logs):
                 # reset chunk to original text
                 chunk = original_text
-                validator_logs = self.run_validator(
-                    iteration,
-                    validator,
-                    chunk,
-                    metadata,
-                    absolute_property_path,
-                    True,
-                    remainder=finished,
-                    **kwargs,
-                )
                 result = validator_logs.validation_result
                 if result is None:
                     last_chunk_missing_validators.append(validator)
@@ -179,7 +283,7 @@ class SequentialValidatorService(ValidatorServiceBase):
                     validator_partial_acc[id(validator)] += chunk  # type: ignore
                 validator_logs.value_after_validation = chunk
                 if result and result.metadata is not None:
-                    metadata = result.metadata
+                    metadata = merge_metadata(metadata, chunk_metadata, result.metadata)
 
             if refrain_triggered:
                 # if we have a failresult from a refrain/filter validator, yield empty
@@ -272,18 +376,40 @@ class SequentialValidatorService(ValidatorServiceBase):
         # When we have at least one non-None value?
         # When we have all non-None values?
         # Does this depend on whether we are fix or not?
+        # Validators only see the corrections of the validators before them
+        #   if they can change the chunk, otherwise they all run at once.
+        concurrent = not any(
+            validator.on_fail_descriptor == OnFailAction.CUSTOM
+            or validator.override_value_on_pass
+            for validator in validators
+        )
         for chunk, finished in value_stream:
             original_text = chunk
-            for validator in validators:
-                validator_logs = self.run_validator(
-                    iteration,
-                    validator,
-                    chunk,
-                    metadata,
-                    absolute_property_path,
-                    True,
-                    **kwargs,
+            chunk_metadata = metadata
+            validators_logs: List[Optional[ValidatorLogs]] = [None] * len(validators)
+            if concurrent:
+                validators_logs = list(
+                    self.run_validators_concurrently(
+                        iteration,
+                        validators,
+                        chunk,
+                        metadata,
+                        absolute_property_path,
+                        True,
+                        **kwargs,
+                    )
                 )
+            for validator, validator_logs in zip(validators, validators_logs):
+                if validator_logs is None:
+                    validator_logs = self.run_validator(
+                        iteration,
+                        validator,
+                        chunk,
+                        metadata,
+                        absolute_property_path,
+                        True,
+                        **kwargs,
+                    )
                 result = validator_logs.validation_result
                 result = cast(ValidationResult, result)
 
@@ -304,7 +430,11 @@ class SequentialValidatorService(ValidatorServiceBase):
 
                 validator_logs.value_after_validation = chunk
                 if result and result.metadata is not None:
-                    metadata = result.metadata
+                    metadata = (
+                        merge_metadata(metadata, chunk_metadata, result.metadata)
+                        if concurrent
+                        else result.metadata
+                    )
                 # # TODO: Filter is no longer terminal, so we shouldn't yield, right?
                 # if isinstance(chunk, (Refrain, Filter, ReAsk)):
                 #     yield chunk, metadata
@@ -76,8 +76,9 @@ class ValidatorServiceBase:
         value: Any,
         validator: Validator,
         rechecked_value: Optional[ValidationResult] = None,
+        on_fail_descriptor: Optional[Union[str, OnFailAction]] = None,
     ):
-        on_fail_descriptor = validator.on_fail_descriptor
+        on_fail_descriptor = on_fail_descriptor or validator.on_fail_descriptor
         if on_fail_descriptor == OnFailAction.FIX:
             # FIXME: Should we still return fix_value if it is None?
             # I think we should warn and return the original value.
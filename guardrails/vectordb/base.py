@@ -52,6 +52,21 @@ class VectorDBBase(ABC):
         """
         ...
 
+    def similarity_search_vectors(
+        self, vectors: List[List[float]], k: int
+    ) -> List[List[int]]:
+        """Searches for vectors which are similar to each of the given
+        vectors.
+
+        Args:
+            vectors: Vectors to search for.
+            k: Number of similar vectors to return per vector.
+
+        Returns:
+            List[List[int]] List of indexes of the similar vectors, per vector.
+        """
+        return [self.similarity_search_vector(vector, k) for vector in vectors]
+
     def similarity_search(self, text: str, k: int) -> List[int]:
         """Searches for vectors which are similar to the given text.
         Args:
@@ -69,6 +84,23 @@ class VectorDBBase(ABC):
         vector = self._embedder.embed_query(text)
         return self.similarity_search_vector_with_threshold(vector, k, threshold)
 
+    def similarity_search_batch(self, texts: List[str], k: int) -> List[List[int]]:
+        """Searches for vectors which are similar to each of the given texts.
+
+        The texts are embedded together and searched for in a single batch.
+
+        Args:
+            texts: Texts to search for.
+            k: Number of similar vectors to return per text.
+
+        Returns:
+            List[List[int]] List of indexes of the similar vectors, per text.
+        """
+        if not texts:
+            return []
+        vectors = self._embedder.embed_queries(texts)
+        return self.similarity_search_vectors(vectors, k)
+
     def add_texts(self, texts: List[str], ids: Optional[List[Any]] = None) -> None:
         """Adds a list of texts to the store.
 
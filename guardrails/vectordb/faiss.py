@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from guardrails.embedding import EmbeddingBase
 from guardrails.vectordb.base import VectorDBBase
@@ -46,6 +46,58 @@ class Faiss(VectorDBBase):
             raise ImportError(faiss_error)
         return cls(faiss.IndexFlatIP(vector_dim), embedder, path)
 
+    @classmethod
+    def new_ivf_flat_index(
+        cls,
+        vector_dim: int,
+        embedder: EmbeddingBase,
+        path: Optional[str] = None,
+        *,
+        nlist: int = 100,
+        nprobe: int = 8,
+        inner_product: bool = False,
+    ):
+        """Creates an inverted file index, which only searches the `nprobe`
+        of its `nlist` clusters closest to the query.
+
+        The index is trained on the first vectors added to it, so the
+        first batch should hold at least `nlist` vectors, and ideally a
+        representative sample of the corpus.
+        """
+        try:
+            import faiss
+        except ImportError:
+            raise ImportError(faiss_error)
+        metric = faiss.METRIC_INNER_PRODUCT if inner_product else faiss.METRIC_L2
+        index = faiss.index_factory(vector_dim, f"IVF{nlist},Flat", metric)
+        index.nprobe = nprobe
+        return cls(index, embedder, path)
+
+    @classmethod
+    def new_hnsw_index(
+        cls,
+        vector_dim: int,
+        embedder: EmbeddingBase,
+        path: Optional[str] = None,
+        *,
+        m: int = 32,
+        ef_search: int = 64,
+        inner_product: bool = False,
+    ):
+        """Creates a hierarchical navigable small world graph index, with `m`
+        neighbours per node, that explores `ef_search` nodes per query.
+
+        Note that this index does not support searching with a threshold.
+        """
+        try:
+            import faiss
+        except ImportError:
+            raise ImportError(faiss_error)
+        metric = faiss.METRIC_INNER_PRODUCT if inner_product else faiss.METRIC_L2
+        index = faiss.IndexHNSWFlat(vector_dim, m, metric)
+        index.hnsw.efSearch = ef_search
+        return cls(index, embedder, path)
+
     @classmethod
     def new_flat_l2_index_from_embedding(
         cls,
@@ -60,11 +112,21 @@ class Faiss(VectorDBBase):
         return store
 
     @classmethod
-    def load(cls, path: str, embedder: EmbeddingBase):
+    def load(cls, path: str, embedder: EmbeddingBase, *, mmap: bool = False):
+        """Loads an index from disk.
+
+        Args:
+            path: Path of the index.
+            embedder: EmbeddingBase instance to use for embedding the text.
+            mmap: Whether to memory map the index instead of reading it
+                into memory, which suits large indexes that are only
+                searched.
+        """
         if faiss is None:
             raise ImportError(faiss_error)
 
-        index = faiss.read_index(path)
+        io_flags = faiss.IO_FLAG_MMAP if mmap else 0
+        index = faiss.read_index(path, io_flags)
         return cls(index, embedder, path)
 
     def save(self, path: Optional[str] = None):
@@ -79,6 +141,15 @@ class Faiss(VectorDBBase):
         _, scores = self._index.search(np.array([vector]), k)  # type: ignore
         return scores[0].tolist()
 
+    def similarity_search_vectors(
+        self, vectors: List[List[float]], k: int
+    ) -> List[List[int]]:
+        import numpy as np
+
+        # All the vectors are searched with a single call into faiss.
+        _, indexes = self._index.search(np.asarray(vectors, dtype="float32"), k)  # type: ignore
+        return indexes.tolist()
+
     def similarity_search_vector_with_threshold(
         self, vector: List[float], k: int, threshold: float
     ) -> List[int]:
@@ -99,9 +170,23 @@ class Faiss(VectorDBBase):
     def add_vectors(self, vectors: List[List[float]]) -> None:
         import numpy as np
 
+        vectors_array = np.asarray(vectors, dtype="float32")
+        if not self._index.is_trained:
+            self._train(vectors_array)
         # FIXME is this correct usage of `add`?
         #  Arguments missing for parameters "x"
-        self._index.add(np.array(vectors))  # type: ignore
+        self._index.add(vectors_array)  # type: ignore
+
+    def _train(self, vectors: Any) -> None:
+        ivf_index = faiss.try_extract_index_ivf(self._index)
+        if ivf_index is not None and len(vectors) < ivf_index.nlist:
+            raise ValueError(
+                f"The index needs at least {ivf_index.nlist} vectors to be"
+                f" trained on, but only {len(vectors)} were added."
+                " Add more vectors at once or create the index with a smaller"
+                " `nlist`."
+            )
+        self._index.train(vectors)  # type: ignore
 
     def last_index(self) -> int:
         return self._index.ntotal
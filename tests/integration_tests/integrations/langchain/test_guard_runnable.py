@@ -1,16 +1,23 @@
 from typing import Optional
 import io
 import sys
+import threading
+import time
 
 import pytest
 from pydantic import PrivateAttr
 
 from guardrails.guard import Guard
+from guardrails.integrations.langchain.base_runnable import BaseRunnable
 from guardrails.integrations.langchain.guard_runnable import GuardRunnable
 from guardrails.errors import ValidationError
 from guardrails.classes import ValidationOutcome
 
-from tests.integration_tests.test_assets.validators import ReadingTime, RegexMatch
+from tests.integration_tests.test_assets.validators import (
+    LowerCase,
+    ReadingTime,
+    RegexMatch,
+)
 
 
 @pytest.fixture
@@ -140,3 +147,171 @@ def test_guard_runnable_max_retries(
         assert result == expected_result
 
     assert guard.attempt_count == expected_attempts
+
+
+@pytest.mark.asyncio
+async def test_guard_runnable_ainvoke(guard_runnable: GuardRunnable):
+    from langchain_core.messages import AIMessage
+
+    result = await guard_runnable.ainvoke(AIMessage(content="Ice cream is frozen."))
+
+    assert isinstance(result, AIMessage)
+    assert result.content == "Ice cream is frozen."
+    assert guard_runnable.guard.history.last.status == "pass"
+
+    with pytest.raises(ValidationError):
+        await guard_runnable.ainvoke("This response isn't relevant.")
+
+    assert guard_runnable.guard.history.last.status == "fail"
+    assert len(guard_runnable.guard.history) == 2
+
+
+def test_guard_runnable_batch(guard_runnable: GuardRunnable):
+    outputs = ["Ice cream is frozen.", "This response isn't relevant."]
+
+    results = guard_runnable.batch(outputs, return_exceptions=True)
+
+    assert results[0] == "Ice cream is frozen."
+    assert isinstance(results[1], ValidationError)
+    assert len(guard_runnable.guard.history) == 2
+
+    with pytest.raises(ValidationError):
+        guard_runnable.batch(outputs)
+
+
+@pytest.mark.asyncio
+async def test_guard_runnable_abatch(guard_runnable: GuardRunnable):
+    outputs = ["Ice cream is frozen.", "This response isn't relevant."]
+
+    results = await guard_runnable.abatch(outputs, return_exceptions=True)
+
+    assert results[0] == "Ice cream is frozen."
+    assert isinstance(results[1], ValidationError)
+    assert len(guard_runnable.guard.history) == 2
+
+
+class SlowRunnable(BaseRunnable):
+    name = "slow"
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def _validate(self, input: str) -> str:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return input
+
+
+@pytest.mark.parametrize("max_concurrency,concurrent", [(None, True), (1, False)])
+def test_batch_validates_inputs_concurrently(max_concurrency, concurrent):
+    runnable = SlowRunnable()
+
+    results = runnable.batch(
+        ["a", "b", "c", "d"], config={"max_concurrency": max_concurrency}
+    )
+
+    assert results == ["a", "b", "c", "d"]
+    assert (runnable.max_active > 1) is concurrent
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency,concurrent", [(None, True), (1, False)])
+async def test_abatch_honors_max_concurrency(max_concurrency, concurrent):
+    runnable = SlowRunnable()
+
+    results = await runnable.abatch(
+        ["a", "b", "c", "d"], config={"max_concurrency": max_concurrency}
+    )
+
+    assert results == ["a", "b", "c", "d"]
+    assert (runnable.max_active > 1) is concurrent
+
+
+def test_async_guard_is_reused(guard_runnable: GuardRunnable):
+    async_guard = guard_runnable._async_guard()
+
+    assert guard_runnable._async_guard() is async_guard
+    assert async_guard._get_async_api_client() is (
+        guard_runnable._async_guard()._get_async_api_client()
+    )
+
+    guard_runnable.guard = Guard()
+    assert guard_runnable._async_guard() is not async_guard
+
+
+def test_guard_runnable_stream():
+    from langchain_core.messages import AIMessageChunk
+
+    runnable = GuardRunnable(
+        Guard().use(
+            RegexMatch("[A-Z]", match_type="search", on_fail="exception"), on="output"
+        )
+    )
+    chunks = [
+        AIMessageChunk(content=chunk)
+        for chunk in ["Ice cream ", "is frozen. ", "It is ", "sweet."]
+    ]
+
+    results = list(runnable.transform(iter(chunks)))
+
+    assert all(isinstance(result, AIMessageChunk) for result in results)
+    assert "".join(result.content for result in results) == (
+        "Ice cream is frozen. It is sweet."
+    )
+    assert len(results) > 1
+
+
+@pytest.mark.asyncio
+async def test_guard_runnable_astream():
+    runnable = GuardRunnable(
+        Guard().use(
+            RegexMatch("[A-Z]", match_type="search", on_fail="exception"), on="output"
+        )
+    )
+
+    async def chunks():
+        for chunk in ["Ice cream ", "is frozen. ", "It is ", "sweet."]:
+            yield chunk
+
+    results = [result async for result in runnable.atransform(chunks())]
+
+    assert results == ["Ice cream is frozen.", "It is sweet."]
+    assert runnable.guard.history.last.status == "pass"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "stream,expected",
+    [
+        (["QWE"], ["qwe"]),
+        (["Ice cream ", "is FROZEN. ", "Tail"], ["ice cream is frozen.", "tail"]),
+    ],
+)
+async def test_guard_runnable_astream_flushes_unterminated_tail(stream, expected):
+    runnable = GuardRunnable(Guard().use(LowerCase(on_fail="fix"), on="output"))
+
+    async def chunks():
+        for chunk in stream:
+            yield chunk
+
+    results = [result async for result in runnable.atransform(chunks())]
+
+    assert results == expected
+
+
+def test_guard_runnable_stream_flushes_unterminated_tail():
+    runnable = GuardRunnable(
+        Guard().use(
+            RegexMatch("[A-Z]", match_type="search", on_fail="exception"), on="output"
+        )
+    )
+
+    results = list(runnable.transform(iter(["Ice cream ", "is frozen. ", "Tail"])))
+
+    assert "".join(results) == "Ice cream is frozen. Tail"
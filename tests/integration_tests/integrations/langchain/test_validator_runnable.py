@@ -90,3 +90,46 @@ def test_validator_runnable_with_callback_config():
     console_output = captured_output.getvalue()
     assert "Ice cream is delicious." in console_output
     assert "Chocolate is delicious." in console_output
+
+
+@pytest.mark.asyncio
+async def test_validator_runnable_abatch():
+    regex_match = RegexMatch(
+        "Ice cream", match_type="search", on_fail="exception"
+    ).to_runnable()
+
+    results = await regex_match.abatch(
+        ["Ice cream is delicious.", "Chocolate is delicious."], return_exceptions=True
+    )
+
+    assert results[0] == "Ice cream is delicious."
+    assert isinstance(results[1], ValidationError)
+
+    result = await regex_match.ainvoke("Ice cream is cold.")
+    assert result == "Ice cream is cold."
+
+
+def test_validator_runnable_stream():
+    regex_match = RegexMatch("[A-Z]", match_type="search", on_fail="exception")
+    runnable = regex_match.to_runnable()
+
+    results = list(runnable.transform(iter(["Ice cream ", "is cold. ", "Yum"])))
+
+    assert results == ["Ice cream is cold.", "Yum"]
+
+    with pytest.raises(ValidationError):
+        list(runnable.stream("nope. still nope."))
+
+
+@pytest.mark.asyncio
+async def test_validator_runnable_astream():
+    regex_match = RegexMatch("[A-Z]", match_type="search", on_fail="exception")
+    runnable = regex_match.to_runnable()
+
+    async def chunks():
+        for chunk in ["Ice cream ", "is cold. ", "Yum"]:
+            yield chunk
+
+    results = [result async for result in runnable.atransform(chunks())]
+
+    assert results == ["Ice cream is cold.", "Yum"]
@@ -1,5 +1,6 @@
 import pytest
 from guardrails import Guard
+from guardrails.errors import ValidationError
 from typing import List, Optional
 from tests.integration_tests.test_assets.validators import RegexMatch
 
@@ -65,3 +66,123 @@ class TestGuardrailsChatEngine:
         result = guardrails_engine.chat("Mock response")
         assert isinstance(result, AgentChatResponse)
         assert result.response == "Mock response"
+
+    @pytest.mark.asyncio
+    async def test_guardrails_engine_achat(self, guard):
+        engine = MockChatEngine()
+        guardrails_engine = GuardrailsChatEngine(engine, guard)
+
+        with pytest.raises(ValidationError, match="Validation failed"):
+            await guardrails_engine.achat("Mock response")
+
+        async def achat(message, chat_history=None):
+            return AgentChatResponse(response="Mock response")
+
+        engine.achat = achat
+        result = await guardrails_engine.achat("Mock response")
+        assert isinstance(result, AgentChatResponse)
+        assert result.response == "Mock response"
+        assert result.metadata["validation_passed"] is True
+
+    def test_guardrails_engine_stream_chat(self, guard):
+        from llama_index.core.base.llms.types import ChatResponse
+
+        engine = MockChatEngine()
+
+        def stream_chat(message, chat_history=None):
+            deltas = ["Mock response ", "is here. ", "Mock response ", "again."]
+            return StreamingAgentChatResponse(
+                chat_stream=(
+                    ChatResponse(message=ChatMessage(content=delta), delta=delta)
+                    for delta in deltas
+                ),
+                is_writing_to_memory=False,
+            )
+
+        engine.stream_chat = stream_chat
+        guardrails_engine = GuardrailsChatEngine(engine, guard)
+
+        result = guardrails_engine.stream_chat("Mock response")
+        assert isinstance(result, StreamingAgentChatResponse)
+        assert "".join(result.response_gen) == (
+            "Mock response is here. Mock response again."
+        )
+        assert guard.history.last.status == "pass"
+
+    @pytest.mark.asyncio
+    async def test_guardrails_engine_astream_chat(self, guard):
+        from llama_index.core.base.llms.types import ChatResponse
+
+        engine = MockChatEngine()
+
+        async def achat_stream():
+            for delta in ["Mock response ", "is here. ", "Invalid ", "chunk."]:
+                yield ChatResponse(message=ChatMessage(content=delta), delta=delta)
+
+        async def astream_chat(message, chat_history=None):
+            return StreamingAgentChatResponse(
+                achat_stream=achat_stream(), is_writing_to_memory=False
+            )
+
+        engine.astream_chat = astream_chat
+        guardrails_engine = GuardrailsChatEngine(engine, guard)
+
+        result = await guardrails_engine.astream_chat("Mock response")
+        response_gen = result.async_response_gen()
+        assert await response_gen.__anext__() == "Mock response is here."
+        with pytest.raises(ValidationError, match="Validation failed"):
+            await response_gen.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_guardrails_engine_astream_chat_unterminated_tail(self, guard):
+        from llama_index.core.base.llms.types import ChatResponse
+
+        engine = MockChatEngine()
+
+        async def achat_stream():
+            for delta in ["Mock response ", "is here. ", "Mock response ", "tail"]:
+                yield ChatResponse(message=ChatMessage(content=delta), delta=delta)
+
+        async def astream_chat(message, chat_history=None):
+            return StreamingAgentChatResponse(
+                achat_stream=achat_stream(), is_writing_to_memory=False
+            )
+
+        engine.astream_chat = astream_chat
+        guardrails_engine = GuardrailsChatEngine(engine, guard)
+
+        result = await guardrails_engine.astream_chat("Mock response")
+        assert [delta async for delta in result.async_response_gen()] == [
+            "Mock response is here.",
+            "Mock response tail",
+        ]
+
+    def test_guardrails_engine_stream_chat_passes_chat_history(self, guard):
+        from llama_index.core.base.llms.types import ChatResponse
+
+        engine = MockChatEngine()
+        chat_history = [ChatMessage(content="Earlier message")]
+
+        def stream_chat(message, chat_history=None):
+            return StreamingAgentChatResponse(
+                chat_stream=iter(
+                    [ChatResponse(message=ChatMessage(content="Mock response."))]
+                ),
+                is_writing_to_memory=False,
+            )
+
+        engine.stream_chat = stream_chat
+        guardrails_engine = GuardrailsChatEngine(engine, guard)
+
+        result = guardrails_engine.stream_chat("Mock response", chat_history)
+        list(result.response_gen)
+        assert guard.history.last.inputs.kwargs["chat_history"] == chat_history
+
+    def test_guardrails_engine_async_guard_is_cached(self, guard):
+        guardrails_engine = GuardrailsChatEngine(MockChatEngine(), guard)
+
+        assert guardrails_engine.async_guard is guardrails_engine.async_guard
+
+        # Configuring the guard later reaches the cached AsyncGuard
+        guard.configure(num_reasks=5)
+        assert guardrails_engine.async_guard._num_reasks == 5
@@ -61,3 +61,130 @@ class TestGuardrailsQueryEngine:
 
         with pytest.raises(ValidationError, match="Validation failed"):
             guardrails_engine._query(QueryBundle(query_str="Invalid query"))
+
+    @pytest.mark.asyncio
+    async def test_guardrails_engine_aquery(self, guard):
+        from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+        engine = MockQueryEngine()
+
+        async def aquery(_):
+            return Response(response="Mock response")
+
+        engine._aquery = aquery
+        guardrails_engine = GuardrailsQueryEngine(engine, guard)
+
+        result = await guardrails_engine._aquery(QueryBundle(query_str="Mock"))
+        assert isinstance(result, Response)
+        assert result.response == "Mock response"
+        assert result.metadata["validation_passed"] is True
+        assert guard.history.last.status == "pass"
+
+    @pytest.mark.asyncio
+    async def test_guardrails_engine_aquery_validation_failure(self, guard):
+        from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+        guardrails_engine = GuardrailsQueryEngine(MockQueryEngine(), guard)
+
+        with pytest.raises(ValidationError, match="Validation failed"):
+            await guardrails_engine._aquery(QueryBundle(query_str="Invalid query"))
+
+    def test_guardrails_engine_stream_query(self):
+        from llama_index.core.base.response.schema import StreamingResponse
+        from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+        chunks = ["Mock response ", "is here. ", "Mock response ", "again."]
+        engine = MockQueryEngine()
+        engine._query = lambda _: StreamingResponse(response_gen=iter(chunks))
+        guard = Guard().use(RegexMatch("Mock response", match_type="search"))
+        guardrails_engine = GuardrailsQueryEngine(
+            engine, guard, guard_kwargs={"stream": True}
+        )
+
+        result = guardrails_engine._query(QueryBundle(query_str="Mock"))
+        assert isinstance(result, StreamingResponse)
+        assert "".join(result.response_gen) == (
+            "Mock response is here. Mock response again."
+        )
+
+    def test_guardrails_engine_stream_query_validation_failure(self):
+        from llama_index.core.base.response.schema import StreamingResponse
+        from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+        engine = MockQueryEngine()
+        engine._query = lambda _: StreamingResponse(
+            response_gen=iter(["Mock response ", "is here. ", "Invalid ", "chunk."])
+        )
+        guard = Guard().use(RegexMatch("Mock response", match_type="search"))
+        guardrails_engine = GuardrailsQueryEngine(
+            engine, guard, guard_kwargs={"stream": True}
+        )
+
+        result = guardrails_engine._query(QueryBundle(query_str="Mock"))
+        chunks = []
+        with pytest.raises(ValidationError, match="Validation failed"):
+            for chunk in result.response_gen:
+                chunks.append(chunk)
+        assert "".join(chunks).startswith("Mock response is here.")
+
+    @pytest.mark.asyncio
+    async def test_guardrails_engine_astream_query(self):
+        from llama_index.core.base.response.schema import AsyncStreamingResponse
+        from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+        async def chunks():
+            for chunk in ["Mock response ", "is here. ", "Mock response ", "again."]:
+                yield chunk
+
+        async def aquery(_):
+            return AsyncStreamingResponse(response_gen=chunks())
+
+        engine = MockQueryEngine()
+        engine._aquery = aquery
+        guard = Guard().use(RegexMatch("Mock response", match_type="search"))
+        guardrails_engine = GuardrailsQueryEngine(
+            engine, guard, guard_kwargs={"stream": True}
+        )
+
+        result = await guardrails_engine._aquery(QueryBundle(query_str="Mock"))
+        assert isinstance(result, AsyncStreamingResponse)
+        assert [chunk async for chunk in result.async_response_gen()] == [
+            "Mock response is here.",
+            "Mock response again.",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_guardrails_engine_astream_query_unterminated_tail(self):
+        from llama_index.core.base.response.schema import AsyncStreamingResponse
+        from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+        async def chunks():
+            for chunk in ["Mock response ", "is here. ", "Mock response ", "tail"]:
+                yield chunk
+
+        async def aquery(_):
+            return AsyncStreamingResponse(response_gen=chunks())
+
+        engine = MockQueryEngine()
+        engine._aquery = aquery
+        guard = Guard().use(RegexMatch("Mock response", match_type="search"))
+        guardrails_engine = GuardrailsQueryEngine(
+            engine, guard, guard_kwargs={"stream": True}
+        )
+
+        result = await guardrails_engine._aquery(QueryBundle(query_str="Mock"))
+        assert [chunk async for chunk in result.async_response_gen()] == [
+            "Mock response is here.",
+            "Mock response tail",
+        ]
+
+    def test_guardrails_engine_async_guard_is_cached(self, guard):
+        from guardrails.integrations.llama_index import GuardrailsQueryEngine
+
+        guardrails_engine = GuardrailsQueryEngine(MockQueryEngine(), guard)
+
+        assert guardrails_engine.async_guard is guardrails_engine.async_guard
+
+        # Configuring the guard later reaches the cached AsyncGuard
+        guard.configure(num_reasks=5)
+        assert guardrails_engine.async_guard._num_reasks == 5
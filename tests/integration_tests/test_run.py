@@ -1,14 +1,26 @@
+import asyncio
+import json
+import threading
+import time
+from typing import List
+
 import pytest
+from pydantic import BaseModel, Field
 
+from guardrails import AsyncGuard, Guard, Validator, register_validator
 from guardrails.classes.history.call import Call
 from guardrails.classes.history.iteration import Iteration
 from guardrails.classes.llm.llm_response import LLMResponse
 from guardrails.classes.output_type import OutputTypes
+from guardrails.classes.validation.validation_result import PassResult
+from guardrails.errors import ValidationError
 from guardrails.llm_providers import AsyncLiteLLMCallable, LiteLLMCallable
 from guardrails.run import AsyncRunner, Runner
+import guardrails.run.runner as runner_module
 from guardrails.types.on_fail import OnFailAction
 
 from .test_assets import string
+from tests.integration_tests.test_assets.validators.lower_case import LowerCase
 from tests.integration_tests.test_assets.validators.two_words import TwoWords
 
 PROMPT = string.COMPILED_PROMPT
@@ -128,3 +140,312 @@ async def test_sync_async_step_equivalence(mocker):
 
     assert sync_iteration.guarded_output == async_iteration.guarded_output
     assert sync_iteration.reasks == async_iteration.reasks
+
+
+class Fee(BaseModel):
+    name: str = Field(
+        json_schema_extra={"validators": [TwoWords(on_fail=OnFailAction.REASK)]}
+    )
+    explanation: str = Field(
+        json_schema_extra={"validators": [LowerCase(on_fail=OnFailAction.FIX)]}
+    )
+
+
+class Fees(BaseModel):
+    fees: List[Fee]
+
+
+FEES_OUTPUT = json.dumps(
+    {
+        "fees": [
+            {"name": "annual fee", "explanation": "Charged Yearly"},
+            {"name": "late payment fee", "explanation": "charged on late payment"},
+        ]
+    }
+)
+# The reask only asks for the pruned fields that failed
+FEES_REASK_OUTPUT = json.dumps({"fees": [{"name": "late payment"}]})
+
+
+def assert_only_reasked_fields_revalidated(guard, outcome):
+    assert outcome.validation_passed is True
+    assert outcome.validated_output == {
+        "fees": [
+            {"name": "annual fee", "explanation": "charged yearly"},
+            {"name": "late payment", "explanation": "charged on late payment"},
+        ]
+    }
+
+    call = guard.history.first
+    assert call.iterations.length == 2
+    assert len(call.iterations.first.validator_logs) == 4
+    # Only the reasked field is validated on the second iteration.
+    reask_logs = call.iterations.last.validator_logs
+    assert [log.property_path for log in reask_logs] == ["$.fees.1.name"]
+    assert call.iterations.last.validation_response == outcome.validated_output
+
+
+def test_reask_only_revalidates_reasked_fields(mocker):
+    mock_invoke_llm = mocker.patch(
+        "guardrails.llm_providers.LiteLLMCallable._invoke_llm"
+    )
+    mock_invoke_llm.side_effect = [
+        LLMResponse(output=FEES_OUTPUT),
+        LLMResponse(output=FEES_REASK_OUTPUT),
+    ]
+    revalidate = mocker.spy(Runner, "revalidate")
+
+    guard = Guard.for_pydantic(Fees)
+    outcome = guard(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": "Extract the fees."}],
+        num_reasks=1,
+        full_schema_reask=False,
+    )
+
+    assert_only_reasked_fields_revalidated(guard, outcome)
+    assert revalidate.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_reask_only_revalidates_reasked_fields(mocker):
+    mock_invoke_llm = mocker.patch(
+        "guardrails.llm_providers.AsyncLiteLLMCallable.invoke_llm"
+    )
+    mock_invoke_llm.side_effect = [
+        LLMResponse(output=FEES_OUTPUT),
+        LLMResponse(output=FEES_REASK_OUTPUT),
+    ]
+    revalidate = mocker.spy(AsyncRunner, "async_revalidate")
+
+    guard = AsyncGuard.for_pydantic(Fees)
+    outcome = await guard(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": "Extract the fees."}],
+        num_reasks=1,
+        full_schema_reask=False,
+    )
+
+    assert_only_reasked_fields_revalidated(guard, outcome)
+    assert revalidate.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "content,on_fail,expected_calls",
+    [
+        ("name a pizza", OnFailAction.FIX, ["name a pizza"]),
+        ("Name a Pizza", OnFailAction.FIX, ["Name a Pizza", "name a pizza"]),
+    ],
+)
+def test_speculative_input_validation(content, on_fail, expected_calls):
+    llm_calls = []
+
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        llm_calls.append(messages[0]["content"])
+        return "Tomato Cheese"
+
+    guard = Guard().use(LowerCase(on_fail=on_fail), on="messages")
+    guard.configure(speculative_input_validation=True)
+    outcome = guard(llm_api, messages=[{"role": "user", "content": content}])
+
+    assert outcome.validated_output == "Tomato Cheese"
+    # The speculative response is only used if the messages are unchanged.
+    assert sorted(llm_calls) == sorted(expected_calls)
+    assert guard.history.last.iterations.last.inputs.messages[0]["content"] == (
+        content.lower()
+    )
+
+
+def test_speculative_input_validation_failure():
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        return "Tomato Cheese"
+
+    guard = Guard().use(LowerCase(on_fail=OnFailAction.EXCEPTION), on="messages")
+    guard.configure(speculative_input_validation=True)
+
+    with pytest.raises(ValidationError):
+        guard(llm_api, messages=[{"role": "user", "content": "Name a Pizza"}])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content", ["name a pizza", "Name a Pizza"])
+async def test_async_speculative_input_validation(content):
+    llm_calls = []
+
+    async def llm_api(*args, messages=None, **kwargs) -> str:
+        await asyncio.sleep(0)
+        llm_calls.append(messages[0]["content"])
+        return "Tomato Cheese"
+
+    guard = AsyncGuard().use(LowerCase(on_fail=OnFailAction.FIX), on="messages")
+    guard.configure(speculative_input_validation=True)
+    outcome = await guard(llm_api, messages=[{"role": "user", "content": content}])
+
+    assert outcome.validated_output == "Tomato Cheese"
+    # A speculative call with stale messages is replaced by a fresh one.
+    assert llm_calls[-1] == content.lower()
+    assert guard.history.last.iterations.last.inputs.messages[0]["content"] == (
+        content.lower()
+    )
+
+
+def test_multiple_candidates():
+    outputs = iter(["Tomato Cheese Pizza", "Tomato Pizza", "Very Cheesy Pizza"])
+    lock = threading.Lock()
+
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        with lock:
+            return next(outputs)
+
+    guard = Guard().use(TwoWords(on_fail=OnFailAction.REASK))
+    outcome = guard(
+        llm_api,
+        messages=[{"role": "user", "content": "Name a pizza."}],
+        num_candidates=3,
+    )
+
+    assert outcome.validation_passed is True
+    assert outcome.validated_output == "Tomato Pizza"
+    assert outcome.raw_llm_output == "Tomato Pizza"
+    # No reask is needed since one of the candidates passed.
+    assert guard.history.last.iterations.length == 1
+
+
+def test_multiple_candidates_reask_if_all_fail():
+    outputs = iter(["Tomato Cheese Pizza", "Very Cheesy Pizza", "Tomato Pizza"])
+    lock = threading.Lock()
+
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        with lock:
+            return next(outputs, "Tomato Pizza")
+
+    guard = Guard().use(TwoWords(on_fail=OnFailAction.REASK))
+    outcome = guard(
+        llm_api,
+        messages=[{"role": "user", "content": "Name a pizza."}],
+        num_candidates=2,
+        num_reasks=1,
+    )
+
+    assert outcome.validation_passed is True
+    assert outcome.validated_output == "Tomato Pizza"
+    assert guard.history.last.iterations.length == 2
+
+
+def test_runner_steps_share_one_executor(mocker):
+    thread_pool = mocker.spy(runner_module, "ThreadPoolExecutor")
+    threads = set()
+
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        threads.add(threading.current_thread().name)
+        return "Tomato Pizza"
+
+    guard = Guard().use(TwoWords(on_fail=OnFailAction.REASK))
+    guard.use(LowerCase(on_fail=OnFailAction.FIX), on="messages")
+    guard.configure(speculative_input_validation=True)
+    for _ in range(3):
+        outcome = guard(
+            llm_api,
+            messages=[{"role": "user", "content": "name a pizza."}],
+            num_candidates=2,
+        )
+        assert outcome.validated_output == "Tomato Pizza"
+
+    # Speculative calls, candidate calls and candidate validation all run on
+    #   the shared pools, which are created at most once per process.
+    assert thread_pool.call_count <= 2
+    assert runner_module.get_runner_executor() is runner_module.get_runner_executor()
+    assert all(name.startswith("guardrails-runner") for name in threads)
+
+
+def test_speculative_candidate_calls_are_concurrent():
+    # Candidate calls made from a speculative call on a runner worker
+    #   would time out waiting on each other if they ran one at a time.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        barrier.wait()
+        return "Tomato Pizza"
+
+    guard = Guard().use(TwoWords(on_fail=OnFailAction.REASK))
+    guard.use(LowerCase(on_fail=OnFailAction.FIX), on="messages")
+    guard.configure(speculative_input_validation=True)
+    outcome = guard(
+        llm_api,
+        messages=[{"role": "user", "content": "name a pizza."}],
+        num_candidates=2,
+    )
+
+    assert outcome.validated_output == "Tomato Pizza"
+
+
+@register_validator("test-records-candidate", data_type="string")
+class RecordsCandidate(Validator):
+    def validate(self, value, metadata):
+        # The kept candidate finishes first, so it would be overwritten
+        #   if the candidates shared the metadata.
+        time.sleep(0 if value == "Tomato Pizza" else 0.1)
+        metadata["candidate"] = value
+        return PassResult()
+
+
+def test_multiple_candidates_keep_metadata_of_selected_candidate():
+    outputs = iter(["Tomato Cheese Pizza", "Tomato Pizza", "Very Cheesy Pizza"])
+    lock = threading.Lock()
+
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        with lock:
+            return next(outputs)
+
+    metadata = {"source": "test"}
+    guard = Guard().use(TwoWords(on_fail=OnFailAction.REASK)).use(RecordsCandidate())
+    outcome = guard(
+        llm_api,
+        messages=[{"role": "user", "content": "Name a pizza."}],
+        num_candidates=3,
+        metadata=metadata,
+    )
+
+    assert outcome.validated_output == "Tomato Pizza"
+    assert metadata == {"source": "test", "candidate": "Tomato Pizza"}
+
+
+def test_multiple_candidates_litellm(mocker):
+    mock_invoke_llm = mocker.patch(
+        "guardrails.llm_providers.LiteLLMCallable._invoke_llm"
+    )
+    mock_invoke_llm.return_value = LLMResponse(
+        output="Tomato Cheese Pizza",
+        candidate_outputs=["Tomato Cheese Pizza", "Tomato Pizza"],
+    )
+
+    guard = Guard().use(TwoWords(on_fail=OnFailAction.REASK))
+    outcome = guard(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": "Name a pizza."}],
+        num_candidates=2,
+    )
+
+    assert outcome.validated_output == "Tomato Pizza"
+    # LiteLLM generates every candidate in a single request.
+    assert mock_invoke_llm.call_count == 1
+    assert mock_invoke_llm.call_args.kwargs["n"] == 2
+
+
+@pytest.mark.asyncio
+async def test_async_multiple_candidates():
+    outputs = iter(["Tomato Cheese Pizza", "Tomato Pizza", "Very Cheesy Pizza"])
+
+    async def llm_api(*args, messages=None, **kwargs) -> str:
+        return next(outputs)
+
+    guard = AsyncGuard().use(TwoWords(on_fail=OnFailAction.REASK))
+    outcome = await guard(
+        llm_api,
+        messages=[{"role": "user", "content": "Name a pizza."}],
+        num_candidates=3,
+    )
+
+    assert outcome.validation_passed is True
+    assert outcome.validated_output == "Tomato Pizza"
+    assert guard.history.last.iterations.length == 1
@@ -334,6 +334,11 @@ def test_streaming_with_openai_chat_callable(
     assert actual_output.raw_llm_output == json.dumps(expected_raw_output)
     assert actual_output.validated_output == expected_validated_output
 
+    llm_response = guard.history.last.iterations.last.outputs.llm_response_info
+    assert "".join(llm_response.to_interface().stream_output) == json.dumps(
+        expected_raw_output
+    )
+
 
 STR_LLM_CHUNKS = [
     # 38 characters
@@ -523,6 +528,30 @@ In his HEART, he's always THERE."""
     )
 
 
+def test_streamed_iteration_reports_logs_with_chunks(mocker):
+    mocker.patch(
+        "openai.resources.chat.completions.Completions.create",
+        return_value=mock_openai_chat_completion_create(
+            ["Hello ", "there. ", "How ", "are you. "]
+        ),
+    )
+
+    guard = gd.Guard().use(LowerCase(on_fail=OnFailAction.FIX))
+    gen = guard(
+        llm_api=openai.chat.completions.create,
+        messages=[{"role": "user", "content": "Say hello."}],
+        model="gpt-4",
+        stream=True,
+    )
+    assert [res.validated_output for res in gen] == ["hello there.", "how are you."]
+
+    iteration = guard.history.last.iterations.last
+    # The validator logs a None result while it accumulates each sentence
+    assert len(iteration.outputs.validator_logs) > 2
+    chunks = [log.validation_result.validated_chunk for log in iteration.validator_logs]
+    assert chunks == ["Hello there.", "How are you."]
+
+
 def test_fix_behavior_two_validators(mocker):
     mocker.patch(
         "openai.resources.chat.completions.Completions.create",
@@ -1,4 +1,4 @@
-from asyncio import get_event_loop
+from asyncio import get_event_loop, get_running_loop
 from asyncio.unix_events import _UnixSelectorEventLoop
 import os
 import pytest
@@ -156,14 +156,15 @@ class TestShouldRunSync:
 
 
 class TestGetLoop:
-    def test_raises_if_loop_is_running(self):
+    def test_background_loop_is_used_if_loop_is_running(self):
         loop = get_event_loop()
 
         async def callback():
-            # NOTE: This means only AsyncGuard will parallelize validators
-            #       if it's called within an async function.
-            with pytest.raises(RuntimeError, match="An event loop is already running."):
-                get_loop()
+            # Validation runs on a loop of its own, so sync guards still
+            #   parallelize validators when called within an async function.
+            background_loop = get_loop()
+            assert background_loop is not get_running_loop()
+            assert background_loop.is_running()
 
         loop.run_until_complete(callback())
 
@@ -238,11 +239,11 @@ class TestValidate:
         AsyncValidatorService.__init__.assert_called_once()
         AsyncValidatorService.validate.assert_called_once()
 
-    def test_sync_busy_loop(self, mocker):
-        from guardrails.validator_service import validate, SequentialValidatorService
+    def test_async_busy_loop(self, mocker):
+        from guardrails.validator_service import validate, AsyncValidatorService
 
-        mocker.spy(SequentialValidatorService, "__init__")
-        mocker.spy(SequentialValidatorService, "validate")
+        mocker.spy(AsyncValidatorService, "__init__")
+        mocker.spy(AsyncValidatorService, "validate")
 
         iteration = Iteration(
             call_id="mock_call_id",
@@ -252,26 +253,19 @@ class TestValidate:
         loop = get_event_loop()
 
         async def callback():
-            with pytest.warns(
-                Warning,
-                match=(
-                    "Could not obtain an event loop."
-                    " Falling back to synchronous validation."
-                ),
-            ):
-                value, metadata = validate(
-                    value="value",
-                    metadata={},
-                    validator_map={},
-                    iteration=iteration,
-                )
-                assert value == "value"
-                assert metadata == {}
+            value, metadata = validate(
+                value="value",
+                metadata={},
+                validator_map={},
+                iteration=iteration,
+            )
+            assert value == "value"
+            assert metadata == {}
 
         loop.run_until_complete(callback())
 
-        SequentialValidatorService.__init__.assert_called_once()
-        SequentialValidatorService.validate.assert_called_once()
+        AsyncValidatorService.__init__.assert_called_once()
+        AsyncValidatorService.validate.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -5,8 +5,13 @@ import pytest
 from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
 from guardrails.actions.reask import (
     FieldReAsk,
+    SkeletonReAsk,
     gather_reasks,
+    get_ancestor_paths,
+    get_reask_paths,
+    get_reask_response_path,
     get_reask_setup,
+    get_reference_path,
     prune_obj_for_reasking,
     sub_reasks_with_fixed_values,
 )
@@ -117,6 +122,69 @@ def test_sub_reasks_with_fixed_values(input_dict, expected_dict):
     assert sub_reasks_with_fixed_values(input_dict) == expected_dict
 
 
+@pytest.mark.parametrize(
+    "path,expected_reference_path",
+    [
+        ([], "$"),
+        (["a"], "$.a"),
+        (["a", 1], "$.a.*"),
+        (["a", 1, "b"], "$.a.b"),
+        (["a", 1, "b", 0], "$.a.b.*"),
+    ],
+)
+def test_get_reference_path(path, expected_reference_path):
+    assert get_reference_path(path) == expected_reference_path
+
+
+def test_get_reask_paths():
+    fail_results = [FailResult(error_message="Error Msg")]
+    field_reasks = [
+        FieldReAsk(incorrect_value=-1, fail_results=fail_results, path=["a", 0]),
+        FieldReAsk(incorrect_value=-1, fail_results=fail_results, path=["b"]),
+    ]
+    assert get_reask_paths(field_reasks) == [["a", 0], ["b"]]
+    assert get_reask_paths([]) is None
+    assert (
+        get_reask_paths(
+            [
+                *field_reasks,
+                SkeletonReAsk(incorrect_value={}, fail_results=fail_results),
+            ]
+        )
+        is None
+    )
+
+
+def test_get_ancestor_paths():
+    assert get_ancestor_paths([["a", 0, "b"], ["a", 1, "b"], ["c"]]) == [
+        ["a", 0],
+        ["a", 1],
+        ["a"],
+        [],
+    ]
+
+
+def test_get_reask_response_path():
+    fail_results = [FailResult(error_message="Error Msg")]
+    path = ["fees", 2, "name"]
+    previous_output = {
+        "fees": [
+            {"name": "annual fee"},
+            {"name": FieldReAsk(incorrect_value="x", fail_results=fail_results)},
+            {"name": FieldReAsk(incorrect_value="y", fail_results=fail_results)},
+        ]
+    }
+    pruned_response = {"fees": [{"name": "late fee"}, {"name": "cash advance"}]}
+    full_response = {"fees": [{"name": "a"}, {"name": "b"}, {"name": "c"}]}
+
+    assert get_reask_response_path(previous_output, pruned_response, path) == [
+        "fees",
+        1,
+        "name",
+    ]
+    assert get_reask_response_path(previous_output, full_response, path) == path
+
+
 def test_gather_reasks():
     """Test that reasks are gathered."""
     input_dict = {
@@ -0,0 +1,70 @@
+import tracemalloc
+
+from guardrails.classes.generic import StreamBuffer
+from guardrails.classes.llm.llm_response import LLMResponse
+
+
+def test_stream_buffer_accumulates_chunks():
+    buffer = StreamBuffer(["hello"])
+
+    buffer.append(" ")
+    buffer.append("")
+    buffer.append(None)
+    assert buffer.text == "hello "
+    buffer.append("world")
+
+    assert buffer.text == "hello world"
+    assert str(buffer) == "hello world"
+    assert len(buffer) == len("hello world")
+    assert list(buffer.chunks) == ["hello", " ", "world"]
+    assert list(buffer) == ["hello", " ", "world"]
+
+
+def test_stream_buffer_does_not_retain_joined_text():
+    chunk = "x" * 1024
+    buffer = StreamBuffer([chunk] * 256)
+
+    tracemalloc.start()
+    try:
+        text = buffer.text
+        del text
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # The 256 KiB joined string is freed along with the caller's reference
+    assert retained < len(chunk) * 16
+    assert not StreamBuffer()
+
+
+def test_stream_buffer_appends_without_copying_text():
+    buffer = StreamBuffer()
+    chunk = "x" * 1024
+
+    tracemalloc.start()
+    try:
+        for _ in range(256):
+            buffer.append(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Only the list of references grows; no intermediate text is built
+    assert peak < len(chunk) * 16
+    assert len(buffer) == 256 * len(chunk)
+
+
+def test_recorded_stream_is_serialized_without_copying_the_stream():
+    def stream():
+        yield "hello "
+        yield "world"
+
+    response = LLMResponse(output="", stream_output=stream())
+    buffer = response.record_stream()
+    assert response.record_stream() is buffer
+
+    buffer.append(next(response.stream_output))
+    assert response.to_interface().stream_output == ["hello "]
+
+    # The stream itself is left for its consumer
+    assert next(response.stream_output) == "world"
@@ -5,7 +5,7 @@ from guardrails.constants import error_status, fail_status, not_run_status, pass
 from guardrails.classes.llm.llm_response import LLMResponse
 from guardrails.classes.validation.validator_logs import ValidatorLogs
 from guardrails.actions.reask import ReAsk
-from guardrails.validator_base import FailResult, PassResult
+from guardrails.validator_base import ErrorSpan, FailResult, PassResult
 
 
 def test_empty_initialization():
@@ -194,3 +194,98 @@ def test_status_reask():
     status = outputs.status
 
     assert status == fail_status
+
+
+def chunk_log(chunk: str, result=None) -> ValidatorLogs:
+    log = ValidatorLogs(
+        registered_name="no-shouting",
+        validator_name="no-shouting",
+        value_before_validation=chunk,
+        property_path="$",
+    )
+    if result is not None:
+        result.validated_chunk = chunk
+        log.validation_result = result
+    return log
+
+
+def shouting(chunk: str) -> FailResult:
+    return FailResult(
+        error_message="No shouting",
+        error_spans=[ErrorSpan(start=0, end=len(chunk), reason="shouting")],
+    )
+
+
+def test_error_spans_in_output_follow_appended_logs():
+    outputs = Outputs()
+    outputs.validator_logs.append(chunk_log("hello ", PassResult()))
+    outputs.validator_logs.append(chunk_log("WORLD", shouting("WORLD")))
+
+    spans = outputs.error_spans_in_output
+    assert [(s.start, s.end) for s in spans] == [(6, 11)]
+    assert outputs.failed_validations == [outputs.validator_logs[1]]
+
+    # A log is appended before its validator runs, and gets its result after
+    pending = chunk_log("AGAIN")
+    outputs.validator_logs.append(pending)
+    assert [(s.start, s.end) for s in outputs.error_spans_in_output] == [(6, 11)]
+
+    pending.validation_result = shouting("AGAIN")
+    pending.validation_result.validated_chunk = "AGAIN"
+    spans = outputs.error_spans_in_output
+    assert [(s.start, s.end) for s in spans] == [(6, 11), (11, 16)]
+    assert outputs.failed_validations == outputs.validator_logs[1:]
+    assert outputs.validator_logs_with_chunks == outputs.validator_logs
+
+
+def test_derived_views_are_not_recomputed(mocker):
+    outputs = Outputs(validator_logs=[chunk_log("WORLD", shouting("WORLD"))])
+    assert len(outputs.error_spans_in_output) == 1
+
+    collect = mocker.patch("guardrails.classes.history.outputs._collect_error_spans")
+    outputs.error_spans_in_output
+    outputs.failed_validations
+
+    collect.assert_not_called()
+
+
+def test_derived_views_follow_replaced_logs():
+    outputs = Outputs(validator_logs=[chunk_log("WORLD", shouting("WORLD"))])
+    assert len(outputs.failed_validations) == 1
+
+    outputs.validator_logs = [chunk_log("hello", PassResult())]
+
+    assert outputs.failed_validations == []
+    assert outputs.error_spans_in_output == []
+
+
+def test_logs_without_a_result_do_not_hold_back_later_logs():
+    # A streamed validator that is still accumulating logs a None result
+    accumulating = chunk_log("HEL")
+    outputs = Outputs(validator_logs=[accumulating, chunk_log("LO", shouting("LO"))])
+
+    assert outputs.failed_validations == [outputs.validator_logs[1]]
+    assert outputs.validator_logs_with_chunks == [outputs.validator_logs[1]]
+    assert [(s.start, s.end) for s in outputs.error_spans_in_output] == [(0, 2)]
+
+    outputs.validator_logs.append(chunk_log("THERE", shouting("THERE")))
+    assert outputs.validator_logs_with_chunks == outputs.validator_logs[1:]
+    assert [(s.start, s.end) for s in outputs.error_spans_in_output] == [
+        (0, 2),
+        (2, 7),
+    ]
+
+
+def test_pending_log_resolved_out_of_order_keeps_log_order():
+    first = chunk_log("HEL")
+    outputs = Outputs(validator_logs=[first, chunk_log("LO", shouting("LO"))])
+    assert outputs.failed_validations == [outputs.validator_logs[1]]
+
+    first.validation_result = shouting("HEL")
+    first.validation_result.validated_chunk = "HEL"
+
+    assert outputs.failed_validations == outputs.validator_logs
+    assert [(s.start, s.end) for s in outputs.error_spans_in_output] == [
+        (0, 3),
+        (3, 5),
+    ]
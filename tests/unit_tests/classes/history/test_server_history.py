@@ -0,0 +1,160 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from guardrails_api_client.models import (
+    Call as ICall,
+    ValidationOutcome as IValidationOutcome,
+)
+
+from guardrails import Guard
+from guardrails.classes.history import Call
+from guardrails.classes.history.server_history import ServerHistory
+from guardrails.settings import settings
+
+
+def i_calls(*ids: str):
+    return [ICall.from_dict({"id": call_id, "iterations": []}) for call_id in ids]
+
+
+def call(call_id: str) -> Call:
+    return Call.from_interface(i_calls(call_id)[0])
+
+
+class TestServerHistory:
+    def test_fetches_are_deferred_until_read(self):
+        fetch = MagicMock(return_value=i_calls("1"))
+        history = ServerHistory(call("0"))
+
+        history.defer(fetch)
+
+        fetch.assert_not_called()
+        assert history.pending == 1
+        assert [call.id for call in history] == ["0", "1"]
+        assert history.pending == 0
+        fetch.assert_called_once()
+
+    def test_fetches_load_in_call_order_before_writes(self):
+        history = ServerHistory()
+        history.defer(lambda: i_calls("1"))
+        history.defer(lambda: i_calls("2"))
+
+        history.push(call("3"))
+
+        assert history.length == 3
+        assert history.last.id == "3"
+        assert [call.id for call in history] == ["1", "2", "3"]
+
+    def test_failed_fetches_are_skipped(self):
+        def fail():
+            raise RuntimeError("server down")
+
+        history = ServerHistory()
+        history.defer(fail)
+        history.defer(lambda: i_calls("2"))
+
+        assert history.first.id == "2"
+        assert len(history) == 1
+
+    @pytest.mark.asyncio
+    async def test_aload_prefers_async_fetches(self):
+        fetch = MagicMock(return_value=i_calls("1"))
+
+        async def afetch():
+            return i_calls("1")
+
+        history = ServerHistory()
+        history.defer(fetch, afetch)
+        history.defer(lambda: i_calls("2"))
+
+        await history.aload()
+
+        fetch.assert_not_called()
+        assert history.pending == 0
+        assert [call.id for call in history] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_aloads_fetch_each_call_once_in_order(self):
+        released = asyncio.Event()
+        fetched = []
+
+        async def afetch(call_id: str):
+            if call_id == "1":
+                await released.wait()
+            fetched.append(call_id)
+            return i_calls(call_id)
+
+        history = ServerHistory()
+        history.defer(lambda: i_calls("1"), lambda: afetch("1"))
+        history.defer(lambda: i_calls("2"), lambda: afetch("2"))
+
+        loads = [asyncio.create_task(history.aload()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        assert list.__len__(history) == 0
+        assert history.pending == 2
+
+        released.set()
+        await asyncio.gather(*loads)
+
+        assert fetched == ["1", "2"]
+        assert history.pending == 0
+        assert [call.id for call in history] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_load_completes_an_aload_in_flight(self):
+        released = asyncio.Event()
+
+        async def afetch():
+            await released.wait()
+            return i_calls("1")
+
+        history = ServerHistory()
+        history.defer(lambda: i_calls("1"), afetch)
+        history.defer(lambda: i_calls("2"))
+
+        in_flight = asyncio.create_task(history.aload())
+        await asyncio.sleep(0)
+        history.load()
+
+        assert [call.id for call in history] == ["1", "2"]
+
+        released.set()
+        await in_flight
+
+        assert [call.id for call in history] == ["1", "2"]
+
+
+def test_guard_defers_server_history(mocker, monkeypatch):
+    monkeypatch.setattr(settings, "use_server", True)
+    monkeypatch.setenv("GUARD_HISTORY_ENABLED", "true")
+    api_client = MagicMock()
+    api_client.fetch_guard.return_value = None
+    mocker.patch("guardrails.guard.GuardrailsApiClient", return_value=api_client)
+    api_client.validate.return_value = IValidationOutcome.from_dict(
+        {
+            "callId": "1",
+            "rawLlmOutput": "hello",
+            "validatedOutput": "hello",
+            "validationPassed": False,
+            "validationSummaries": [
+                {
+                    "validatorName": "ValidLength",
+                    "validatorStatus": "fail",
+                    "propertyPath": "$",
+                    "failureReason": "too long",
+                }
+            ],
+        }
+    )
+    api_client.get_history.return_value = i_calls("1")
+    guard = Guard(name="my-guard")
+
+    outcome = guard.validate("hello")
+
+    assert api_client.validate.call_count == 1
+    api_client.get_history.assert_not_called()
+    assert [s.failure_reason for s in outcome.validation_summaries] == ["too long"]
+    assert guard.history.last.id == "1"
+    api_client.get_history.assert_called_once_with("my-guard", "1")
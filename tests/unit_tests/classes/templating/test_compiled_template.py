@@ -0,0 +1,43 @@
+from string import Template
+
+import pytest
+
+from guardrails.classes.templating.compiled_template import CompiledTemplate
+from guardrails.classes.templating.namespace_template import NamespaceTemplate
+from guardrails.utils.constants import constants, substitute_constants
+
+
+@pytest.mark.parametrize(
+    "source,mapping",
+    [
+        ("${a} and $b", {"a": 1, "b": "two"}),
+        ("${a} and ${missing}", {"a": "one"}),
+        ("costs $$5 ${a}", {"a": "today"}),
+        ("trailing $", {}),
+        ("${a}${a}$a", {"a": "x"}),
+        ("{not_a_var} ${ unbalanced", {"not_a_var": "x"}),
+    ],
+)
+def test_safe_substitute_matches_template(source, mapping):
+    compiled = CompiledTemplate(source)
+    assert compiled.safe_substitute(**mapping) == Template(source).safe_substitute(
+        **mapping
+    )
+    assert compiled.identifiers == Template(source).get_identifiers()
+
+
+def test_compile_is_cached():
+    first = CompiledTemplate.compile("${a} ${b}")
+    assert CompiledTemplate.compile("${a} ${b}") is first
+    assert CompiledTemplate.compile("${a} ${b}", NamespaceTemplate) is not first
+
+
+def test_substitute_constants():
+    text = "${gr.complete_json_suffix} ${document} ${gr.complete_json_suffix}"
+    expected = (
+        f"{constants['complete_json_suffix']} ${{document}} "
+        f"{constants['complete_json_suffix']}"
+    )
+    assert substitute_constants(text) == expected
+    # Text without constants is returned untouched.
+    assert substitute_constants("costs $$5") == "costs $$5"
@@ -1,3 +1,8 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
 import pytest
 
 
@@ -6,3 +11,46 @@ def runner():
     from typer.testing import CliRunner
 
     return CliRunner()
+
+
+@pytest.fixture
+def stub_server():
+    """A local HTTP server that answers GET requests with canned JSON.
+
+    Register responses with `stub_server.responses[path] = (status, body)`.
+    """
+    responses = {}
+    requested = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested.append(self.path)
+            status, body = responses.get(self.path, (404, {"message": "Not Found"}))
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def stop():
+        server.shutdown()
+        server.server_close()
+
+    host, port = server.server_address[:2]
+    stub = SimpleNamespace(
+        url=f"http://{host}:{port}",
+        responses=responses,
+        requested=requested,
+        stop=stop,
+    )
+    yield stub
+    if thread.is_alive():
+        stop()
@@ -11,6 +11,7 @@ from guardrails.cli.server.hub_client import (
     TOKEN_INVALID_MESSAGE,
     InvalidTokenError,
     ExpiredTokenError,
+    fetch_module_manifest,
     get_jwt_token,
 )
 
@@ -21,10 +22,57 @@ def test_fetch():
     assert 1 == 1
 
 
-# TODO
-@pytest.mark.skip()
-def test_fetch_module_manifest():
-    assert 1 == 1
+@pytest.fixture
+def hub(stub_server, tmp_path, monkeypatch):
+    from guardrails.cli.metadata_cache import MetadataCache
+    from guardrails.cli.server import hub_client
+
+    cache = MetadataCache(str(tmp_path))
+    monkeypatch.setattr(hub_client, "VALIDATOR_HUB_SERVICE", stub_server.url)
+    monkeypatch.setattr(hub_client, "metadata_cache", cache)
+    stub_server.responses["/validator/guardrails/detect_pii/manifest"] = (
+        200,
+        MANIFEST,
+    )
+    return stub_server, cache
+
+
+MANIFEST = {"id": "guardrails/detect_pii", "name": "detect_pii"}
+
+
+def test_fetch_module_manifest(hub):
+    stub_server, _ = hub
+
+    assert fetch_module_manifest("guardrails/detect_pii", None) == MANIFEST
+    assert fetch_module_manifest("guardrails/detect_pii", None) == MANIFEST
+
+    assert stub_server.requested == ["/validator/guardrails/detect_pii/manifest"]
+
+
+def test_fetch_module_manifest_falls_back_to_stale_cache(hub):
+    stub_server, cache = hub
+    fetch_module_manifest("guardrails/detect_pii", None)
+
+    cache.ttl = 1e-9
+    stub_server.stop()
+
+    assert fetch_module_manifest("guardrails/detect_pii", None) == MANIFEST
+
+
+def test_fetch_module_manifest_refreshes_stale_cache(hub):
+    stub_server, cache = hub
+    fetch_module_manifest("guardrails/detect_pii", None)
+    updated = {**MANIFEST, "name": "detect-pii"}
+    stub_server.responses["/validator/guardrails/detect_pii/manifest"] = (
+        200,
+        updated,
+    )
+
+    cache.ttl = 1e-9
+    assert fetch_module_manifest("guardrails/detect_pii", None) == updated
+    cache.ttl = 60
+    assert fetch_module_manifest("guardrails/detect_pii", None) == updated
+    assert len(stub_server.requested) == 2
 
 
 # TODO
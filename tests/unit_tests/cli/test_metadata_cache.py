@@ -0,0 +1,92 @@
+import os
+from io import StringIO
+
+from rich.console import Console
+
+from guardrails.cli import version
+from guardrails.cli.metadata_cache import MetadataCache
+
+
+def test_entries_round_trip_through_disk(tmp_path):
+    MetadataCache(str(tmp_path)).set("key", {"a": [1, 2]})
+
+    cached = MetadataCache(str(tmp_path)).get("key")
+
+    assert cached is not None
+    assert cached.value == {"a": [1, 2]}
+    assert MetadataCache(str(tmp_path), ttl=60).is_fresh(cached)
+    assert not MetadataCache(str(tmp_path), ttl=1e-9).is_fresh(cached)
+    assert MetadataCache(str(tmp_path)).get("other") is None
+
+
+def test_corrupt_entries_are_ignored(tmp_path):
+    cache = MetadataCache(str(tmp_path))
+    cache.set("key", "value")
+    (path,) = [tmp_path / name for name in os.listdir(tmp_path)]
+    path.write_text("{not json")
+
+    assert cache.get("key") is None
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = MetadataCache(str(tmp_path / "cache"), ttl=0)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    assert not (tmp_path / "cache").exists()
+
+
+def test_unwritable_cache_is_ignored(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    MetadataCache(str(blocker / "cache")).set("key", "value")
+
+
+def test_refreshes_run_once_per_key(tmp_path):
+    cache = MetadataCache(str(tmp_path))
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return "value"
+
+    thread = cache.refresh_in_background("key", fetch)
+    cache.wait_for_refreshes(5)
+
+    assert thread is not None
+    assert calls == [1]
+    assert cache.get("key").value == "value"
+
+
+class TestVersionWarnings:
+    def run(self, monkeypatch, cache, url):
+        monkeypatch.setattr(version, "metadata_cache", cache)
+        monkeypatch.setattr(version, "PYPI_URL", url)
+        monkeypatch.setattr(version, "get_guardrails_version", lambda: "0.1.0")
+        output = StringIO()
+        version.version_warnings_if_applicable(Console(file=output))
+        return output.getvalue()
+
+    def test_checks_in_the_background(self, stub_server, tmp_path, monkeypatch):
+        stub_server.responses["/pypi/guardrails-ai/json"] = (
+            200,
+            {"info": {"version": "9.9.9"}},
+        )
+        url = f"{stub_server.url}/pypi/guardrails-ai/json"
+        cache = MetadataCache(str(tmp_path))
+
+        assert self.run(monkeypatch, cache, url) == ""
+        cache.wait_for_refreshes(5)
+        assert "9.9.9" in self.run(monkeypatch, cache, url)
+        assert len(stub_server.requested) == 1
+
+    def test_uses_stale_version_offline(self, stub_server, tmp_path, monkeypatch):
+        url = f"{stub_server.url}/pypi/guardrails-ai/json"
+        stub_server.stop()
+        cache = MetadataCache(str(tmp_path), ttl=1e-9)
+        cache.set(url, "9.9.9")
+
+        assert "9.9.9" in self.run(monkeypatch, cache, url)
+        cache.wait_for_refreshes(5)
+        assert cache.get(url).value == "9.9.9"
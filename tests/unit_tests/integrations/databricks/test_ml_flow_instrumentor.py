@@ -1,9 +1,11 @@
 from asyncio import Future
+import threading
 import pytest
 from unittest.mock import MagicMock
 
 from guardrails.guard import Guard
 from guardrails.async_guard import AsyncGuard
+from guardrails.classes.generic.stack import Stack
 from guardrails.classes.history.call import Call
 from guardrails.classes.history.iteration import Iteration
 from guardrails.classes.llm.llm_response import LLMResponse
@@ -683,3 +685,116 @@ class TestMlFlowInstrumentor:
             init_kwargs={},
             validation_session_id="unknown",
         )
+
+    def test_buffered_start_span(self, mocker):
+        mock_start_span = mocker.patch(
+            "guardrails.integrations.databricks.ml_flow_instrumentor.mlflow.start_span"
+        )
+
+        from guardrails.integrations.databricks import MlFlowInstrumentor
+        from guardrails.integrations.databricks.span_buffer import BufferedSpan
+
+        m = MlFlowInstrumentor("mock experiment", buffered=True)
+        mock_export_spans = mocker.patch.object(m.span_buffer, "exporter")
+
+        with m._start_span(
+            name="guardrails/guard",
+            span_type="guard",
+            attributes={"type": "guardrails/guard"},
+        ) as guard_span:
+            assert m._get_current_span() is guard_span
+
+        assert m.flush(5)
+
+        mock_start_span.assert_not_called()
+        assert isinstance(guard_span, BufferedSpan)
+        mock_export_spans.assert_called_once_with([guard_span])
+
+    def test_buffered_step_attributes_are_added_on_export(self, mocker):
+        main_thread = threading.get_ident()
+        recorded = []
+
+        def add_step_attributes(span, response, runner, call_log):
+            recorded.append((threading.get_ident(), len(call_log.iterations)))
+            span.set_attribute("step.index", response.index)
+
+        mocker.patch(
+            "guardrails.integrations.databricks.ml_flow_instrumentor.add_step_attributes",
+            side_effect=add_step_attributes,
+        )
+
+        from guardrails.integrations.databricks import MlFlowInstrumentor
+
+        m = MlFlowInstrumentor("mock experiment", buffered=True)
+        mock_export_spans = mocker.patch.object(m.span_buffer, "exporter")
+        iteration = Iteration(call_id="mock call id", index=0)
+        call_log = Call(iterations=Stack(iteration))
+        wrapped_step = m._instrument_runner_step(MagicMock(return_value=iteration))
+
+        with m._start_span("guardrails/guard", "guard", {}) as guard_span:
+            wrapped_step(MagicMock(spec=Runner), call_log)
+            assert recorded == []
+            # The step is traced as it was, not as the call ends up
+            call_log.iterations.push(Iteration(call_id="mock call id", index=1))
+
+        assert m.flush(5)
+
+        assert len(recorded) == 1
+        assert recorded[0][0] != main_thread
+        assert recorded[0][1] == 1
+        assert guard_span.children[0].attributes["step.index"] == 0
+        mock_export_spans.assert_called_once_with([guard_span])
+
+    def test__export_spans(self, mocker):
+        mock_client = MagicMock()
+        mocker.patch(
+            "guardrails.integrations.databricks.ml_flow_instrumentor.mlflow.MlflowClient",
+            return_value=mock_client,
+        )
+        mock_client.start_trace.return_value = MagicMock(
+            request_id="mock trace", span_id="guard span"
+        )
+        mock_client.start_span.return_value = MagicMock(span_id="step span")
+
+        from mlflow.entities.span_status import SpanStatusCode
+        from guardrails.integrations.databricks import MlFlowInstrumentor
+        from guardrails.integrations.databricks.span_buffer import BufferedSpan
+
+        m = MlFlowInstrumentor("mock experiment", buffered=True)
+        m.experiment_id = "mock experiment id"
+
+        guard_span = BufferedSpan("guardrails/guard", "guard", {"type": "guard"})
+        step_span = BufferedSpan("guardrails/guard/step", "step", parent=guard_span)
+        guard_span.children.append(step_span)
+        step_span.set_status(status=SpanStatusCode.ERROR)
+        step_span.end()
+        guard_span.end()
+
+        m._export_spans([guard_span])
+
+        mock_client.start_trace.assert_called_once_with(
+            name="guardrails/guard",
+            span_type="guard",
+            attributes={"type": "guard"},
+            experiment_id="mock experiment id",
+            start_time_ns=guard_span.start_time_ns,
+        )
+        mock_client.start_span.assert_called_once_with(
+            "guardrails/guard/step",
+            "mock trace",
+            "guard span",
+            span_type="step",
+            attributes={},
+            start_time_ns=step_span.start_time_ns,
+        )
+        mock_client.end_span.assert_called_once_with(
+            "mock trace",
+            "step span",
+            status="ERROR",
+            end_time_ns=step_span.end_time_ns,
+        )
+        mock_client.end_trace.assert_called_once_with(
+            "mock trace",
+            status="OK",
+            end_time_ns=guard_span.end_time_ns,
+        )
@@ -0,0 +1,146 @@
+from typing import List
+import threading
+import pytest
+
+try:
+    import mlflow
+except ImportError:
+    mlflow = None
+
+
+@pytest.mark.skipif(
+    mlflow is None,
+    reason="mlflow not installed.",
+)
+class TestSpanBuffer:
+    def test_start_span_nests_spans(self):
+        from guardrails.integrations.databricks.span_buffer import SpanBuffer
+
+        exported = []
+        span_buffer = SpanBuffer(exported.extend, flush_interval=0.01)
+
+        with span_buffer.start_span("guard", "guard", {"type": "guard"}) as guard:
+            assert span_buffer.get_current_span() is guard
+            with span_buffer.start_span("step", "step") as step:
+                step.set_attribute("step.index", 0)
+            assert span_buffer.get_current_span() is guard
+
+        assert span_buffer.get_current_span() is None
+        assert span_buffer.flush(5)
+
+        assert exported == [guard]
+        assert guard.children == [step]
+        assert guard.attributes == {"type": "guard"}
+        assert step.attributes == {"step.index": 0}
+        assert guard.end_time_ns >= step.end_time_ns >= step.start_time_ns
+
+    def test_start_span_exports_in_batches(self):
+        from guardrails.integrations.databricks.span_buffer import SpanBuffer
+
+        batches: List[list] = []
+        span_buffer = SpanBuffer(batches.append, batch_size=2, flush_interval=0.2)
+
+        for i in range(5):
+            with span_buffer.start_span(f"guard-{i}"):
+                pass
+
+        assert span_buffer.flush(5)
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [span.name for batch in batches for span in batch] == [
+            f"guard-{i}" for i in range(5)
+        ]
+
+    def test_start_span_samples_traces(self):
+        from guardrails.integrations.databricks.span_buffer import (
+            SpanBuffer,
+            UnsampledSpan,
+        )
+
+        exported = []
+        span_buffer = SpanBuffer(exported.extend, sample_rate=0)
+
+        with span_buffer.start_span("guard") as guard:
+            with span_buffer.start_span("step") as step:
+                step.set_attribute("step.index", 0)
+
+        assert span_buffer.flush(5)
+        assert exported == []
+        assert isinstance(guard, UnsampledSpan)
+        assert isinstance(step, UnsampledSpan)
+        assert step.attributes == {}
+
+    def test_set_attribute_respects_budget(self):
+        from guardrails.integrations.databricks.span_buffer import (
+            BufferedSpan,
+            TRUNCATED_SUFFIX,
+        )
+
+        span = BufferedSpan("guard", attribute_budget=10)
+        span.set_attribute("a", "123456")
+        span.set_attribute("b", "123456")
+        span.set_attribute("c", 123)
+
+        assert span.attributes == {
+            "a": "123456",
+            "b": "1234" + TRUNCATED_SUFFIX,
+            "c": TRUNCATED_SUFFIX,
+        }
+
+        # Overwriting an attribute releases its previous share of the budget
+        span.set_attribute("a", "1")
+        span.set_attribute("b", "12345")
+        assert span.attributes["b"] == "12345"
+
+    def test_attribute_sizes_are_estimated_without_str(self):
+        from guardrails.integrations.databricks.span_buffer import (
+            BufferedSpan,
+            estimate_size,
+        )
+
+        class Unserializable:
+            def __str__(self):
+                raise AssertionError("attribute was serialized")
+
+        assert estimate_size("abc") == 3
+        assert estimate_size(123) == 3
+        assert estimate_size(["ab", "c"]) == 9
+
+        span = BufferedSpan("guard", attribute_budget=100)
+        span.set_attribute("a", Unserializable())
+        assert "a" in span.attributes
+
+    def test_deferred_attributes_are_set_in_the_export_worker(self):
+        from guardrails.integrations.databricks.span_buffer import SpanBuffer
+        from guardrails.stores.context import get_guard_name, set_guard_name
+
+        threads = []
+
+        def add_attributes(span, value):
+            threads.append(threading.get_ident())
+            span.set_attribute("guard.name", get_guard_name())
+            span.set_attribute("value", value)
+
+        span_buffer = SpanBuffer(lambda spans: None, flush_interval=0.01)
+        set_guard_name("my-guard")
+        with span_buffer.start_span("guard") as guard:
+            with span_buffer.start_span("step") as step:
+                step.defer(add_attributes, 1)
+            assert threads == []
+        set_guard_name("")
+
+        assert span_buffer.flush(5)
+        assert threads and threads[0] != threading.get_ident()
+        assert step.attributes == {"guard.name": "my-guard", "value": 1}
+        assert guard.attributes == {}
+
+    def test_enqueue_drops_traces_when_full(self, mocker):
+        from guardrails.integrations.databricks.span_buffer import SpanBuffer
+
+        span_buffer = SpanBuffer(lambda spans: None, max_queue_size=1)
+        mocker.patch.object(span_buffer, "_ensure_worker")
+
+        for i in range(3):
+            with span_buffer.start_span(f"guard-{i}"):
+                pass
+
+        assert span_buffer.dropped == 2
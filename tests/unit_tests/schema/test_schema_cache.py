@@ -0,0 +1,85 @@
+from pydantic import BaseModel, Field
+
+from guardrails import Guard
+from guardrails.classes.schema.processed_schema import ProcessedSchema
+from guardrails.schema.rail_schema import rail_string_to_schema
+from guardrails.schema.schema_cache import SchemaCache, schema_cache
+from tests.integration_tests.test_assets.validators import LowerCase
+
+
+RAIL = """
+<rail version="0.1">
+<output type="string" validators="length: 1 10" on-fail-length="fix" />
+</rail>
+"""
+
+
+class Pet(BaseModel):
+    name: str = Field(validators=[LowerCase(on_fail="fix")])
+
+
+def test_rail_string_schema_is_compiled_once(mocker):
+    schema_cache.clear()
+    compile = mocker.patch(
+        "guardrails.guard.rail_string_to_schema", wraps=rail_string_to_schema
+    )
+
+    first = Guard.for_rail_string(RAIL)
+    second = Guard.for_rail_string(RAIL)
+
+    assert compile.call_count == 1
+    assert first.parse("hello world!").validated_output == "hello worl"
+    assert second.parse("hello world!").validated_output == "hello worl"
+
+
+def test_guards_get_their_own_validators():
+    schema_cache.clear()
+
+    first = Guard.for_rail_string(RAIL)
+    second = Guard.for_rail_string(RAIL)
+
+    first_validator = first._validator_map["$"][0]
+    second_validator = second._validator_map["$"][0]
+    assert first_validator is not second_validator
+    assert first_validator._kwargs == second_validator._kwargs
+    assert first_validator._kwargs is not second_validator._kwargs
+    assert first_validator.accumulated_chunks is not second_validator.accumulated_chunks
+    assert len(schema_cache) == 1
+
+
+def test_guards_share_user_validators():
+    schema_cache.clear()
+
+    first = Guard.for_pydantic(Pet)
+    second = Guard.for_pydantic(Pet)
+
+    validator = Pet.model_fields["name"].json_schema_extra["validators"][0]
+    assert first._validator_map["$.name"][0] is validator
+    assert second._validator_map["$.name"][0] is validator
+    assert first._validator_map["$.name"] is not second._validator_map["$.name"]
+    assert first.output_schema.to_dict() == second.output_schema.to_dict()
+    assert len(schema_cache) == 1
+
+
+def test_rail_files_are_recompiled_when_edited(tmp_path):
+    schema_cache.clear()
+    rail_file = tmp_path / "guard.rail"
+    rail_file.write_text(RAIL)
+    Guard.for_rail(str(rail_file))
+
+    rail_file.write_text(RAIL.replace("1 10", "1 5 "))
+    guard = Guard.for_rail(str(rail_file))
+
+    assert guard.parse("hello world").validated_output == "hello"
+    assert len(schema_cache) == 2
+
+
+def test_least_recently_used_schemas_are_evicted():
+    cache = SchemaCache(max_size=2)
+    cache.get_or_compile("a", ProcessedSchema)
+    cache.get_or_compile("b", ProcessedSchema)
+    cache.get_or_compile("a", ProcessedSchema)
+
+    cache.get_or_compile("c", ProcessedSchema)
+
+    assert list(cache._schemas) == ["a", "c"]
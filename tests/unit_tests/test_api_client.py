@@ -0,0 +1,242 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from guardrails_api_client.api_response import ApiResponse
+from guardrails_api_client.exceptions import ApiException
+from guardrails_api_client.models import Guard as IGuard, ValidatePayload
+
+from guardrails import Guard
+from guardrails.api_client import (
+    AsyncGuardrailsApiClient,
+    GuardrailsApiClient,
+    guard_definition_cache,
+    parse_stream_line,
+)
+from guardrails.errors import ValidationError
+from guardrails.settings import settings
+
+
+def outcome(call_id: str = "1", output: str = "hello") -> dict:
+    return {
+        "callId": call_id,
+        "rawLlmOutput": output,
+        "validatedOutput": output,
+        "validationPassed": True,
+    }
+
+
+def mock_client(handler) -> AsyncGuardrailsApiClient:
+    api_client = AsyncGuardrailsApiClient(
+        base_url="http://guardrails.test", api_key="secret"
+    )
+    api_client._clients[asyncio.get_running_loop()] = httpx.AsyncClient(
+        base_url=api_client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return api_client
+
+
+class TestParseStreamLine:
+    def test_parses_json_and_sse_lines(self):
+        line = json.dumps(outcome())
+
+        assert parse_stream_line(line).call_id == "1"
+        assert parse_stream_line(f"data: {line}".encode()).call_id == "1"
+
+    @pytest.mark.parametrize("line", ["", b"", ": keep-alive", "event: message"])
+    def test_skips_lines_without_outcomes(self, line):
+        assert parse_stream_line(line) is None
+
+    def test_raises_streamed_errors(self):
+        with pytest.raises(Exception, match="boom"):
+            parse_stream_line(json.dumps({"error": {"message": "boom"}}))
+
+
+class TestAsyncGuardrailsApiClient:
+    @pytest.mark.asyncio
+    async def test_validate(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=outcome())
+
+        api_client = mock_client(handler)
+        result = await api_client.validate(
+            IGuard(id="guard-id", name="my-guard"),
+            ValidatePayload.from_dict({"llmOutput": "hello"}),
+            openai_api_key="sk-test",
+        )
+
+        assert result.call_id == "1"
+        assert requests[0].url.path == "/guards/my-guard/validate"
+        assert requests[0].headers["authorization"] == "secret"
+        assert requests[0].headers["x-openai-api-key"] == "sk-test"
+        assert json.loads(requests[0].content) == {"llmOutput": "hello"}
+
+    @pytest.mark.asyncio
+    async def test_validate_bad_request(self):
+        api_client = mock_client(lambda request: httpx.Response(400, text="bad"))
+
+        with pytest.raises(ValidationError, match="bad"):
+            await api_client.validate(
+                IGuard(id="guard-id", name="my-guard"), ValidatePayload.from_dict({})
+            )
+
+    @pytest.mark.asyncio
+    async def test_stream_validate(self):
+        body = "\n".join(
+            [
+                f"data: {json.dumps(outcome('1', 'hel'))}",
+                "",
+                f"data: {json.dumps(outcome('1', 'hello'))}",
+            ]
+        )
+        api_client = mock_client(lambda request: httpx.Response(200, text=body))
+
+        results = [
+            result.raw_llm_output
+            async for result in api_client.stream_validate(
+                IGuard(id="guard-id", name="my-guard"), ValidatePayload.from_dict({})
+            )
+        ]
+
+        assert results == ["hel", "hello"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_overlap(self):
+        active = 0
+        max_active = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            return httpx.Response(200, json=outcome())
+
+        api_client = mock_client(handler)
+        await asyncio.gather(
+            *(
+                api_client.validate(
+                    IGuard(id="guard-id", name="my-guard"),
+                    ValidatePayload.from_dict({}),
+                )
+                for _ in range(5)
+            )
+        )
+
+        assert max_active == 5
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_within_a_loop(self):
+        api_client = AsyncGuardrailsApiClient(base_url="http://guardrails.test")
+
+        client = api_client._get_client()
+
+        assert api_client._get_client() is client
+        await api_client.aclose()
+        assert api_client._get_client() is not client
+
+    def test_clients_are_kept_per_loop(self):
+        api_client = AsyncGuardrailsApiClient(base_url="http://guardrails.test")
+
+        async def get_client():
+            return api_client._get_client()
+
+        first_loop = asyncio.new_event_loop()
+        second_loop = asyncio.new_event_loop()
+        try:
+            first = first_loop.run_until_complete(get_client())
+            second = second_loop.run_until_complete(get_client())
+
+            # The first loop's client isn't replaced, so it can still be closed
+            assert first is not second
+            assert first_loop.run_until_complete(get_client()) is first
+            first_loop.run_until_complete(api_client.aclose())
+            assert first.is_closed
+            assert not second.is_closed
+        finally:
+            second_loop.run_until_complete(api_client.aclose())
+            first_loop.close()
+            second_loop.close()
+
+
+class TestGuardDefinitionCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self, monkeypatch):
+        monkeypatch.setattr(guard_definition_cache, "ttl", 60)
+        guard_definition_cache.invalidate()
+        yield
+        guard_definition_cache.invalidate()
+
+    def api_client(self, mocker, etag=None):
+        api_client = GuardrailsApiClient(base_url="http://guardrails.test")
+        get_guard = mocker.patch.object(
+            api_client._guard_api,
+            "get_guard_with_http_info",
+            return_value=ApiResponse(
+                status_code=200,
+                data=IGuard(id="guard-id", name="my-guard"),
+                headers={"ETag": etag} if etag else {},
+                raw_data=b"",
+            ),
+        )
+        return api_client, get_guard
+
+    def test_fetches_are_cached(self, mocker):
+        api_client, get_guard = self.api_client(mocker)
+
+        first = api_client.fetch_guard("my-guard")
+        second = GuardrailsApiClient(base_url="http://guardrails.test").fetch_guard(
+            "my-guard"
+        )
+
+        assert first is second
+        get_guard.assert_called_once_with(guard_name="my-guard", _headers=None)
+
+    def test_stale_definitions_are_revalidated(self, mocker, monkeypatch):
+        api_client, get_guard = self.api_client(mocker, etag='"v1"')
+        first = api_client.fetch_guard("my-guard")
+        monkeypatch.setattr(guard_definition_cache, "ttl", 0.01)
+        time.sleep(0.02)
+        get_guard.side_effect = ApiException(status=304)
+
+        second = api_client.fetch_guard("my-guard")
+
+        assert first is second
+        get_guard.assert_called_with(
+            guard_name="my-guard", _headers={"If-None-Match": '"v1"'}
+        )
+
+    def test_upsert_invalidates(self, mocker):
+        api_client, get_guard = self.api_client(mocker)
+        mocker.patch.object(api_client._guard_api, "update_guard")
+        guard = api_client.fetch_guard("my-guard")
+
+        api_client.upsert_guard(guard)
+        api_client.fetch_guard("my-guard")
+
+        assert get_guard.call_count == 2
+
+    @pytest.mark.parametrize("ttl", [60, 0])
+    def test_fetch_guard_fetches_once(self, mocker, monkeypatch, ttl):
+        monkeypatch.setattr(settings, "use_server", None)
+        monkeypatch.setattr(guard_definition_cache, "ttl", ttl)
+        get_guard = mocker.patch(
+            "guardrails_api_client.api.guard_api.GuardApi.get_guard_with_http_info",
+            return_value=ApiResponse(
+                status_code=200,
+                data=IGuard(id="guard-id", name="my-guard"),
+                headers={},
+                raw_data=b"",
+            ),
+        )
+
+        guard = Guard.fetch_guard("my-guard", base_url="http://guardrails.test")
+
+        assert guard.id == "guard-id"
+        get_guard.assert_called_once()
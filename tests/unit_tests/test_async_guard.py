@@ -1,8 +1,14 @@
+import asyncio
+
+import httpx
 import pytest
+from guardrails_api_client.models import ValidationOutcome as IValidationOutcome
 from pydantic import BaseModel
 
-from guardrails import AsyncGuard, Validator, register_validator
+from guardrails import AsyncGuard, Guard, Validator, register_validator
+from guardrails.api_client import AsyncGuardrailsApiClient, GuardrailsApiClient
 from guardrails.classes.validation.validation_result import PassResult
+from guardrails.settings import settings
 from guardrails.utils import args, kwargs, on_fail
 from guardrails.utils.validator_utils import verify_metadata_requirements
 from guardrails.types import OnFailAction
@@ -573,3 +579,101 @@ def test_use_and_use_many():
                 on="response",  # invalid "on" parameter
             )
         )
+
+
+@pytest.mark.asyncio
+async def test_server_calls_use_async_api_client(mocker, monkeypatch):
+    monkeypatch.setenv("GUARD_HISTORY_ENABLED", "false")
+    guard = AsyncGuard(name="my-guard")
+    monkeypatch.setattr(settings, "use_server", True)
+    guard._api_client = mocker.MagicMock()
+    async_api_client = guard._get_async_api_client()
+    validate = mocker.patch.object(
+        async_api_client,
+        "validate",
+        mocker.AsyncMock(
+            return_value=IValidationOutcome.from_dict(
+                {
+                    "callId": "1",
+                    "rawLlmOutput": "hello",
+                    "validatedOutput": "hello",
+                    "validationPassed": True,
+                }
+            )
+        ),
+    )
+
+    outcome = await guard.validate("hello")
+
+    assert outcome.validated_output == "hello"
+    assert outcome.validation_passed is True
+    validate.assert_awaited_once()
+    guard._api_client.validate.assert_not_called()
+
+
+def test_async_api_client_is_created_once():
+    guard = AsyncGuard()
+    assert guard._async_api_client is None
+
+    async_api_client = guard._get_async_api_client()
+
+    assert guard._get_async_api_client() is async_api_client
+    # AsyncGuards built from the same Guard share a client
+    guard = Guard()
+    async_api_client = AsyncGuard._from_guard(guard)._get_async_api_client()
+    assert AsyncGuard._from_guard(guard)._async_api_client is async_api_client
+    assert AsyncGuard._from_guard(Guard())._async_api_client is None
+
+
+def test_from_guard_shares_state_by_reference():
+    guard = Guard()
+    async_guard = AsyncGuard._from_guard(guard)
+
+    guard.configure(num_reasks=5)
+    guard.use(LowerCase())
+
+    assert async_guard._num_reasks == 5
+    assert async_guard._validators is guard._validators
+
+
+@pytest.mark.asyncio
+async def test_server_history_loads_with_async_api_client(monkeypatch):
+    monkeypatch.setenv("GUARD_HISTORY_ENABLED", "true")
+    guard = AsyncGuard(name="my-guard")
+    monkeypatch.setattr(settings, "use_server", True)
+    requests = []
+
+    # A stub of the server's validate and history endpoints
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.endswith("/validate"):
+            return httpx.Response(
+                200,
+                json={
+                    "callId": "1",
+                    "rawLlmOutput": "hello",
+                    "validatedOutput": "hello",
+                    "validationPassed": True,
+                },
+            )
+        return httpx.Response(200, json=[{"id": "1", "iterations": []}])
+
+    # Nothing listens here, so a fetch with the blocking client would fail
+    guard._api_client = GuardrailsApiClient(base_url="http://guardrails.test")
+    guard._async_api_client = AsyncGuardrailsApiClient(
+        base_url="http://guardrails.test"
+    )
+    guard._async_api_client._clients[asyncio.get_running_loop()] = httpx.AsyncClient(
+        base_url="http://guardrails.test", transport=httpx.MockTransport(handler)
+    )
+
+    await guard.validate("hello")
+
+    assert requests == ["/guards/my-guard/validate"]
+    assert guard.history.pending == 1
+
+    await guard.history.aload()
+
+    assert requests[-1] == "/guards/my-guard/history/1"
+    assert guard.history.pending == 0
+    assert guard.history.last.id == "1"
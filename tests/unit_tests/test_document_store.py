@@ -0,0 +1,42 @@
+import pytest
+
+from guardrails.document_store import EphemeralDocumentStore
+from guardrails.embedding import FakeEmbedding
+from guardrails.vectordb import Faiss
+
+
+@pytest.fixture
+def store():
+    db = Faiss.new_flat_l2_index(64, FakeEmbedding())
+    return EphemeralDocumentStore(db)
+
+
+def test_add_texts_inserts_in_one_batch(store, mocker):
+    add_docs = mocker.spy(store._storage, "add_docs")
+    add_texts = mocker.spy(store._vector_db, "add_texts")
+
+    doc_ids = store.add_texts({"foo": {"ctx": "bar"}, "pipe": {"ctx": "baz"}})
+    store.add_texts({"foo": {"ctx": "bar"}})
+
+    assert len(doc_ids) == 2
+    add_docs.assert_called_once()
+    add_texts.assert_called_once_with(["foo", "pipe"])
+    assert store._vector_db.last_index() == 2
+
+
+def test_search_returns_pages_with_metadata(store):
+    store.add_texts({"foo": {"ctx": "bar"}, "pipe": {"ctx": ["baz", 1]}})
+
+    pages = store.search("pipe", 1)
+
+    assert len(pages) == 1
+    assert pages[0].text == "pipe"
+    assert pages[0].metadata == {"ctx": ["baz", 1]}
+
+
+def test_get_pages_for_indexes_preserves_order(store):
+    store.add_texts({text: {"ctx": text} for text in ["a", "b", "c"]})
+
+    pages = store._storage.get_pages_for_for_indexes([2, 5, 0])
+
+    assert [page.text for page in pages] == ["c", "a"]
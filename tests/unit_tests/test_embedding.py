@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from guardrails.embedding import EmbeddingCache, FakeEmbedding, OpenAIEmbedding
+
+
+def test_fake_embedding_is_deterministic():
+    embedding = FakeEmbedding(dim=8)
+    first, second, other = embedding.embed(["foo", "foo", "bar"])
+
+    assert len(first) == embedding.output_dim == 8
+    assert first == second
+    assert first != other
+    assert np.linalg.norm(first) == pytest.approx(1.0)
+    assert FakeEmbedding(dim=8).embed_query("foo") == pytest.approx(first)
+
+
+@pytest.mark.parametrize(
+    "batch_max_tokens,batch_max_size,expected_batch_sizes",
+    [
+        (None, 2048, [4]),
+        (None, 3, [3, 1]),
+        # Each text is estimated at 2 tokens.
+        (4, 2048, [2, 2]),
+        (5, 2048, [2, 2]),
+    ],
+)
+def test_embed_packs_texts_into_batches(
+    mocker, batch_max_tokens, batch_max_size, expected_batch_sizes
+):
+    embedding = FakeEmbedding(
+        batch_max_tokens=batch_max_tokens, batch_max_size=batch_max_size
+    )
+    get_embedding = mocker.spy(embedding, "_get_embedding")
+
+    embeddings = embedding.embed(["text 1", "text 2", "text 3", "text 4"])
+
+    assert len(embeddings) == 4
+    batch_sizes = [len(call.args[0]) for call in get_embedding.call_args_list]
+    assert batch_sizes == expected_batch_sizes
+
+
+def test_embed_deduplicates_texts(mocker):
+    embedding = FakeEmbedding()
+    get_embedding = mocker.spy(embedding, "_get_embedding")
+
+    embedding.embed(["foo", "bar", "foo"])
+
+    get_embedding.assert_called_once_with(["foo", "bar"])
+
+
+def test_embed_skips_cached_texts(mocker):
+    embedding = FakeEmbedding(cache=EmbeddingCache())
+    expected = embedding.embed(["foo", "bar"])
+    get_embedding = mocker.spy(embedding, "_get_embedding")
+
+    embeddings = embedding.embed(["foo", "bar", "baz"])
+
+    get_embedding.assert_called_once_with(["baz"])
+    assert embeddings[:2] == expected
+
+
+def test_embedding_cache_persists_embeddings(tmp_path, mocker):
+    path = tmp_path / "embeddings.db"
+    expected = FakeEmbedding(cache=EmbeddingCache(path)).embed(["foo", "bar"])
+
+    embedding = FakeEmbedding(cache=EmbeddingCache(path))
+    get_embedding = mocker.spy(embedding, "_get_embedding")
+
+    assert embedding.embed(["foo", "bar"]) == expected
+    get_embedding.assert_not_called()
+
+
+def test_embedding_cache_evicts_least_recently_used():
+    cache = EmbeddingCache(max_size=2)
+    cache.set_many({"a": [1.0], "b": [2.0]})
+    cache.get_many(["a"])
+
+    cache.set_many({"c": [3.0]})
+
+    assert len(cache) == 2
+    assert cache.get_many(["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+
+
+def test_openai_embedding_reuses_client(mocker):
+    mock_client_class = mocker.patch("guardrails.embedding.OpenAIClient")
+    mock_client_class.return_value.create_embedding.side_effect = lambda model, input: [
+        [1.0, 0.0] for _ in input
+    ]
+
+    embedding = OpenAIEmbedding(api_key="test_api_key")
+    embedding.embed_query("foo")
+    embedding.embed_query("bar")
+
+    mock_client_class.assert_called_once_with(api_key="test_api_key", api_base=None)
+    assert mock_client_class.return_value.create_embedding.call_count == 2
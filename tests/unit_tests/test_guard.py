@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 import pytest
 
 import openai  # noqa: F401
@@ -5,6 +8,8 @@ from pydantic import BaseModel
 
 from guardrails import Guard, Validator, register_validator
 from guardrails.classes.validation.validation_result import PassResult
+from guardrails.classes.validation.validator_reference import ValidatorReference
+from guardrails.errors import ValidationError
 from guardrails.utils.validator_utils import verify_metadata_requirements
 from guardrails.utils import args, kwargs, on_fail
 from guardrails.types import OnFailAction
@@ -616,3 +621,96 @@ def test_use_and_use_many():
 
 #     assert response.validation_passed is True
 #     assert response.validated_output == "oh canada"
+
+
+@register_validator("test-sleepy-validator", data_type="string")
+class SleepyValidator(Validator):
+    async def async_validate(self, value, metadata):
+        await asyncio.sleep(5)
+        return PassResult()
+
+
+def test_validation_timeout():
+    guard = Guard().use(SleepyValidator(on_fail="exception", on_timeout="noop"))
+    guard.configure(validation_timeout=0.05)
+
+    start = time.monotonic()
+    response = guard.validate("some text")
+
+    assert time.monotonic() - start < 2
+    assert response.validated_output == "some text"
+    assert response.validation_passed is False
+    validator_logs = guard.history.last.iterations.last.validator_logs
+    assert validator_logs[0].validation_result.outcome == "fail"
+
+
+@register_validator("test-sleepy-sync-validator", data_type="string")
+class SleepySyncValidator(Validator):
+    def validate(self, value, metadata):
+        time.sleep(1)
+        return PassResult()
+
+
+def test_validation_timeout_with_inline_executor():
+    guard = Guard().use(
+        SleepySyncValidator(executor="inline", on_fail="exception", on_timeout="noop")
+    )
+    guard.configure(validation_timeout=0.05)
+
+    start = time.monotonic()
+    with pytest.warns(RuntimeWarning, match="can't be timed out inline"):
+        response = guard.validate("some text")
+
+    assert time.monotonic() - start < 0.5
+    assert response.validation_passed is False
+
+
+class TestReconcileValidators:
+    def test_reconciles_only_when_validators_change(self, mocker):
+        guard = Guard().use(TwoWords)
+        fill_validator_map = mocker.spy(guard, "_fill_validator_map")
+
+        guard.validate("Oh Canada")
+        guard.validate("Oh Canada")
+        assert fill_validator_map.call_count == 1
+
+        guard.use(OneLine)
+        guard.validate("Oh Canada")
+        assert fill_validator_map.call_count == 2
+        assert len(guard._validators) == 2
+
+    def test_reassigned_references_are_instantiated(self):
+        guard = Guard().use(TwoWords)
+        guard.validate("Oh Canada")
+
+        guard.validators = [
+            *guard.validators,
+            ValidatorReference(
+                id=LowerCase.rail_alias, on="$", on_fail=OnFailAction.EXCEPTION
+            ),
+        ]
+
+        with pytest.raises(ValidationError):
+            guard.validate("Oh Canada")
+        assert [v.rail_alias for v in guard._validators] == [
+            TwoWords.rail_alias,
+            LowerCase.rail_alias,
+        ]
+
+    @pytest.mark.parametrize("edit", ["setitem", "pop_append"])
+    def test_references_edited_in_place_are_instantiated(self, edit):
+        guard = Guard().use(TwoWords).use(OneLine)
+        guard.validate("Oh Canada")
+
+        lower_case = ValidatorReference(
+            id=LowerCase.rail_alias, on="$", on_fail=OnFailAction.EXCEPTION
+        )
+        if edit == "setitem":
+            guard.validators[1] = lower_case
+        else:
+            guard.validators.pop()
+            guard.validators.append(lower_case)
+
+        with pytest.raises(ValidationError):
+            guard.validate("Oh Canada")
+        assert LowerCase.rail_alias in [v.rail_alias for v in guard._validators]
@@ -0,0 +1,223 @@
+import json
+import time
+
+import pytest
+
+from guardrails.classes.history import Iteration, Outputs
+from guardrails.classes.llm.llm_response import LLMResponse
+from guardrails.llm_cache import InMemoryLLMCache, LLMCache, SQLiteLLMCache
+from guardrails.llm_cache.llm_cache_base import _canonical
+from guardrails.llm_providers import (
+    ArbitraryCallable,
+    AsyncArbitraryCallable,
+    get_async_llm_ask,
+    get_llm_ask,
+)
+from guardrails.settings import settings
+
+
+# Module level, since what a function closes over is part of its cache key
+recorded_messages = []
+
+
+@pytest.fixture
+def llm_cache():
+    recorded_messages.clear()
+    llm_cache = InMemoryLLMCache()
+    settings.llm_cache = llm_cache
+    yield llm_cache
+    settings.llm_cache = None
+
+
+def test_make_key_is_order_independent():
+    key = LLMCache.make_key("fn", [], {"model": "gpt-4o", "temperature": 0})
+    assert key == LLMCache.make_key("fn", [], {"temperature": 0, "model": "gpt-4o"})
+    assert key != LLMCache.make_key("other_fn", [], {"model": "gpt-4o"})
+    assert key != LLMCache.make_key("fn", [], {"model": "gpt-4o", "temperature": 1})
+
+
+@pytest.mark.parametrize(
+    "kwargs,force,expected",
+    [
+        ({}, False, False),
+        ({}, True, True),
+        ({"temperature": 0}, False, True),
+        ({"temperature": 0.7}, False, False),
+        ({"temperature": 0.7}, True, True),
+        ({"stream": True}, True, False),
+    ],
+)
+def test_is_cacheable(kwargs, force, expected):
+    assert InMemoryLLMCache(force=force).is_cacheable(kwargs) is expected
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    llm_cache = InMemoryLLMCache(max_size=2)
+    llm_cache.set("a", LLMResponse(output="a"))
+    llm_cache.set("b", LLMResponse(output="b"))
+    llm_cache.get("a")
+    llm_cache.set("c", LLMResponse(output="c"))
+
+    assert llm_cache.get("b") is None
+    assert llm_cache.get("a").output == "a"
+    assert llm_cache.get("c").output == "c"
+
+
+@pytest.mark.parametrize("cache_class", [InMemoryLLMCache, SQLiteLLMCache])
+def test_cache_expires_responses(cache_class, tmp_path):
+    kwargs = {"path": tmp_path / "cache.db"} if cache_class is SQLiteLLMCache else {}
+    llm_cache = cache_class(ttl=0.05, **kwargs)
+    llm_cache.set("key", LLMResponse(output="output"))
+
+    assert llm_cache.get("key").output == "output"
+    time.sleep(0.1)
+    assert llm_cache.get("key") is None
+
+
+def test_sqlite_cache_persists_responses(tmp_path):
+    path = tmp_path / "cache.db"
+    response = LLMResponse(
+        output="output",
+        prompt_token_count=10,
+        response_token_count=5,
+        candidate_outputs=["output", "other output"],
+    )
+    SQLiteLLMCache(path).set("key", response)
+
+    cached_response = SQLiteLLMCache(path).get("key")
+
+    assert cached_response.cache_hit is True
+    assert cached_response.model_copy(update={"cache_hit": False}) == response
+
+
+def test_prompt_callable_serves_cached_responses(llm_cache):
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        recorded_messages.append(messages)
+        return "output"
+
+    messages = [{"role": "user", "content": "Hello"}]
+    first_response = ArbitraryCallable(llm_api, temperature=0)(messages=messages)
+    second_response = ArbitraryCallable(llm_api, temperature=0)(messages=messages)
+
+    assert len(recorded_messages) == 1
+    assert first_response.cache_hit is False
+    assert second_response.cache_hit is True
+    assert second_response.output == "output"
+
+
+def test_prompt_callable_bypasses_cache_for_sampled_requests(llm_cache):
+    calls = []
+
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        calls.append(messages)
+        return "output"
+
+    messages = [{"role": "user", "content": "Hello"}]
+    ArbitraryCallable(llm_api, temperature=0.7)(messages=messages)
+    ArbitraryCallable(llm_api, temperature=0.7)(messages=messages)
+
+    assert len(calls) == 2
+    assert len(llm_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_prompt_callable_serves_cached_responses(llm_cache):
+    async def llm_api(*args, messages=None, **kwargs) -> str:
+        recorded_messages.append(messages)
+        return "output"
+
+    messages = [{"role": "user", "content": "Hello"}]
+    await AsyncArbitraryCallable(llm_api, temperature=0)(messages=messages)
+    response = await AsyncArbitraryCallable(llm_api, temperature=0)(messages=messages)
+
+    assert len(recorded_messages) == 1
+    assert response.cache_hit is True
+
+
+@pytest.mark.asyncio
+async def test_async_prompt_callable_bypasses_cache_without_temperature(llm_cache):
+    calls = []
+
+    async def llm_api(*args, messages=None, **kwargs) -> str:
+        calls.append(messages)
+        return "output"
+
+    # get_async_llm_ask doesn't pin a temperature, so the provider samples
+    await get_async_llm_ask(llm_api)(messages=[])
+    await get_async_llm_ask(llm_api)(messages=[])
+
+    assert len(calls) == 2
+    assert len(llm_cache) == 0
+
+
+def make_llm_api(output: str):
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        return output
+
+    return llm_api
+
+
+def test_closures_and_lambdas_are_cached_apart(llm_cache):
+    closures = [get_llm_ask(make_llm_api(output)) for output in ("A", "B")]
+    lambdas = [
+        get_llm_ask(lambda *args, messages=None, **kwargs: "X"),
+        get_llm_ask(lambda *args, messages=None, **kwargs: "Y"),
+    ]
+
+    assert [llm_api(messages=[]).output for llm_api in closures] == ["A", "B"]
+    assert [llm_api(messages=[]).output for llm_api in lambdas] == ["X", "Y"]
+    assert get_llm_ask(make_llm_api("A"))(messages=[]).cache_hit is True
+
+
+def test_function_keys_are_stable_across_processes():
+    key = LLMCache.make_key(make_llm_api("A"), [], {"temperature": 0})
+
+    assert key == LLMCache.make_key(make_llm_api("A"), [], {"temperature": 0})
+    assert "0x" not in json.dumps(_canonical(make_llm_api("A")), default=_canonical)
+
+
+def test_unkeyable_requests_are_not_cached(llm_cache):
+    calls = []
+
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        calls.append(messages)
+        return "output"
+
+    client = object()
+    ArbitraryCallable(llm_api, temperature=0, client=client)(messages=[])
+    ArbitraryCallable(llm_api, temperature=0, client=client)(messages=[])
+
+    assert len(calls) == 2
+    assert len(llm_cache) == 0
+
+
+def test_cache_namespace_names_the_callable(llm_cache):
+    client = object()
+
+    def llm_api(*args, messages=None, **kwargs) -> str:
+        return str(id(client))
+
+    first = ArbitraryCallable(llm_api, temperature=0, cache_namespace="my-llm")
+    second = ArbitraryCallable(
+        make_llm_api("other"), temperature=0, cache_namespace="my-llm"
+    )
+
+    assert first(messages=[]).output == str(id(client))
+    assert second(messages=[]).cache_hit is True
+
+
+def test_cache_hits_consume_no_tokens():
+    response = LLMResponse(
+        output="output", prompt_token_count=10, response_token_count=5
+    )
+    iteration = Iteration(
+        call_id="mock-call",
+        index=0,
+        outputs=Outputs(
+            llm_response_info=response.model_copy(update={"cache_hit": True})
+        ),
+    )
+
+    assert iteration.prompt_tokens_consumed == 0
+    assert iteration.completion_tokens_consumed == 0
+    assert iteration.tokens_consumed == 0
@@ -507,6 +507,38 @@ def test_get_async_llm_ask_custom_llm_must_accept_kwargs():
         get_async_llm_ask(my_llm)
 
 
+def test_get_llm_ask_stream_callable():
+    from guardrails.llm_providers import StreamCallable
+
+    stream = iter(["Hello ", "world!"])
+    prompt_callable = StreamCallable(stream)
+
+    assert get_llm_ask(prompt_callable) is prompt_callable
+    assert prompt_callable.requires_messages is False
+
+    response = prompt_callable(stream=True)
+
+    assert response.stream_output is stream
+
+
+@pytest.mark.asyncio
+async def test_get_async_llm_ask_stream_callable():
+    from guardrails.llm_providers import AsyncStreamCallable
+
+    async def stream():
+        yield "Hello world!"
+
+    chunks = stream()
+    prompt_callable = AsyncStreamCallable(chunks)
+
+    assert get_async_llm_ask(prompt_callable) is prompt_callable
+    assert prompt_callable.requires_messages is False
+
+    response = await prompt_callable(stream=True)
+
+    assert response.async_stream_output is chunks
+
+
 def test_chat_prompt():
     # raises when messages are not provided
     with pytest.raises(PromptCallableException):
@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 import json
 import re
+import threading
 from typing import Any, Dict, List
 import pytest
 from pydantic import BaseModel, Field
@@ -769,3 +771,38 @@ async def test_input_validation_fail_async(
     assert str(excinfo.value) == unstructured_messages_error
     assert isinstance(guard.history.last.exception, ValidationError)
     assert guard.history.last.exception == excinfo.value
+
+
+@register_validator("test-thread-recording-validator", data_type="string")
+class ThreadRecordingValidator(Validator):
+    def validate(self, value, metadata):
+        return PassResult(metadata={"thread": threading.current_thread().name})
+
+
+class TestValidatorExecutor:
+    @pytest.mark.asyncio
+    async def test_inline_executor(self):
+        validator = ThreadRecordingValidator(executor="inline")
+
+        result = await validator.async_validate("foo", {})
+
+        assert result.metadata["thread"] == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_validator_executor(self):
+        with ThreadPoolExecutor(thread_name_prefix="validator-pool") as executor:
+            validator = ThreadRecordingValidator(executor=executor)
+
+            result = await validator.async_validate("foo", {})
+
+        assert result.metadata["thread"].startswith("validator-pool")
+
+    def test_guard_executor(self, mocker):
+        spy = mocker.spy(ThreadRecordingValidator, "validate")
+        with ThreadPoolExecutor(thread_name_prefix="guard-pool") as executor:
+            guard = Guard().use(ThreadRecordingValidator())
+            guard.configure(validator_executor=executor)
+
+            guard.validate("foo")
+
+        assert spy.spy_return.metadata["thread"].startswith("guard-pool")
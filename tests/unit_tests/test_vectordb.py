@@ -0,0 +1,54 @@
+import pytest
+
+from guardrails.embedding import FakeEmbedding
+from guardrails.vectordb import Faiss
+
+TEXTS = [f"text {i}" for i in range(200)]
+
+
+@pytest.mark.parametrize(
+    "new_index",
+    [
+        lambda embedder: Faiss.new_flat_l2_index(64, embedder),
+        lambda embedder: Faiss.new_ivf_flat_index(64, embedder, nlist=4, nprobe=4),
+        lambda embedder: Faiss.new_hnsw_index(64, embedder),
+    ],
+)
+def test_index_finds_added_texts(new_index):
+    db = new_index(FakeEmbedding())
+    db.add_texts(TEXTS)
+
+    assert db.last_index() == len(TEXTS)
+    assert db.similarity_search("text 7", 1) == [7]
+
+
+def test_ivf_index_needs_enough_training_vectors():
+    db = Faiss.new_ivf_flat_index(64, FakeEmbedding(), nlist=16)
+
+    with pytest.raises(ValueError, match="at least 16 vectors"):
+        db.add_texts(TEXTS[:8])
+
+
+def test_similarity_search_batch(mocker):
+    embedder = FakeEmbedding()
+    db = Faiss.new_flat_l2_index(64, embedder)
+    db.add_texts(TEXTS)
+    get_embedding = mocker.spy(embedder, "_get_embedding")
+
+    indexes = db.similarity_search_batch(["text 3", "text 42", "text 3"], 2)
+
+    assert [i[0] for i in indexes] == [3, 42, 3]
+    assert all(len(i) == 2 for i in indexes)
+    get_embedding.assert_called_once_with(["text 3", "text 42"])
+
+
+def test_load_memory_mapped_index(tmp_path):
+    path = str(tmp_path / "test.index")
+    db = Faiss.new_ivf_flat_index(64, FakeEmbedding(), path, nlist=4)
+    db.add_texts(TEXTS)
+    db.save()
+
+    loaded = Faiss.load(path, FakeEmbedding(), mmap=True)
+
+    assert loaded.last_index() == len(TEXTS)
+    assert loaded.similarity_search_batch(["text 9"], 1) == [[9]]
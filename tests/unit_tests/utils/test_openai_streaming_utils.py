@@ -0,0 +1,110 @@
+import pytest
+
+from guardrails.utils.openai_utils import streaming_utils
+from guardrails.utils.openai_utils.streaming_utils import (
+    StreamTokenCounter,
+    get_encoding,
+    get_message_token_overheads,
+    num_tokens_from_messages,
+)
+from guardrails.utils.openai_utils.v1 import AsyncOpenAIClientV1
+
+
+class WordEncoding:
+    """Counts whitespace separated words as tokens, so tests don't need to
+    download tiktoken's encodings."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, text):
+        self.encoded.append(text)
+        return text.split()
+
+
+@pytest.fixture
+def encoding(mocker):
+    encoding = WordEncoding()
+    encoding_for_model = mocker.patch.object(
+        streaming_utils.tiktoken, "encoding_for_model", return_value=encoding
+    )
+    get_encoding.cache_clear()
+    yield encoding, encoding_for_model
+    get_encoding.cache_clear()
+
+
+def chunks(*contents, usage=None):
+    async def stream():
+        for content in contents:
+            yield {"choices": [{"delta": {"content": content}}]}
+        if usage:
+            yield {"choices": [], "usage": usage}
+
+    return stream()
+
+
+def test_encodings_are_loaded_once(encoding):
+    _, encoding_for_model = encoding
+
+    get_encoding("gpt-4o")
+    get_encoding("gpt-4o")
+
+    encoding_for_model.assert_called_once_with("gpt-4o")
+
+
+def test_message_overheads_resolve_model_aliases(encoding):
+    assert get_message_token_overheads("gpt-4") == ("gpt-4-0613", 3, 1)
+    assert get_message_token_overheads("gpt-3.5-turbo") == ("gpt-3.5-turbo-0613", 3, 1)
+    assert num_tokens_from_messages(
+        [{"role": "user", "content": "hello there"}], model="gpt-4"
+    ) == (3 + 1 + 2 + 3)
+
+
+def test_stream_token_counter_counts_deltas(encoding):
+    counter = StreamTokenCounter("gpt-4o")
+
+    counter.add("hello ")
+    counter.add("big world")
+    counter.add(None)
+
+    assert counter.response_token_count("hello big world") == 3
+    assert counter.prompt_token_count(lambda: 7) == 7
+
+
+@pytest.mark.asyncio
+async def test_streamed_chat_counts_tokens_incrementally(encoding):
+    word_encoding, _ = encoding
+    client = AsyncOpenAIClientV1(api_key="sk-test")
+
+    response = await client.construct_chat_response(
+        stream=True,
+        openai_response=chunks("hello ", "big ", "world"),
+        prompt=[{"role": "user", "content": "hi"}],
+        model="gpt-4-0613",
+    )
+
+    assert response.output == "hello big world"
+    assert response.response_token_count == 3
+    assert response.prompt_token_count == 3 + 1 + 1 + 3
+    assert "hello big world" not in word_encoding.encoded
+
+
+@pytest.mark.asyncio
+async def test_streamed_chat_uses_reported_usage(encoding):
+    word_encoding, _ = encoding
+    client = AsyncOpenAIClientV1(api_key="sk-test")
+
+    response = await client.construct_chat_response(
+        stream=True,
+        openai_response=chunks(
+            "hello ", "world", usage={"prompt_tokens": 11, "completion_tokens": 2}
+        ),
+        prompt=[{"role": "user", "content": "hi"}],
+        model="gpt-4-0613",
+        usage_requested=True,
+    )
+
+    assert response.output == "hello world"
+    assert response.prompt_token_count == 11
+    assert response.response_token_count == 2
+    assert word_encoding.encoded == []
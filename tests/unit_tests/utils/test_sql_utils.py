@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from guardrails.utils.sql_utils import SqlAlchemyDriver, create_sql_driver
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+
+SCHEMA = """
+CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER REFERENCES users(id));
+INSERT INTO users (name) VALUES ('alice'), ('bob');
+"""
+
+
+@pytest.fixture
+def schema_file(tmp_path):
+    path = tmp_path / "schema.sql"
+    path.write_text(SCHEMA)
+    return str(path)
+
+
+@pytest.mark.parametrize("conn", ["sqlite://", "file"])
+def test_validate_sql(schema_file, tmp_path, conn):
+    if conn == "file":
+        conn = f"sqlite:///{tmp_path / 'db.sqlite'}"
+    driver = create_sql_driver(schema_file=schema_file, conn=conn)
+
+    assert isinstance(driver, SqlAlchemyDriver)
+    assert driver.validate_sql("SELECT name FROM users") == []
+    assert driver.validate_sql("SELECT nope FROM users") == ["no such column: nope"]
+    assert driver.validate_sql("SELECT * FROM missing") == ["no such table: missing"]
+
+
+def test_validate_sql_does_not_run_queries(schema_file):
+    driver = create_sql_driver(schema_file=schema_file, conn="sqlite://")
+
+    assert driver.validate_sql("DELETE FROM users") == []
+
+    with driver._engine.connect() as connection:
+        count = connection.execute(sqlalchemy.text("SELECT count(*) FROM users"))
+        assert count.scalar() == 2
+
+
+def test_concurrent_validation(schema_file, tmp_path):
+    driver = create_sql_driver(
+        schema_file=schema_file, conn=f"sqlite:///{tmp_path / 'db.sqlite'}"
+    )
+    queries = ["SELECT name FROM users", "SELECT nope FROM users"] * 10
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(driver.validate_sql, queries))
+
+    assert results == [[], ["no such column: nope"]] * 10
+
+
+def test_schema_is_cached(schema_file, mocker):
+    driver = create_sql_driver(schema_file=schema_file, conn="sqlite://")
+    inspect = mocker.spy(driver, "_inspect_schema")
+
+    schema = driver.get_schema()
+    driver.get_schema()
+    assert inspect.call_count == 1
+    assert "Table: users" in schema
+    assert "foreign_key: {'table': 'users', 'column': 'id'}" in schema
+
+    driver.invalidate_schema()
+    driver.get_schema()
+    assert inspect.call_count == 2
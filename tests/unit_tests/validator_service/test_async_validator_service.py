@@ -1,13 +1,18 @@
+import asyncio
 from datetime import datetime
+import time
 from unittest.mock import MagicMock, call
 
 from guardrails.actions.filter import Filter
+from guardrails.actions.refrain import Refrain
+from guardrails.errors import ValidationError
+from guardrails.stores.context import set_validation_deadline
 from guardrails.validator_service.validator_service_base import ValidatorRun
 import pytest
 
 from guardrails.classes.history.iteration import Iteration
 from guardrails.classes.validation.validator_logs import ValidatorLogs
-from guardrails.validator_base import OnFailAction, Validator
+from guardrails.validator_base import OnFailAction, Validator, register_validator
 from guardrails.validator_service.async_validator_service import AsyncValidatorService
 from guardrails.classes.validation.validation_result import FailResult, PassResult
 
@@ -17,6 +22,7 @@ avs = AsyncValidatorService()
 
 def test_validate(mocker):
     mock_loop = mocker.MagicMock()
+    mock_loop.is_running.return_value = False
     mock_loop.run_until_complete = mocker.MagicMock(return_value=(True, {}))
     # loop_spy = mocker.spy(mock_loop, "run_until_complete", return_value=(True, {}))
     async_validate_mock = mocker.patch.object(avs, "async_validate")
@@ -650,7 +656,11 @@ class TestRunValidator:
 
         assert mock_perform_correction.call_count == 1
         mock_perform_correction.assert_called_once_with(
-            validation_result, "value", validator, rechecked_value=None
+            validation_result,
+            "value",
+            validator,
+            rechecked_value=None,
+            on_fail_descriptor=validator.on_fail_descriptor,
         )
 
         assert isinstance(result, ValidatorRun)
@@ -740,7 +750,11 @@ class TestRunValidator:
 
         assert mock_perform_correction.call_count == 1
         mock_perform_correction.assert_called_once_with(
-            validation_result, "value", validator, rechecked_value=rechecked_result
+            validation_result,
+            "value",
+            validator,
+            rechecked_value=rechecked_result,
+            on_fail_descriptor=validator.on_fail_descriptor,
         )
 
         assert isinstance(result, ValidatorRun)
@@ -753,6 +767,8 @@ class TestRunValidatorAsync:
     @pytest.mark.asyncio
     async def test_happy_path(self, mocker):
         mock_validator = MagicMock(spec=Validator)
+        mock_validator.validation_timeout = None
+        mock_validator.validation_max_concurrency = None
 
         validation_result = PassResult()
         mock_execute_validator = mocker.patch.object(
@@ -777,6 +793,8 @@ class TestRunValidatorAsync:
     @pytest.mark.asyncio
     async def test_result_is_none(self, mocker):
         mock_validator = MagicMock(spec=Validator)
+        mock_validator.validation_timeout = None
+        mock_validator.validation_max_concurrency = None
 
         validation_result = None
         mock_execute_validator = mocker.patch.object(
@@ -797,3 +815,87 @@ class TestRunValidatorAsync:
         mock_execute_validator.assert_called_once_with(
             mock_validator, "value", {}, False, validation_session_id="mock-session"
         )
+
+
+@register_validator("test-slow-validator", data_type="string")
+class SlowValidator(Validator):
+    active = 0
+    max_active = 0
+
+    def __init__(self, delay: float = 0.5, **kwargs):
+        super().__init__(delay=delay, **kwargs)
+        self.delay = delay
+
+    async def async_validate(self, value, metadata):
+        SlowValidator.active += 1
+        SlowValidator.max_active = max(SlowValidator.max_active, SlowValidator.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            SlowValidator.active -= 1
+        return PassResult()
+
+
+class TestValidatorLimits:
+    @pytest.mark.asyncio
+    async def test_timeout_applies_on_timeout_action(self):
+        validator = SlowValidator(
+            validation_timeout=0.01, on_fail="exception", on_timeout="noop"
+        )
+        iteration = Iteration(call_id="mock-call", index=0)
+
+        result = await avs.run_validator(iteration, validator, "value", {}, "$")
+
+        assert result.value == "value"
+        assert result.on_fail_action == OnFailAction.NOOP
+        assert isinstance(result.validator_logs.validation_result, FailResult)
+        assert "timed out" in result.validator_logs.validation_result.error_message
+
+    @pytest.mark.asyncio
+    async def test_on_timeout_defaults_to_on_fail(self):
+        validator = SlowValidator(validation_timeout=0.01, on_fail="exception")
+        iteration = Iteration(call_id="mock-call", index=0)
+
+        with pytest.raises(ValidationError, match="timed out"):
+            await avs.run_validator(iteration, validator, "value", {}, "$")
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_timeout(self):
+        validator = SlowValidator(validation_timeout=10, on_timeout="refrain")
+        iteration = Iteration(call_id="mock-call", index=0)
+        set_validation_deadline(time.monotonic() + 0.01)
+        try:
+            result = await avs.run_validator(iteration, validator, "value", {}, "$")
+        finally:
+            set_validation_deadline(None)
+
+        assert isinstance(result.value, Refrain)
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_is_shared(self):
+        validators = [
+            SlowValidator(delay=0.01, validation_max_concurrency=2) for _ in range(3)
+        ]
+        iteration = Iteration(call_id="mock-call", index=0)
+        SlowValidator.max_active = 0
+
+        await asyncio.gather(
+            *(
+                avs.run_validator(iteration, validator, "value", {}, "$")
+                for validator in validators * 2
+            )
+        )
+
+        assert SlowValidator.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_validator_timeout_argument_is_not_a_limit(self):
+        validator = SlowValidator(delay=0.01, timeout=0.001, on_timeout="noop")
+
+        assert validator.validation_timeout is None
+        assert validator.get_args() == {"delay": 0.01, "timeout": 0.001}
+
+        iteration = Iteration(call_id="mock-call", index=0)
+        result = await avs.run_validator(iteration, validator, "value", {}, "$")
+
+        assert isinstance(result.validator_logs.validation_result, PassResult)
@@ -1,8 +1,14 @@
+import threading
+import time
 from unittest.mock import MagicMock
+
+import pytest
+
 from guardrails.classes.history.iteration import Iteration
 from guardrails.classes.validation.validation_result import FailResult, PassResult
 from guardrails.classes.validation.validator_logs import ValidatorLogs
 from guardrails.types.on_fail import OnFailAction
+from guardrails.stores.context import set_validator_executor
 from guardrails.validator_base import Validator, register_validator
 from guardrails.validator_service.sequential_validator_service import (
     SequentialValidatorService,
@@ -80,3 +86,101 @@ class TestRunValidators:
             mock_validator,
             rechecked_value=rechecked_value,
         )
+
+
+@register_validator(name="guardrails/slow-stream-validator", data_type="string")
+class SlowStreamValidator(Validator):
+    def __init__(self, delay: float = 0.1, fail_on: str = "", **kwargs):
+        super().__init__(delay=delay, fail_on=fail_on, **kwargs)
+        self.delay = delay
+        self.fail_on = fail_on
+        self.threads = set()
+
+    def validate_stream(self, chunk, metadata, **kwargs):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        if self.fail_on and self.fail_on in chunk:
+            return FailResult(
+                error_message=f"found {self.fail_on}",
+                fix_value=chunk.replace(self.fail_on, ""),
+                validated_chunk=chunk,
+            )
+        return PassResult(validated_chunk=chunk)
+
+
+@register_validator(name="guardrails/metadata-stream-validator", data_type="string")
+class MetadataStreamValidator(Validator):
+    def __init__(self, key: str, **kwargs):
+        super().__init__(key=key, **kwargs)
+        self.key = key
+        self.seen = []
+
+    def validate_stream(self, chunk, metadata, **kwargs):
+        self.seen.append(dict(metadata))
+        # Edits in place shouldn't leak to the validators running alongside
+        metadata[self.key] = chunk
+        return PassResult(validated_chunk=chunk, metadata=dict(metadata))
+
+
+class TestRunValidatorsStream:
+    def run_stream(self, validators, chunks):
+        val_svc = SequentialValidatorService(disable_tracer=True)
+        iteration = Iteration(call_id="mock-call", index=0)
+        value_stream = ((chunk, i == len(chunks) - 1) for i, chunk in enumerate(chunks))
+        results = list(
+            val_svc.run_validators_stream(
+                iteration,
+                {"$": validators},
+                value_stream,
+                {},
+                "$",
+                "$",
+            )
+        )
+        return iteration, results
+
+    def test_validators_run_concurrently_per_chunk(self):
+        validators = [SlowStreamValidator(delay=0.1) for _ in range(4)]
+
+        start = time.monotonic()
+        iteration, results = self.run_stream(validators, ["a", "b"])
+        elapsed = time.monotonic() - start
+
+        assert [result.chunk for result in results] == ["a", "b"]
+        assert elapsed < 0.6
+        assert all(threading.get_ident() not in v.threads for v in validators)
+        assert [log.validator_name for log in iteration.outputs.validator_logs] == [
+            "SlowStreamValidator"
+        ] * 8
+
+    def test_fixes_are_merged_in_validator_order(self):
+        validators = [
+            SlowStreamValidator(delay=0.01, fail_on="x", on_fail=OnFailAction.FIX),
+            SlowStreamValidator(delay=0.05, fail_on="y", on_fail=OnFailAction.FIX),
+        ]
+
+        _, results = self.run_stream(validators, ["axy b"])
+
+        assert "".join(result.chunk for result in results) == "a b"
+
+    def test_inline_executor_runs_on_calling_thread(self):
+        validators = [SlowStreamValidator(delay=0) for _ in range(2)]
+        set_validator_executor("inline")
+        try:
+            self.run_stream(validators, ["a"])
+        finally:
+            set_validator_executor(None)
+
+        assert all(v.threads == {threading.get_ident()} for v in validators)
+
+    @pytest.mark.parametrize("on_fail", [OnFailAction.NOOP, OnFailAction.FIX])
+    def test_metadata_is_merged_in_validator_order(self, on_fail):
+        validators = [
+            MetadataStreamValidator(key="first", on_fail=on_fail),
+            MetadataStreamValidator(key="second", on_fail=on_fail),
+        ]
+
+        _, results = self.run_stream(validators, ["a", "b"])
+
+        assert [v.seen for v in validators] == [[{}, {"first": "a", "second": "a"}]] * 2
+        assert results[-1].metadata == {"first": "b", "second": "b"}
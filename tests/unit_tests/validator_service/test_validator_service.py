@@ -1,7 +1,10 @@
+import asyncio
+import threading
 from unittest.mock import AsyncMock
 import pytest
 
 import guardrails.validator_service as vs
+from guardrails.validator_service.background_loop import BackgroundEventLoop
 from guardrails.classes.history.iteration import Iteration
 
 
@@ -32,46 +35,41 @@ class TestShouldRunSync:
 
 
 class TestGetLoop:
-    def test_get_loop_with_running_loop(self, mocker):
-        mocker.patch(
-            "guardrails.validator_service.asyncio.get_running_loop",
-            return_value="running loop",
-        )
-        with pytest.raises(RuntimeError):
-            vs.get_loop()
+    def test_get_loop_runs_on_a_background_thread(self):
+        loop = vs.get_loop()
 
-    def test_get_loop_without_running_loop(self, mocker):
-        mocker.patch(
-            "guardrails.validator_service.asyncio.get_running_loop",
-            side_effect=RuntimeError,
-        )
-        mocker.patch(
-            "guardrails.validator_service.asyncio.get_event_loop",
-            return_value="event loop",
-        )
-        assert vs.get_loop() == "event loop"
+        assert loop.is_running()
+        assert vs.get_loop() is loop
+        assert vs.background_loop._thread is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_get_loop_with_running_loop(self):
+        loop = vs.get_loop()
+
+        assert loop is not asyncio.get_running_loop()
+        assert loop.is_running()
+
+    def test_get_loop_from_its_own_thread(self):
+        async def get_loop():
+            return vs.get_loop()
+
+        future = asyncio.run_coroutine_threadsafe(get_loop(), vs.get_loop())
+
+        with pytest.raises(RuntimeError):
+            future.result()
 
     def test_get_loop_with_uvloop(self, mocker):
-        mocker.patch("guardrails.validator_service.uvloop")
-        mock_event_loop_policy = mocker.patch(
-            "guardrails.validator_service.uvloop.EventLoopPolicy"
-        )
-        mocker.patch(
-            "guardrails.validator_service.asyncio.get_running_loop",
-            side_effect=RuntimeError,
+        mock_uvloop = mocker.patch(
+            "guardrails.validator_service.background_loop.uvloop"
         )
-        mocker.patch(
-            "guardrails.validator_service.asyncio.get_event_loop",
-            return_value="event loop",
-        )
-        mock_set_event_loop_policy = mocker.patch("asyncio.set_event_loop_policy")
+        mock_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+        background_loop = BackgroundEventLoop()
 
-        assert vs.get_loop() == "event loop"
+        loop = background_loop.get_loop()
 
-        mock_event_loop_policy.assert_called_once()
-        mock_set_event_loop_policy.assert_called_once_with(
-            mock_event_loop_policy.return_value
-        )
+        mock_uvloop.new_event_loop.assert_called_once()
+        assert loop.is_running()
+        loop.call_soon_threadsafe(loop.stop)
 
 
 class TestValidate:
@@ -125,6 +123,30 @@ class TestValidate:
             loop="event loop",
         )
 
+    @pytest.mark.asyncio
+    async def test_validate_with_running_loop(self, mocker):
+        mocker.patch("guardrails.validator_service.should_run_sync", return_value=False)
+        mocker.patch("guardrails.validator_service.SequentialValidatorService")
+        mocker.patch("guardrails.validator_service.AsyncValidatorService")
+
+        vs.validate(
+            value=True,
+            metadata={},
+            validator_map={},
+            iteration=iteration,
+        )
+
+        vs.SequentialValidatorService.assert_not_called()
+        vs.AsyncValidatorService.return_value.validate.assert_called_once_with(
+            True,
+            {},
+            {},
+            iteration,
+            "$",
+            "$",
+            loop=vs.get_loop(),
+        )
+
     def test_validate_with_no_available_event_loop(self, mocker):
         mocker.patch("guardrails.validator_service.should_run_sync", return_value=False)
         mocker.patch("guardrails.validator_service.SequentialValidatorService")